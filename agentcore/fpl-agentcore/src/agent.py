@@ -1,43 +1,16 @@
 """FPL Assistant Agent - Your AI-powered Fantasy Premier League advisor."""
 
+import asyncio
 import os
+from contextlib import nullcontext
 from dotenv import load_dotenv
-from strands import Agent
 
 # Load environment variables
 load_dotenv()
 
-# Import all FPL tools
-from tools.player_analysis import (
-    search_player,
-    get_player_details,
-    get_player_fixtures,
-    compare_players,
-    get_top_players
-)
-
-from tools.transfer_tools import (
-    analyze_transfer_options,
-    find_differentials,
-    suggest_transfer_swap,
-    check_price_changes
-)
-
-from tools.team_tools import (
-    get_my_team_summary,
-    get_my_current_team,
-    analyze_team_fixtures,
-    get_transfer_history,
-    get_chips_status,
-    get_transfer_status
-)
-
-from tools.captain_tools import (
-    suggest_captain,
-    compare_captain_options,
-    get_most_captained_players,
-    analyze_captaincy_history
-)
+# Strands, the tool modules and the FPL client (with requests and numpy) are
+# imported on first use, so importing this module is cheap and a server can
+# start listening first
 
 
 # System prompt for the FPL assistant
@@ -50,6 +23,8 @@ SYSTEM_PROMPT = """You are an expert Fantasy Premier League (FPL) assistant. You
 5. Strategy Advice: Offer strategic guidance on wildcards, chips, and long-term planning
 6. Chips & Transfers: Track available chips, free transfers, and transfer costs
 
+For broad questions about the coming gameweek ("what should I do this week?"), call get_gameweek_briefing first: it covers the squad with fixtures, captain picks, free transfers, bank and chips in one call. Use the specific tools only for details it does not cover.
+
 Key Principles:
 - Always consider upcoming fixtures (fixture difficulty rating)
 - Prioritize form over reputation
@@ -80,11 +55,51 @@ Be conversational, insightful, and data-driven. Always explain your reasoning cl
 """
 
 
-def create_fpl_agent():
-    """Create and configure the FPL Assistant agent."""
+def fpl_tools():
+    """
+    Import the FPL tool modules and get their tools, in the order the agent lists them.
+
+    Deferred to the first agent created (or prewarm()), as importing the
+    tools imports Strands.
+    """
+    from tools.player_analysis import (
+        search_player,
+        get_player_details,
+        get_player_fixtures,
+        compare_players,
+        get_top_players
+    )
+
+    from tools.transfer_tools import (
+        analyze_transfer_options,
+        find_differentials,
+        suggest_transfer_swap,
+        check_price_changes,
+        plan_transfers
+    )
+
+    from tools.team_tools import (
+        get_my_team_summary,
+        get_my_current_team,
+        analyze_team_fixtures,
+        get_transfer_history,
+        get_chips_status,
+        get_transfer_status
+    )
+
+    from tools.captain_tools import (
+        suggest_captain,
+        compare_captain_options,
+        get_most_captained_players,
+        analyze_captaincy_history
+    )
+
+    from tools.briefing_tools import get_gameweek_briefing
+
+    return [
+        # Gameweek briefing (squad, fixtures, captaincy, transfers and chips in one call)
+        get_gameweek_briefing,
 
-    # Collect all tools
-    tools = [
         # Player analysis tools
         search_player,
         get_player_details,
@@ -97,6 +112,7 @@ def create_fpl_agent():
         find_differentials,
         suggest_transfer_swap,
         check_price_changes,
+        plan_transfers,
 
         # Team tools
         get_my_team_summary,
@@ -113,8 +129,27 @@ def create_fpl_agent():
         analyze_captaincy_history
     ]
 
+
+def create_fpl_agent(model=None, quiet=False):
+    """
+    Create and configure the FPL Assistant agent.
+
+    Args:
+        model: Model provider or model ID (default: the MODEL environment variable,
+            else auto-detected from the configured API keys)
+        quiet: Don't print the response as it streams (for servers, which
+            stream it to the client with stream_turn instead)
+    """
+
+    # Imported here rather than at module level (see fpl_tools)
+    from strands import Agent
+    from conversation import BoundedConversationManager
+
+    # Collect all tools
+    tools = fpl_tools()
+
     # Determine which LLM provider is configured
-    model = os.getenv('MODEL')  # Optional override
+    model = model or os.getenv('MODEL')  # Optional override
 
     # Strands SDK auto-detects provider from environment variables:
     # - ANTHROPIC_API_KEY → Uses Anthropic Claude
@@ -125,19 +160,242 @@ def create_fpl_agent():
 
     agent_kwargs = {
         'tools': tools,
-        'system_prompt': SYSTEM_PROMPT
+        'system_prompt': SYSTEM_PROMPT,
+        # Recent turns verbatim, older ones without their tool output, all
+        # within a token ceiling, so long sessions don't slow every turn
+        'conversation_manager': BoundedConversationManager(
+            recent_turns=int(os.getenv('FPL_CONTEXT_TURNS', '4')),
+            max_tokens=int(os.getenv('FPL_CONTEXT_MAX_TOKENS', '8000')),
+        ),
     }
 
     # Add model override if specified
     if model:
         agent_kwargs['model'] = model
 
+    if quiet:
+        agent_kwargs['callback_handler'] = None
+
     # Create agent with tools and system prompt
     agent = Agent(**agent_kwargs)
 
     return agent
 
 
+def fast_path(prompt):
+    """
+    Get the tool and arguments that answer a simple lookup on their own
+    ("search Haaland", "show my team", "chips left?"), or None if the
+    prompt needs the agent. See router.route.
+    """
+    from router import route
+    from sessions import current_team_id
+
+    routed = route(prompt, team_known=current_team_id() is not None)
+    if routed is None:
+        return None
+    tool_name, arguments = routed
+    tool = next(t for t in fpl_tools() if t.tool_name == tool_name)
+    return tool, arguments
+
+
+def _record_exchange(agent, prompt, text):
+    """Add a fast-path answer to the agent's conversation, for follow-ups, and wrap it as an AgentResult."""
+    from strands.agent.agent_result import AgentResult
+    from strands.telemetry.metrics import EventLoopMetrics
+
+    message = {'role': 'assistant', 'content': [{'text': text}]}
+    agent.messages.extend([{'role': 'user', 'content': [{'text': prompt}]}, message])
+    return AgentResult(stop_reason='end_turn', message=message, metrics=EventLoopMetrics(), state={})
+
+
+def _team_tool_names():
+    """Names of the tools that act for a team (they take a team_id), whose answers are the team's own."""
+    return {t.tool_name for t in fpl_tools()
+            if 'team_id' in t.tool_spec['inputSchema']['json'].get('properties', {})}
+
+
+def _cached_answer(agent, prompt, snapshot):
+    """
+    Get a cached answer to the prompt on this snapshot (for this session's
+    team), or None. Only a conversation's opening question is answered from
+    the cache: later ones may lean on what was said before.
+    """
+    from answer_cache import get_answer_cache, question_key
+    from sessions import current_team_id
+
+    question = question_key(prompt)
+    if question is None or snapshot is None or agent.messages:
+        return None
+    return get_answer_cache().lookup(question, snapshot.version, current_team_id())
+
+
+def _remember_answer(agent, prompt, snapshot, start, failures):
+    """
+    Cache a finished turn's answer, given where its messages start in the
+    conversation and the tools that failed during it (see record_failures).
+
+    Only turns that opened the conversation are cached: a later answer may
+    depend on the user's earlier messages (a budget, a squad, a rival), and
+    must never be served to another user. Turns that failed (a tool
+    failed, or the model stopped short) are not cached either, so the
+    question is answered afresh next time.
+    """
+    from answer_cache import get_answer_cache, question_key
+    from sessions import current_team_id
+    question = question_key(prompt)
+    messages = agent.messages[start:]
+    if question is None or snapshot is None or start > 0 or failures or not messages \
+            or messages[-1]['role'] != 'assistant':
+        return
+    tools = set()
+    for message in messages:
+        for block in message['content']:
+            if 'toolUse' in block:
+                tools.add(block['toolUse']['name'])
+            elif 'toolResult' in block and block['toolResult'].get('status') == 'error':
+                return
+    answer = ''.join(block.get('text', '') for block in messages[-1]['content'])
+    if not answer or any('toolUse' in block for block in messages[-1]['content']):
+        return
+    personal = bool(tools & _team_tool_names())
+    get_answer_cache().store(question, snapshot.version, current_team_id(), answer, personal)
+
+
+def run_turn(agent, prompt, use_fast_path=False, use_answer_cache=False):
+    """
+    Run one agent turn with every tool call reading the same FPL data snapshot.
+
+    A bootstrap refresh that lands mid-turn is only seen by the next turn.
+
+    Args:
+        agent: The session's agent
+        prompt: The user's message
+        use_fast_path: Answer simple lookups with their one tool call,
+            without the model (see fast_path)
+        use_answer_cache: Answer questions asked before, on the same FPL
+            data, from the answer cache (see answer_cache.AnswerCache)
+    """
+    from fpl_client import get_client
+    from snapshot import pin
+    from tool_cache import record_failures
+
+    try:
+        snapshot = get_client().get_snapshot()
+    except Exception as e:
+        # The tools report the API error themselves; the turn can still run
+        print(f"FPL data unavailable for this turn: {e}")
+        snapshot = None
+
+    with pin(snapshot) if snapshot is not None else nullcontext():
+        routed = fast_path(prompt) if use_fast_path else None
+        if routed is None:
+            cached = _cached_answer(agent, prompt, snapshot) if use_answer_cache else None
+            if cached is not None:
+                agent.callback_handler(data=cached)
+                return _record_exchange(agent, prompt, cached)
+
+            start = len(agent.messages)
+            with record_failures() as failures:
+                result = agent(prompt)
+            if use_answer_cache and result.stop_reason == 'end_turn':
+                _remember_answer(agent, prompt, snapshot, start, failures)
+            return result
+
+        tool, arguments = routed
+        text = tool(**arguments)
+        # Shown the way the agent's own answers are (printed, in the CLI)
+        agent.callback_handler(data=text)
+        return _record_exchange(agent, prompt, text)
+
+
+async def stream_turn(agent, prompt, use_fast_path=False, use_answer_cache=False):
+    """
+    Run one agent turn on one FPL data snapshot, yielding progress as it happens.
+
+    Yields {'type': 'text', 'text': ...} for each chunk of the response, and
+    {'type': 'tool', 'name': ..., 'status': 'started' | 'success' | 'error'}
+    as each tool call starts and finishes. Tools run on worker threads, so
+    the event loop keeps serving other sessions while they wait on the FPL API.
+    With use_fast_path, simple lookups are answered by their one tool call,
+    without the model (see fast_path); with use_answer_cache, questions asked
+    before on the same FPL data are answered from the answer cache.
+    """
+    from fpl_client import get_client
+    from snapshot import pin
+    from tool_cache import record_failures
+
+    try:
+        # The first fetch (or a refresh) of the bootstrap data is blocking I/O
+        snapshot = await asyncio.to_thread(get_client().get_snapshot)
+    except Exception as e:
+        # The tools report the API error themselves; the turn can still run
+        print(f"FPL data unavailable for this turn: {e}")
+        snapshot = None
+
+    tool_names = {}
+    with pin(snapshot) if snapshot is not None else nullcontext():
+        routed = fast_path(prompt) if use_fast_path else None
+        if routed is not None:
+            tool, arguments = routed
+            yield {'type': 'tool', 'name': tool.tool_name, 'status': 'started'}
+            text = await asyncio.to_thread(tool, **arguments)
+            yield {'type': 'tool', 'name': tool.tool_name, 'status': 'success'}
+            yield {'type': 'text', 'text': text}
+            _record_exchange(agent, prompt, text)
+            return
+
+        cached = _cached_answer(agent, prompt, snapshot) if use_answer_cache else None
+        if cached is not None:
+            yield {'type': 'text', 'text': cached}
+            _record_exchange(agent, prompt, cached)
+            return
+
+        start = len(agent.messages)
+        stop_reason = None
+        with record_failures() as failures:
+            async for event in agent.stream_async(prompt):
+                if 'data' in event:
+                    yield {'type': 'text', 'text': event['data']}
+                elif 'current_tool_use' in event:
+                    tool_use = event['current_tool_use']
+                    if tool_use.get('toolUseId') not in tool_names:
+                        tool_names[tool_use.get('toolUseId')] = tool_use.get('name')
+                        yield {'type': 'tool', 'name': tool_use.get('name'), 'status': 'started'}
+                elif 'message' in event:
+                    for block in event['message']['content']:
+                        if 'toolResult' in block:
+                            result = block['toolResult']
+                            yield {'type': 'tool', 'name': tool_names.get(result['toolUseId']),
+                                   'status': result['status']}
+                elif 'result' in event:
+                    stop_reason = event['result'].stop_reason
+
+        if use_answer_cache and stop_reason == 'end_turn':
+            _remember_answer(agent, prompt, snapshot, start, failures)
+
+
+def prewarm():
+    """
+    Do the first turn's one-off work ahead of it, e.g. on a server's startup thread.
+
+    Imports Strands and the tool modules, starts the FPL client from its
+    cached bootstrap data (refreshing it in the background; see
+    FPLClient.prewarm) and builds the snapshot's lookup indexes.
+    """
+    from fpl_client import get_client
+
+    fpl_tools()
+    client = get_client()
+    client.prewarm()
+    try:
+        snapshot = client.get_snapshot()
+        snapshot.index, snapshot.player_table, snapshot.search_index
+    except Exception as e:
+        # The first turn will load the data (and report any error) itself
+        print(f"FPL data not prewarmed: {e}")
+
+
 def main():
     """Run the FPL Assistant in interactive mode."""
 
@@ -205,7 +463,7 @@ def main():
             print()
 
             # Get response from agent (streams automatically)
-            response = agent(user_input)
+            response = run_turn(agent, user_input, use_fast_path=True, use_answer_cache=True)
             print()
 
         except KeyboardInterrupt:
@@ -0,0 +1,78 @@
+"""Cache of agent answers to repeated questions, keyed by question, data snapshot version and team."""
+
+import re
+import time
+from typing import Hashable, Optional
+
+from router import normalize
+from tool_cache import ToolResultCache
+
+
+# Questions leaning on the conversation so far ("what about him?") mean
+# something different in every session, so they are never cached
+_REFERS_BACK = re.compile(
+    r"\b(?:he|him|his|she|her|they|them|their|it|its|that|those|these|instead|also|too|again|else|"
+    r"same|other|previous|above|earlier|what about|how about)\b", re.I)
+
+# Team key of answers every user shares (the turn used no team-specific tool)
+SHARED = '*'
+
+
+def question_key(question: str) -> Optional[str]:
+    """Normalize a question for the cache (case, spacing, punctuation), or None if it can't be cached."""
+    text = normalize(question).lower()
+    if not text or _REFERS_BACK.search(text):
+        return None
+    return ' '.join(re.findall(r"[\w£%.']+", text))
+
+
+class AnswerCache(ToolResultCache):
+    """
+    Thread-safe LRU cache of final agent answers, bounded like the tool result cache.
+
+    Only a conversation's opening question is cached (see agent.run_turn):
+    a later answer may depend on what the user said before.
+
+    Keys are (normalized question, snapshot version, team): a turn that used
+    no team-specific tool files its answer under the SHARED team, so every
+    user asking the same question of the same data gets it; other answers
+    are only reused for the same team. A new data snapshot changes every
+    key, and team data (picks, transfers) changes on its own, so answers
+    also expire after max_age seconds.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 4_000_000, max_age: float = 10 * 60):
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes, max_age=max_age)
+        self.shared_hits = 0
+
+    def lookup(self, question: str, version: int, team_id: Optional[Hashable]) -> Optional[str]:
+        """Get the answer shared by all users, else this team's, or None."""
+        now = time.monotonic()
+        with self._lock:
+            for team in (SHARED, team_id):
+                key = (question, version, team)
+                entry = self._entries.get(key)
+                if entry is not None and now - entry[1] < self.max_age:
+                    self._entries.move_to_end(key)
+                    self.hits['answers'] += 1
+                    self.shared_hits += team == SHARED
+                    return entry[0]
+                if entry is not None:
+                    self._remove(key)
+            self.misses['answers'] += 1
+            return None
+
+    def store(self, question: str, version: int, team_id: Optional[Hashable], answer: str,
+              personal: bool) -> None:
+        """Store a turn's answer: for its team if the turn used team-specific tools, else for everyone."""
+        if personal and team_id is None:
+            return
+        self.put((question, version, team_id if personal else SHARED), answer)
+
+
+_cache = AnswerCache()
+
+
+def get_answer_cache() -> AnswerCache:
+    """Get the process-wide answer cache."""
+    return _cache
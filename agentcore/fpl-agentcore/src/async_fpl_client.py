@@ -0,0 +1,193 @@
+"""Asyncio sibling of FPLClient for concurrent fan-out requests."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar
+
+from bootstrap_index import BootstrapIndex
+from fpl_client import FPLClient, get_client
+from models import Fixture, Player, Team
+
+T = TypeVar("T")
+
+MAX_CONCURRENCY = 15    # Threads in the shared pool: a full squad's requests at once
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Get the thread pool every AsyncFPLClient runs its calls on, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # The default executor is sized by CPU count, which would cap the fan-out
+            _executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix='fpl-async')
+        return _executor
+
+
+class AsyncFPLClient:
+    """
+    Async client exposing the same methods as FPLClient.
+
+    Each call runs the blocking FPLClient method on a thread pool shared by
+    all async clients in the process, so both clients share one HTTP session
+    and one bootstrap cache. Batch methods fan out concurrently, with at most
+    `max_concurrency` requests in flight (and MAX_CONCURRENCY in the process).
+    Use get_async_client() for the shared instance.
+    """
+
+    def __init__(self, client: Optional[FPLClient] = None, max_concurrency: int = MAX_CONCURRENCY):
+        self.client = client or get_client()
+        self.max_concurrency = max_concurrency
+        self._executor = _shared_executor()
+
+    async def _call(self, method, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor,
+                                          functools.partial(context.run, method, *args))
+
+    async def get_bootstrap_static(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """Get bootstrap-static data (players, teams, gameweeks)."""
+        return await self._call(self.client.get_bootstrap_static, force_refresh)
+
+    async def refresh_bootstrap(self, wait: bool = True) -> Dict[str, Any]:
+        """Refresh bootstrap-static data now, regardless of its age."""
+        return await self._call(self.client.refresh_bootstrap, wait)
+
+    async def get_bootstrap_index(self) -> BootstrapIndex:
+        """Get the lookup index for the current bootstrap-static data."""
+        return await self._call(self.client.get_bootstrap_index)
+
+    async def get_player_summary(self, player_id: int) -> Dict[str, Any]:
+        """Get detailed summary for a specific player including fixtures and history."""
+        return await self._call(self.client.get_player_summary, player_id)
+
+    async def _gather(self, method, keys: Iterable, max_concurrency: Optional[int],
+                      return_exceptions: bool = False) -> Dict[Any, Any]:
+        """Call `method(key)` for each distinct key concurrently, within the concurrency cap."""
+        keys = list(dict.fromkeys(keys))
+        # Created per batch: asyncio primitives bind to the loop that first uses them.
+        semaphore = asyncio.Semaphore(min(max_concurrency or self.max_concurrency, self.max_concurrency))
+
+        async def fetch(key):
+            async with semaphore:
+                return await method(key)
+
+        results = await asyncio.gather(*(fetch(key) for key in keys), return_exceptions=return_exceptions)
+        return dict(zip(keys, results))
+
+    async def get_fixtures(self, event: Optional[int] = None) -> List[Fixture]:
+        """Get fixture data, optionally filtered by gameweek."""
+        return await self._call(self.client.get_fixtures, event)
+
+    async def get_live_gameweek(self, event: int) -> Dict[str, Any]:
+        """Get live data for a specific gameweek."""
+        return await self._call(self.client.get_live_gameweek, event)
+
+    async def get_live_gameweeks(self, events: Iterable[int], max_concurrency: Optional[int] = None,
+                                 return_exceptions: bool = False) -> Dict[int, Any]:
+        """
+        Fetch live data for many gameweeks concurrently.
+
+        Args:
+            events: Gameweek numbers to fetch (duplicates are fetched once)
+            max_concurrency: Cap on requests in flight (default and upper bound: the client's cap)
+            return_exceptions: Map failed gameweeks to their exception instead of raising
+
+        Returns:
+            Dict mapping gameweek to its live payload.
+        """
+        return await self._gather(self.get_live_gameweek, events, max_concurrency, return_exceptions)
+
+    async def get_team_info(self, team_id: int) -> Dict[str, Any]:
+        """Get information about a manager's team."""
+        return await self._call(self.client.get_team_info, team_id)
+
+    async def get_team_picks(self, team_id: int, event: int) -> Dict[str, Any]:
+        """Get a manager's team picks for a specific gameweek."""
+        return await self._call(self.client.get_team_picks, team_id, event)
+
+    async def get_team_picks_many(self, team_id: int, events: Iterable[int],
+                                  max_concurrency: Optional[int] = None,
+                                  return_exceptions: bool = False) -> Dict[int, Any]:
+        """
+        Fetch a manager's picks for many gameweeks concurrently.
+
+        Args:
+            team_id: The manager's FPL team ID
+            events: Gameweek numbers to fetch (duplicates are fetched once)
+            max_concurrency: Cap on requests in flight (default and upper bound: the client's cap)
+            return_exceptions: Map failed gameweeks to their exception instead of raising
+
+        Returns:
+            Dict mapping gameweek to the picks payload.
+        """
+        return await self._gather(functools.partial(self.get_team_picks, team_id), events,
+                                  max_concurrency, return_exceptions)
+
+    async def get_team_history(self, team_id: int) -> Dict[str, Any]:
+        """Get a manager's performance history."""
+        return await self._call(self.client.get_team_history, team_id)
+
+    async def get_team_transfers(self, team_id: int) -> List[Dict[str, Any]]:
+        """Get a manager's transfer history."""
+        return await self._call(self.client.get_team_transfers, team_id)
+
+    async def get_current_gameweek(self) -> int:
+        """Get the current gameweek number."""
+        return await self._call(self.client.get_current_gameweek)
+
+    async def get_next_gameweek(self) -> int:
+        """Get the next gameweek number."""
+        return await self._call(self.client.get_next_gameweek)
+
+    async def get_player_by_id(self, player_id: int) -> Optional[Player]:
+        """Get player data by ID from bootstrap-static."""
+        return await self._call(self.client.get_player_by_id, player_id)
+
+    async def get_team_by_id(self, team_id: int) -> Optional[Team]:
+        """Get team data by ID from bootstrap-static."""
+        return await self._call(self.client.get_team_by_id, team_id)
+
+    async def search_players(self, name: str, limit: int = 10) -> List[Player]:
+        """Search for players by name."""
+        return await self._call(self.client.search_players, name, limit)
+
+    async def resolve_players(self, refs: List[str]) -> List[Optional[Player]]:
+        """Resolve player IDs or names to players, in order."""
+        return await self._call(self.client.resolve_players, refs)
+
+
+_clients: Dict[FPLClient, AsyncFPLClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_async_client(client: Optional[FPLClient] = None) -> AsyncFPLClient:
+    """Get the process-wide async client for a client (the shared client by default)."""
+    client = client or get_client()
+    with _clients_lock:
+        if client not in _clients:
+            _clients[client] = AsyncFPLClient(client)
+        return _clients[client]
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code (e.g. a @tool function).
+
+    Falls back to a helper thread when this thread already runs an event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Carry context variables (e.g. the pinned snapshot) into the helper thread
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(context.run, asyncio.run, coro).result()
@@ -0,0 +1,73 @@
+"""Indexed lookups over a bootstrap-static payload."""
+
+from collections import defaultdict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from models import Player, Team
+
+
+POSITION_NAMES = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
+POSITION_IDS = {name: position_id for position_id, name in POSITION_NAMES.items()}
+
+
+class BootstrapIndex:
+    """
+    O(1) lookup tables for one bootstrap-static payload.
+
+    Built once per data snapshot (see FPLClient.get_snapshot) and
+    shared by all tools, instead of scanning `elements`/`teams` per call.
+    Players and teams are Player/Team records; gameweeks are API dicts.
+    """
+
+    def __init__(self, data: Mapping[str, Any], version: int = 0):
+        self.data = data
+        self.version = version
+
+        self.players: Dict[int, Player] = {p.id: p for p in data['elements']}
+        self.teams: Dict[int, Team] = {t.id: t for t in data['teams']}
+        self.events: Dict[int, Mapping[str, Any]] = {e['id']: e for e in data['events']}
+        self.team_names: Dict[int, str] = {t.id: t.name for t in data['teams']}
+        self.team_short_names: Dict[int, str] = {t.id: t.short_name or t.name for t in data['teams']}
+
+        players_by_team = defaultdict(list)
+        players_by_position = defaultdict(list)
+        for player in data['elements']:
+            players_by_team[player.team].append(player)
+            players_by_position[player.element_type].append(player)
+        self.players_by_team: Dict[int, Tuple[Player, ...]] = {k: tuple(v) for k, v in players_by_team.items()}
+        self.players_by_position: Dict[int, Tuple[Player, ...]] = {k: tuple(v) for k, v in players_by_position.items()}
+
+        self.current_event = next((e for e in data['events'] if e['is_current']), None)
+        self.next_event = next((e for e in data['events'] if e['is_next']), None)
+
+        # The gameweek the next transfer deadline is for (past the last one
+        # once the season is over)
+        if self.next_event is not None:
+            self.next_deadline_event: int = self.next_event['id']
+        else:
+            self.next_deadline_event = self.current_event['id'] + 1 if self.current_event else 1
+
+    def player(self, player_id: int) -> Optional[Player]:
+        """Get a player by ID."""
+        return self.players.get(player_id)
+
+    def team(self, team_id: int) -> Optional[Team]:
+        """Get a club by ID."""
+        return self.teams.get(team_id)
+
+    def team_name(self, team_id: int) -> str:
+        """Get a club's name, or 'Unknown'."""
+        return self.team_names.get(team_id, 'Unknown')
+
+    def team_short_name(self, team_id: int) -> str:
+        """Get a club's three-letter name ('ARS'), or 'UNK'."""
+        return self.team_short_names.get(team_id, 'UNK')
+
+    def event(self, event_id: int) -> Optional[Mapping[str, Any]]:
+        """Get a gameweek by number."""
+        return self.events.get(event_id)
+
+    @staticmethod
+    def position_name(element_type: int) -> str:
+        """Get a short position name ('GK', 'DEF', 'MID', 'FWD'), or 'Unknown'."""
+        return POSITION_NAMES.get(element_type, 'Unknown')
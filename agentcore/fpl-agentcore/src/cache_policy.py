@@ -0,0 +1,240 @@
+"""Deadline-aware cache expiry driven by the gameweek calendar."""
+
+import bisect
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from http_cache import FOREVER, HOUR, MINUTE, CachePolicy
+
+try:
+    UK_TIME = ZoneInfo('Europe/London')
+except ZoneInfoNotFoundError:  # no tz database on this host
+    UK_TIME = timezone.utc
+
+MATCH_LENGTH = 2 * HOUR            # kickoff to final whistle, stoppages included
+DEADLINE_WINDOW = (1 * HOUR, 30 * MINUTE)   # busy period before/after a deadline
+PRICE_CHANGE_WINDOW = ((1, 0), (2, 15))     # nightly price updates, ~01:30 UK time
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """Parse an API timestamp ('2025-08-15T17:30:00Z') as epoch seconds."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+class EventCalendar:
+    """
+    Deadlines and match windows for a season, as sorted epoch timestamps.
+
+    Built from bootstrap `events` and, when available, fixture kickoff times.
+    Without fixtures, every started and unfinished gameweek counts as one
+    long match window.
+    """
+
+    def __init__(self, events: Sequence[Dict[str, Any]],
+                 kickoffs: Optional[Sequence[float]] = None):
+        self.events = list(events)
+        self.deadlines: List[float] = sorted(t for t in (parse_time(e['deadline_time'])
+                                                         for e in self.events) if t is not None)
+        self.current_event = next((e for e in self.events if e['is_current']), None)
+        self.finished_events = {e['id'] for e in self.events if e['finished']}
+        # Finished gameweeks whose points and bonus are confirmed final
+        self.checked_events = {e['id'] for e in self.events if e['finished'] and e.get('data_checked')}
+        self.kickoffs: Optional[List[float]] = sorted(kickoffs) if kickoffs else None
+
+        # When the current gameweek's last match ends (None if unknown or over)
+        self.current_event_end: Optional[float] = None
+        current = self.current_event
+        if current and not current['finished']:
+            start = parse_time(current['deadline_time'])
+            following = self.next_deadline(start) if start is not None else None
+            if self.kickoffs and start is not None:
+                end = following if following is not None else FOREVER
+                lo = bisect.bisect_right(self.kickoffs, start)
+                hi = bisect.bisect_left(self.kickoffs, end)
+                if hi > lo:
+                    self.current_event_end = self.kickoffs[hi - 1] + MATCH_LENGTH
+            else:
+                self.current_event_end = following
+
+    def next_deadline(self, t: float) -> Optional[float]:
+        """Get the first deadline strictly after `t`."""
+        i = bisect.bisect_right(self.deadlines, t)
+        return self.deadlines[i] if i < len(self.deadlines) else None
+
+    def next_kickoff(self, t: float) -> Optional[float]:
+        """Get the first kickoff strictly after `t`."""
+        if not self.kickoffs:
+            return None
+        i = bisect.bisect_right(self.kickoffs, t)
+        return self.kickoffs[i] if i < len(self.kickoffs) else None
+
+    def in_match_window(self, t: float) -> bool:
+        """Check whether any match is in progress at `t`."""
+        if self.kickoffs is None:
+            # No fixture data: assume play between a deadline and the gameweek's end
+            current = self.current_event
+            start = parse_time(current['deadline_time']) if current else None
+            return (start is not None and start <= t and self.current_event_end is not None
+                    and t < self.current_event_end)
+        i = bisect.bisect_right(self.kickoffs, t)
+        return i > 0 and t < self.kickoffs[i - 1] + MATCH_LENGTH
+
+    def near_deadline(self, t: float) -> bool:
+        """Check whether `t` is in the busy period around a deadline."""
+        before, after = DEADLINE_WINDOW
+        i = bisect.bisect_left(self.deadlines, t - after)
+        return i < len(self.deadlines) and self.deadlines[i] - before <= t
+
+    def next_deadline_window(self, t: float) -> Optional[float]:
+        """Get the start of the next busy period around a deadline, after `t`."""
+        deadline = self.next_deadline(t + DEADLINE_WINDOW[0])
+        return deadline - DEADLINE_WINDOW[0] if deadline is not None else None
+
+    @staticmethod
+    def _price_window(t: float):
+        """Get (start, end) of the price-change window on the UK date of `t`."""
+        local = datetime.fromtimestamp(t, UK_TIME)
+        (start_h, start_m), (end_h, end_m) = PRICE_CHANGE_WINDOW
+        start = local.replace(hour=start_h, minute=start_m, second=0, microsecond=0)
+        end = local.replace(hour=end_h, minute=end_m, second=0, microsecond=0)
+        return start.timestamp(), end.timestamp()
+
+    def in_price_change_window(self, t: float) -> bool:
+        """Check whether `t` falls in the nightly price-change window."""
+        start, end = self._price_window(t)
+        return start <= t < end
+
+    def next_price_change_window(self, t: float) -> float:
+        """Get the start of the next price-change window after `t`."""
+        start, _ = self._price_window(t)
+        if start > t:
+            return start
+        tomorrow = datetime.fromtimestamp(t, UK_TIME) + timedelta(days=1)
+        return self._price_window(tomorrow.timestamp())[0]
+
+
+class CalendarCachePolicy(CachePolicy):
+    """
+    Cache expiry derived from the events calendar instead of fixed TTLs.
+
+    - Picks and live data for a gameweek never expire once its data is
+      checked; a finished or past gameweek still awaiting bonus and
+      corrections keeps its longest TTL instead.
+    - Manager history and entry info keep until the next deadline or the end
+      of the current gameweek, whichever comes first; current picks do too,
+      apart from refreshing every 15 minutes while matches are on.
+    - Live points, fixtures and player summaries refresh quickly only while a
+      match is in progress, and otherwise keep until the next kickoff.
+    - Bootstrap refreshes every minute or two around deadlines, price changes
+      and matches, and every 30 minutes otherwise.
+
+    Until the calendar is known (no bootstrap loaded yet) the fixed TTLs of
+    CachePolicy apply.
+    """
+
+    # kind: (ttl during busy periods, longest ttl otherwise)
+    TTLS: Dict[str, tuple] = {
+        'bootstrap': (2 * MINUTE, 30 * MINUTE),
+        'fixtures': (2 * MINUTE, 6 * HOUR),
+        'element_summary': (10 * MINUTE, 6 * HOUR),
+        'live': (1 * MINUTE, 6 * HOUR),
+        'picks': (15 * MINUTE, 12 * HOUR),
+        'entry': (None, 12 * HOUR),
+    }
+    KINDS = [
+        (r'^/bootstrap-static/$', 'bootstrap'),
+        (r'^/fixtures/', 'fixtures'),
+        (r'^/element-summary/\d+/$', 'element_summary'),
+        (r'^/event/\d+/live/$', 'live'),
+        (r'^/entry/\d+/event/\d+/picks/$', 'picks'),
+        (r'^/entry/\d+/history/$', 'entry'),
+        (r'^/entry/\d+/$', 'entry'),
+    ]
+
+    def __init__(self, events: Callable[[], Optional[Sequence[Dict[str, Any]]]],
+                 kickoffs: Optional[Callable[[], Optional[Sequence[float]]]] = None,
+                 rules=None, is_event_finished: Optional[Callable[[int], bool]] = None):
+        """
+        Args:
+            events: Returns the bootstrap `events` list, or None if not loaded
+            kickoffs: Returns fixture kickoff times (epoch seconds), or None
+            rules: Fixed TTL rules for endpoints the calendar does not cover
+            is_event_finished: Gameweek finished check, as for CachePolicy
+        """
+        super().__init__(rules, is_event_finished)
+        self.events = events
+        self.kickoffs = kickoffs or (lambda: None)
+        self.kinds = [(re.compile(pattern), kind) for pattern, kind in self.KINDS]
+        self._calendar: Optional[EventCalendar] = None
+        self._calendar_sources = (None, None)
+        self._lock = threading.Lock()
+
+    def calendar(self) -> Optional[EventCalendar]:
+        """Get the calendar for the current events/kickoffs, rebuilt when either changes."""
+        events, kickoffs = self.events(), self.kickoffs()
+        if not events:
+            return None
+        sources = self._calendar_sources
+        if sources[0] is events and sources[1] is kickoffs:
+            return self._calendar
+        with self._lock:
+            if self._calendar_sources[0] is not events or self._calendar_sources[1] is not kickoffs:
+                self._calendar = EventCalendar(events, kickoffs)
+                self._calendar_sources = (events, kickoffs)
+            return self._calendar
+
+    def _kind(self, endpoint: str) -> Optional[str]:
+        for pattern, kind in self.kinds:
+            if pattern.match(endpoint):
+                return kind
+        return None
+
+    def _event(self, endpoint: str) -> Optional[int]:
+        """Get the gameweek of single-gameweek data (picks, live), or None."""
+        for pattern in self.finished_event_patterns:
+            match = pattern.match(endpoint)
+            if match:
+                return int(match.group(1))
+        return None
+
+    def expires_at(self, endpoint: str, stored_at: float) -> float:
+        """Get the epoch time at which a response stored at `stored_at` goes stale."""
+        calendar = self.calendar()
+        kind = self._kind(endpoint)
+        if calendar is None or kind is None:
+            return super().expires_at(endpoint, stored_at)
+        busy_ttl, quiet_ttl = self.TTLS[kind]
+        event = self._event(endpoint)
+        if event is not None:
+            if event in calendar.checked_events:
+                return FOREVER
+            current = calendar.current_event
+            if event in calendar.finished_events or (current and event < current['id']):
+                # Played out, but bonus and corrections may still land
+                return stored_at + quiet_ttl
+
+        t = stored_at
+        busy = calendar.in_match_window(t) and busy_ttl is not None
+        if kind == 'bootstrap':
+            busy = busy or calendar.near_deadline(t) or calendar.in_price_change_window(t)
+        if busy:
+            return t + busy_ttl
+
+        if kind in ('picks', 'entry'):
+            # Outside matches only a deadline or the gameweek's end changes a manager's record
+            changes = [calendar.next_deadline(t)]
+            if calendar.current_event_end is not None and calendar.current_event_end > t:
+                changes.append(calendar.current_event_end)
+        else:
+            changes = [calendar.next_kickoff(t)]
+            if calendar.kickoffs is None:
+                changes.append(calendar.next_deadline(t))
+            if kind == 'bootstrap':
+                changes += [calendar.next_deadline_window(t), calendar.next_price_change_window(t)]
+
+        return min([t + quiet_ttl] + [c for c in changes if c is not None])
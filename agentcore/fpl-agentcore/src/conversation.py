@@ -0,0 +1,167 @@
+"""Bounded conversation history for long sessions: recent turns verbatim, older ones compacted, a token ceiling."""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from strands.agent.conversation_manager import ConversationManager
+from strands.hooks import BeforeModelCallEvent
+from strands.types.exceptions import ContextWindowOverflowException
+
+from tool_output import estimate_tokens
+
+
+def _is_prompt(message: Dict[str, Any]) -> bool:
+    """Whether a message starts a turn: the user's own text, not tool results."""
+    return message['role'] == 'user' and any('text' in block for block in message['content'])
+
+
+def _turns(messages: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Split a conversation into turns, each starting with the user's prompt."""
+    turns = []
+    for message in messages:
+        if _is_prompt(message) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+    return turns
+
+
+def _tokens(message: Dict[str, Any]) -> int:
+    return estimate_tokens(json.dumps(message['content'], ensure_ascii=False, default=str))
+
+
+def _compact(turn: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    A finished turn as the prompt and the answer alone.
+
+    Tool calls and their results, the bulk of a turn's tokens, are dropped;
+    a note names the tools, so the model knows to call them again for details.
+    """
+    prompt = {'role': 'user', 'content': [block for block in turn[0]['content'] if 'text' in block]}
+    tools = [block['toolUse']['name'] for message in turn for block in message['content'] if 'toolUse' in block]
+    replies = [message for message in turn[1:] if message['role'] == 'assistant']
+    answer = ''.join(block.get('text', '') for block in replies[-1]['content']) if replies else ''
+    if not answer:
+        answer = ' '.join(block['text'] for message in replies for block in message['content'] if 'text' in block)
+    if not answer:
+        return []
+    content = [{'text': answer}]
+    if tools:
+        note = f"[Earlier turn; tool output no longer shown: {', '.join(dict.fromkeys(tools))}]"
+        content.insert(0, {'text': note})
+    return [prompt, {'role': 'assistant', 'content': content}]
+
+
+def _shorten_result(block: Dict[str, Any]) -> bool:
+    """Cut a tool result down to its first line (its headline). Returns whether it got shorter."""
+    shortened = False
+    for item in block['toolResult']['content']:
+        text = item.get('text')
+        if text and '\n' in text.rstrip('\n'):
+            first, rest = text.split('\n', 1)
+            item['text'] = f"{first}\n[{len(rest.splitlines())} more lines trimmed to fit the context]"
+            shortened = True
+    return shortened
+
+
+class BoundedConversationManager(ConversationManager):
+    """
+    Keeps a session's history, and so every model call's prompt, bounded.
+
+    After each turn, the last recent_turns turns stay verbatim and older turns
+    are compacted to the user's prompt and the final answer (see _compact).
+    Before each model call the history must fit in max_tokens (estimated):
+    the oldest turns are dropped first, then tool results earlier in the
+    current turn are cut to their first line. The system prompt and tool
+    specs come on top of the ceiling.
+    """
+
+    def __init__(self, recent_turns: int = 4, max_tokens: int = 8000):
+        super().__init__()
+        self.recent_turns = max(1, recent_turns)
+        self.max_tokens = max_tokens
+
+    def register_hooks(self, registry, **kwargs: Any) -> None:
+        super().register_hooks(registry, **kwargs)
+        registry.add_callback(BeforeModelCallEvent, lambda event: self._fit(event.agent.messages))
+
+    def apply_management(self, agent, **kwargs: Any) -> None:
+        """Compact the turns before the recent ones, then fit the history in the token ceiling."""
+        messages = agent.messages
+        turns = _turns(messages)
+        if len(turns) > self.recent_turns:
+            older = [message for turn in turns[:-self.recent_turns] for message in _compact(turn)]
+            recent = [message for turn in turns[-self.recent_turns:] for message in turn]
+            self.removed_message_count += len(messages) - len(older) - len(recent)
+            messages[:] = older + recent
+        self._fit(messages)
+
+    def reduce_context(self, agent, e: Optional[Exception] = None, **kwargs: Any) -> None:
+        """Shrink the history past a context window overflow: the oldest turn, else older tool results."""
+        messages = agent.messages
+        turns = _turns(messages)
+        if len(turns) > 1:
+            self.removed_message_count += len(turns[0])
+            del messages[:len(turns[0])]
+        elif not self._shorten(messages, keep_last=False) and e is not None:
+            raise ContextWindowOverflowException("Unable to trim conversation context!") from e
+
+    def _fit(self, messages: List[Dict[str, Any]]) -> None:
+        """Drop the oldest turns, then cut older tool results of this turn, until within max_tokens."""
+        total = sum(_tokens(message) for message in messages)
+        turns = _turns(messages)
+        dropped = 0
+        while total > self.max_tokens and len(turns) > 1:
+            turn = turns.pop(0)
+            total -= sum(_tokens(message) for message in turn)
+            dropped += len(turn)
+        if dropped:
+            self.removed_message_count += dropped
+            del messages[:dropped]
+        if total > self.max_tokens:
+            self._shorten(messages, keep_last=True)
+
+    @staticmethod
+    def _shorten(messages: List[Dict[str, Any]], keep_last: bool) -> bool:
+        """Cut tool results to their first line, oldest first (all but the newest, with keep_last)."""
+        results = [message for message in messages
+                   if message['role'] == 'user' and any('toolResult' in block for block in message['content'])]
+        if keep_last:
+            results = results[:-1]
+        shortened = False
+        for message in results:
+            for block in message['content']:
+                if 'toolResult' in block:
+                    shortened = _shorten_result(block) or shortened
+        return shortened
+
+
+def seed_history(agent, history: Iterable[Any]) -> int:
+    """
+    Start a new session's agent from its stored conversation (e.g. AgentCore memory).
+
+    Only plain user and assistant text is kept, alternating and starting with
+    the user, so the history is valid for any model provider; the conversation
+    manager compacts it like any other. Does nothing if the agent already has
+    a conversation.
+
+    Returns:
+        The number of messages added
+    """
+    if agent.messages:
+        return 0
+    messages = []
+    for entry in history:
+        role = entry.get('role') if isinstance(entry, dict) else getattr(entry, 'role', None)
+        content = entry.get('content') if isinstance(entry, dict) else getattr(entry, 'content', None)
+        if isinstance(content, list):
+            content = ''.join(block.get('text', '') for block in content if isinstance(block, dict))
+        if role not in ('user', 'assistant') or not isinstance(content, str) or not content.strip():
+            continue
+        if messages and messages[-1]['role'] == role:
+            messages.pop()
+        if messages or role == 'user':
+            messages.append({'role': role, 'content': [{'text': content}]})
+    if messages and messages[-1]['role'] == 'user':
+        messages.pop()
+    agent.messages.extend(messages)
+    return len(messages)
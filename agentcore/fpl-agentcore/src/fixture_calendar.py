@@ -0,0 +1,80 @@
+"""Team x gameweek fixture calendar built from one bulk /fixtures/ fetch."""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from models import Fixture, TeamFixture
+
+
+class FixtureCalendar:
+    """
+    Every club's fixtures, indexed by team and by gameweek.
+
+    Built once per data snapshot (see FPLClient.get_snapshot) and
+    shared by the fixture tools, instead of one element-summary request per
+    player. Fixtures are stored from each club's point of view as TeamFixture
+    records (`is_home`, `opponent`, `difficulty`, `event`, ...), like
+    element-summary `fixtures`.
+
+    `counts[team, gw]` is the number of fixtures a club plays in a gameweek
+    (0 for a blank, 2+ for a double), `home[team, gw]` how many of them are
+    at home and `difficulty[team, gw]` their summed FDR.
+    """
+
+    def __init__(self, fixtures: Sequence[Fixture], version: int = 0):
+        self.fixtures = fixtures
+        self.version = version
+
+        by_team = defaultdict(list)
+        for fixture in sorted(fixtures, key=lambda f: (f.kickoff_time is None, f.kickoff_time or '', f.id)):
+            for is_home in (True, False):
+                team_fixture = TeamFixture(fixture, is_home)
+                by_team[team_fixture.team].append(team_fixture)
+        self.by_team: Dict[int, List[TeamFixture]] = dict(by_team)
+
+        n_teams = max(self.by_team, default=0) + 1
+        n_events = max((f.event or 0 for f in fixtures), default=0) + 1
+        self.counts = np.zeros((n_teams, n_events), dtype=np.int8)
+        self.home = np.zeros((n_teams, n_events), dtype=np.int8)
+        self.difficulty = np.zeros((n_teams, n_events), dtype=np.int16)
+
+        # First gameweek with a fixture still to finish
+        self.next_event: Optional[int] = min((f.event for f in fixtures
+                                              if f.event and not f.finished), default=None)
+
+        self._by_team_event: Dict[tuple, List[TeamFixture]] = defaultdict(list)
+        for team, team_fixtures in self.by_team.items():
+            for fixture in team_fixtures:
+                if fixture.event is None:  # postponed, not yet rescheduled
+                    continue
+                self.counts[team, fixture.event] += 1
+                self.home[team, fixture.event] += fixture.is_home
+                self.difficulty[team, fixture.event] += fixture.difficulty
+                self._by_team_event[(team, fixture.event)].append(fixture)
+
+    def upcoming(self, team_id: int, limit: Optional[int] = None) -> List[TeamFixture]:
+        """Get a club's unfinished fixtures in kickoff order (as element-summary lists them)."""
+        fixtures = [f for f in self.by_team.get(team_id, []) if not f.finished]
+        return fixtures[:limit] if limit is not None else fixtures
+
+    def gameweek(self, team_id: int, event: int) -> List[TeamFixture]:
+        """Get a club's fixtures in one gameweek: empty for a blank, two or more for a double."""
+        return self._by_team_event.get((team_id, event), [])
+
+    def fixture_count(self, team_id: int, event: int) -> int:
+        """Get how many fixtures a club plays in a gameweek."""
+        if team_id >= self.counts.shape[0] or event >= self.counts.shape[1]:
+            return 0
+        return int(self.counts[team_id, event])
+
+    def blank_teams(self, event: int, team_ids: Sequence[int]) -> List[int]:
+        """Get the clubs among `team_ids` with no fixture in a gameweek."""
+        return [team for team in team_ids if self.fixture_count(team, event) == 0]
+
+    def double_teams(self, event: int) -> List[int]:
+        """Get the clubs with two or more fixtures in a gameweek."""
+        if event >= self.counts.shape[1]:
+            return []
+        return [int(team) for team in np.flatnonzero(self.counts[:, event] >= 2)]
@@ -1,8 +1,24 @@
 """FPL API Client for fetching Fantasy Premier League data."""
 
+import os
+import threading
+import time
+import weakref
 import requests
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from collections import Counter
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Any, Optional, Sequence
+
+from bootstrap_index import BootstrapIndex
+from cache_policy import CalendarCachePolicy, parse_time
+from fixture_calendar import FixtureCalendar
+from http_cache import CachePolicy, DiskCache, MemoryCache, ResponseCache
+from models import Fixture, Player, Team
+import payloads
+from player_table import PlayerTable
+from snapshot import Snapshot, pin, pinned_snapshot
+from transport import RETRY_STATUSES, CircuitBreaker, Transport, get_rate_limiter
 
 
 class FPLClient:
@@ -10,46 +26,354 @@ class FPLClient:
 
     BASE_URL = "https://fantasy.premierleague.com/api"
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, base_url: Optional[str] = None, pool_size: int = 16,
+                 cache: Optional[ResponseCache] = None, cache_policy: Optional[CachePolicy] = None,
+                 stale_while_revalidate: bool = False, max_staleness: float = 30 * 60,
+                 transport: Optional[Transport] = None):
+        self.base_url = base_url or os.getenv('FPL_API_BASE_URL', self.BASE_URL)
+        # Timeouts, retries with backoff and a circuit breaker; the pool has
+        # room for a full squad's concurrent requests (see AsyncFPLClient)
+        self.transport = transport or Transport(pool_size=pool_size, breaker=CircuitBreaker())
+        self.session = self.transport.session
         self.session.headers.update({
             'User-Agent': 'FPL-Assistant/1.0'
         })
         self._bootstrap_cache = None
-        self._cache_time = None
+        self._cache_time = None  # epoch time of the last bootstrap load
+
+        # Stale-while-revalidate: serve expired bootstrap data (up to
+        # max_staleness seconds past its expiry, whatever the policy's TTL)
+        # while a background thread refreshes it
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_staleness = max_staleness
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_lock = threading.Lock()
+        self.last_refresh_error: Optional[Exception] = None
+
+        # Read-only versioned snapshots: only the latest is held here, older
+        # versions stay alive while a pinned turn still uses them
+        self._snapshot: Optional[Snapshot] = None
+        self._snapshot_version = 0
+        self._snapshots: 'weakref.WeakValueDictionary[int, Snapshot]' = weakref.WeakValueDictionary()
+        self._snapshot_lock = threading.Lock()
+
+        # Single-flight: endpoint -> Future shared by all concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.upstream_calls = Counter()
+        self.coalesced_calls = Counter()
+
+        # Optional response cache under _get (e.g. DiskCache to survive restarts).
+        # Expiry follows the gameweek calendar once bootstrap data is loaded.
+        self.cache = cache
+        self._fixture_kickoffs: Optional[List[float]] = None
+        self._fixtures_source: Optional[List[Dict[str, Any]]] = None
+        self._fixtures_time: Optional[float] = None  # epoch time of the last full /fixtures/ load
+        self.cache_policy = cache_policy or CalendarCachePolicy(
+            events=self._calendar_events,
+            kickoffs=lambda: self._fixture_kickoffs,
+            is_event_finished=self._is_event_finished,
+        )
+
+    def _get(self, endpoint: str, revalidate: bool = False) -> Dict[str, Any]:
+        """
+        Make a GET request to the FPL API.
+
+        Concurrent requests for the same endpoint are coalesced: the first
+        caller performs the HTTP request and the others wait on its result.
+        With `revalidate`, a fresh cached response is checked with the server
+        instead of being served directly.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(endpoint)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[endpoint] = future
+            else:
+                self.coalesced_calls[endpoint] += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            future.set_result(self._fetch(endpoint, revalidate))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[endpoint]
+        return future.result()
+
+    def _fetch(self, endpoint: str, revalidate: bool = False) -> Dict[str, Any]:
+        """Serve an endpoint from the response cache or perform the HTTP request."""
+        url = f"{self.base_url}{endpoint}"
+        if self.cache is None:
+            return payloads.decode(endpoint, self._request(endpoint, url).content)
+
+        entry = self.cache.get(url)
+        now = time.time()
+        if entry and not revalidate and now < self.cache_policy.expires_at(endpoint, entry['stored_at']):
+            self.cache.record('hits')
+            self.cache.record('bytes_saved', entry['size'])
+            return payloads.project(endpoint, entry['body'])
+
+        # Stale (or forced): revalidate cheaply with a conditional GET
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self._request(endpoint, url, headers)
+        except requests.RequestException as e:
+            if entry is None or not _is_upstream_failure(e):
+                raise
+            # API failing or circuit open: serve the stale copy rather than nothing
+            self.cache.record('stale_served')
+            return payloads.project(endpoint, entry['body'])
+
+        if entry and response.status_code == 304:
+            entry['stored_at'] = now
+            self.cache.set(url, entry)
+            self.cache.record('revalidated')
+            self.cache.record('bytes_saved', entry['size'])
+            return payloads.project(endpoint, entry['body'])
+
+        body = payloads.decode(endpoint, response.content)
+        self.cache.set(url, {
+            'body': body,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored_at': now,
+            'size': len(response.content),
+        })
+        self.cache.record('refreshed' if entry else 'misses')
+        self.cache.record('bytes_downloaded', len(response.content))
+        return body
+
+    def _request(self, endpoint: str, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Perform the HTTP request for an endpoint."""
+        with self._inflight_lock:
+            self.upstream_calls[endpoint] += 1
+        response = self.transport.get(url, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _is_event_finished(self, event: int) -> bool:
+        """Check in the already-loaded bootstrap data that a gameweek is finished and its data checked."""
+        snapshot = self._snapshot
+        event_data = snapshot.index.event(event) if snapshot else None
+        return bool(event_data and event_data['finished'] and event_data.get('data_checked'))
 
-    def _get(self, endpoint: str) -> Dict[str, Any]:
-        """Make a GET request to the FPL API."""
-        url = f"{self.BASE_URL}{endpoint}"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+    def _calendar_events(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the already-loaded bootstrap events for the cache policy, without fetching."""
+        data = self._bootstrap_cache
+        return data['events'] if data else None
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-endpoint counts of upstream HTTP requests and coalesced waits, plus cache and transport counts."""
+        with self._inflight_lock:
+            stats = {
+                'upstream_calls': dict(self.upstream_calls),
+                'coalesced_calls': dict(self.coalesced_calls),
+            }
+        if self.cache is not None:
+            stats['cache'] = self.cache.get_stats()
+        stats['transport'] = self.transport.get_stats()
+        stats['snapshots'] = {
+            'current': self._snapshot.version if self._snapshot else 0,
+            'alive': sorted(self._snapshots.keys()),
+        }
+        return stats
 
     def get_bootstrap_static(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
-        Get bootstrap-static data (players, teams, gameweeks).
-        Cached for 5 minutes to reduce API calls.
+        Get bootstrap-static data: Player records in `elements`, Team records
+        in `teams`, and gameweek dicts in `events`. Inside a pinned turn this
+        is the pinned snapshot's read-only view (see pin_snapshot).
+        Cached until the cache policy expires it (between 2 and 30 minutes,
+        depending on deadlines, price changes and matches) to reduce API calls.
+
+        In stale-while-revalidate mode, expired data is returned immediately
+        while a background refresh runs; only data expired for longer than
+        max_staleness makes the caller wait on the network.
         """
-        now = datetime.now()
-        if (not force_refresh and self._bootstrap_cache and self._cache_time and
-            (now - self._cache_time).seconds < 300):
-            return self._bootstrap_cache
+        pinned = pinned_snapshot(self)
+        if pinned is not None and not force_refresh:
+            return pinned.bootstrap
+        if not force_refresh and self._bootstrap_cache is not None:
+            now = time.time()
+            expires_at = self.cache_policy.expires_at("/bootstrap-static/", self._cache_time)
+            if now < expires_at:
+                return self._bootstrap_cache
+            if self.stale_while_revalidate and now - expires_at < self.max_staleness:
+                self._start_background_refresh()
+                return self._bootstrap_cache
+
+        return self._load_bootstrap(revalidate=force_refresh)
+
+    def refresh_bootstrap(self, wait: bool = True) -> Dict[str, Any]:
+        """
+        Refresh bootstrap-static data now, regardless of its age.
+
+        Args:
+            wait: Block until the new data has loaded; if False, refresh in
+                the background and return the current (possibly stale) data
 
-        data = self._get("/bootstrap-static/")
+        Returns:
+            The bootstrap-static data.
+        """
+        if wait or self._bootstrap_cache is None:
+            return self._load_bootstrap(revalidate=True)
+        self._start_background_refresh()
+        return self._bootstrap_cache
+
+    def _load_bootstrap(self, revalidate: bool = False) -> Dict[str, Any]:
+        data = self._get("/bootstrap-static/", revalidate=revalidate)
         self._bootstrap_cache = data
-        self._cache_time = now
+        self._cache_time = time.time()
         return data
 
+    def prewarm(self) -> bool:
+        """
+        Start from the response cache's bootstrap data without waiting on the network.
+
+        With a DiskCache left by a previous run (or baked into the image),
+        a fresh process serves its first request from that copy, under the
+        usual stale-while-revalidate rules; an expired copy is refreshed in
+        the background. With nothing cached, the load itself starts in the
+        background, and the first request waits on it rather than starting
+        another.
+
+        Returns:
+            True if cached bootstrap data was loaded.
+        """
+        if self._bootstrap_cache is not None:
+            return True
+        entry = self.cache.get(f"{self.base_url}/bootstrap-static/") if self.cache is not None else None
+        if entry is None:
+            self._start_background_refresh()
+            return False
+
+        self._bootstrap_cache = payloads.project("/bootstrap-static/", entry['body'])
+        self._cache_time = entry['stored_at']
+        self.cache.record('prewarmed')
+        if time.time() >= self.cache_policy.expires_at("/bootstrap-static/", self._cache_time):
+            self._start_background_refresh()
+        return True
+
+    def _start_background_refresh(self) -> None:
+        """Start a bootstrap refresh thread unless one is already running."""
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._background_refresh,
+                                                    name='fpl-bootstrap-refresh', daemon=True)
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self._load_bootstrap()
+            self.last_refresh_error = None
+        except Exception as e:
+            # Keep serving the stale data; the max_staleness bound still applies
+            self.last_refresh_error = e
+
+    def get_snapshot(self) -> Snapshot:
+        """
+        Get a read-only, versioned snapshot of the bootstrap and fixture data.
+
+        Inside a pinned turn this is always the pinned snapshot. Otherwise it
+        is the latest one: a new version is published whenever the
+        bootstrap-static payload (or, once a tool has used fixtures, the
+        /fixtures/ payload) changes. Like bootstrap data, fixtures are only
+        fetched again once the cache policy expires them.
+        """
+        pinned = pinned_snapshot(self)
+        if pinned is not None:
+            return pinned
+
+        data = self.get_bootstrap_static()
+        snapshot = self._snapshot
+        fixtures = self._latest_fixtures() if snapshot is not None and snapshot.fixtures_loaded else None
+        if snapshot is not None and snapshot.bootstrap_source is data and \
+                (fixtures is None or snapshot.fixtures_source is fixtures):
+            return snapshot
+
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.bootstrap_source is not data or \
+                    (fixtures is not None and snapshot.fixtures_source is not fixtures):
+                self._snapshot_version += 1
+                snapshot = Snapshot(self, self._snapshot_version, data, self._load_fixtures, fixtures)
+                self._snapshots[snapshot.version] = snapshot
+                self._snapshot = snapshot
+            return snapshot
+
+    @contextmanager
+    def pin_snapshot(self) -> Iterator[Snapshot]:
+        """
+        Pin the latest snapshot for everything run in this context (one agent turn).
+
+        Tools called in the block, including on threads and tasks started from
+        it, read the same data even if a refresh lands meanwhile.
+        """
+        with pin(self.get_snapshot()) as snapshot:
+            yield snapshot
+
+    def get_bootstrap_index(self) -> BootstrapIndex:
+        """Get the lookup index for the current (or pinned) snapshot."""
+        return self.get_snapshot().index
+
+    def get_player_table(self) -> PlayerTable:
+        """Get the columnar player table for the current (or pinned) snapshot."""
+        return self.get_snapshot().player_table
+
     def get_player_summary(self, player_id: int) -> Dict[str, Any]:
         """Get detailed summary for a specific player including fixtures and history."""
         return self._get(f"/element-summary/{player_id}/")
 
-    def get_fixtures(self, event: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get fixture data, optionally filtered by gameweek."""
+    def get_fixtures(self, event: Optional[int] = None) -> Sequence[Fixture]:
+        """Get fixture records, optionally filtered by gameweek (from the pinned snapshot in a pinned turn)."""
+        pinned = pinned_snapshot(self)
+        if pinned is not None:
+            if event:
+                return [f for f in pinned.fixtures if f.event == event]
+            return pinned.fixtures
+        return self._load_fixtures(event)
+
+    def _load_fixtures(self, event: Optional[int] = None) -> List[Fixture]:
         endpoint = "/fixtures/"
         if event:
             endpoint += f"?event={event}"
-        return self._get(endpoint)
+        fixtures = self._get(endpoint)
+        if not event:
+            self._fixtures_time = time.time()
+            if fixtures is not self._fixtures_source:
+                # Kickoff times let the cache policy tell match windows apart
+                self._fixture_kickoffs = [t for t in (parse_time(f.kickoff_time) for f in fixtures)
+                                          if t is not None]
+                self._fixtures_source = fixtures
+        return fixtures
+
+    def _latest_fixtures(self) -> List[Fixture]:
+        """Get the last loaded fixtures, fetched again only once the cache policy expires them."""
+        if self._fixtures_source is not None and \
+                time.time() < self.cache_policy.expires_at("/fixtures/", self._fixtures_time):
+            return self._fixtures_source
+        return self._load_fixtures()
+
+    def get_fixture_calendar(self) -> FixtureCalendar:
+        """
+        Get the team x gameweek fixture calendar for the current (or pinned) snapshot.
+
+        Built from a single (cached) /fixtures/ request, once per snapshot, so
+        fixture tools need no per-player requests.
+        """
+        return self.get_snapshot().fixture_calendar
 
     def get_live_gameweek(self, event: int) -> Dict[str, Any]:
         """Get live data for a specific gameweek."""
@@ -60,7 +384,7 @@ class FPLClient:
         return self._get(f"/entry/{team_id}/")
 
     def get_team_picks(self, team_id: int, event: int) -> Dict[str, Any]:
-        """Get a manager's team picks for a specific gameweek."""
+        """Get a manager's team picks (Pick records in `picks`) for a specific gameweek."""
         return self._get(f"/entry/{team_id}/event/{event}/picks/")
 
     def get_team_history(self, team_id: int) -> Dict[str, Any]:
@@ -73,47 +397,63 @@ class FPLClient:
 
     def get_current_gameweek(self) -> int:
         """Get the current gameweek number."""
-        data = self.get_bootstrap_static()
-        for event in data['events']:
-            if event['is_current']:
-                return event['id']
-        return 1
+        event = self.get_bootstrap_index().current_event
+        return event['id'] if event else 1
 
     def get_next_gameweek(self) -> int:
         """Get the next gameweek number."""
-        data = self.get_bootstrap_static()
-        for event in data['events']:
-            if event['is_next']:
-                return event['id']
-        return 1
+        event = self.get_bootstrap_index().next_event
+        return event['id'] if event else 1
 
-    def get_player_by_id(self, player_id: int) -> Optional[Dict[str, Any]]:
+    def get_player_by_id(self, player_id: int) -> Optional[Player]:
         """Get player data by ID from bootstrap-static."""
-        data = self.get_bootstrap_static()
-        for player in data['elements']:
-            if player['id'] == player_id:
-                return player
-        return None
+        return self.get_bootstrap_index().player(player_id)
 
-    def get_team_by_id(self, team_id: int) -> Optional[Dict[str, Any]]:
+    def get_team_by_id(self, team_id: int) -> Optional[Team]:
         """Get team data by ID from bootstrap-static."""
-        data = self.get_bootstrap_static()
-        for team in data['teams']:
-            if team['id'] == team_id:
-                return team
-        return None
+        return self.get_bootstrap_index().team(team_id)
+
+    def search_players(self, name: str, limit: int = 10) -> List[Player]:
+        """
+        Search for players by name: accent-insensitive exact, prefix and
+        substring matches on full name or web_name, then fuzzy matches for
+        typos. Best matches first.
+        """
+        return self.get_snapshot().search_index.search(name, limit)
+
+    def resolve_players(self, refs: List[str]) -> List[Optional[Player]]:
+        """Resolve player IDs or names to players, in order (None where nothing matches)."""
+        return self.get_snapshot().search_index.resolve(refs)
+
+
+def _is_upstream_failure(error: requests.RequestException) -> bool:
+    """Check for an outage-type error (connection, timeout, 429/5xx) rather than e.g. a 404."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRY_STATUSES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+_clients: Dict[str, FPLClient] = {}
+_clients_lock = threading.Lock()
 
-    def search_players(self, name: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search for players by name."""
-        data = self.get_bootstrap_static()
-        name_lower = name.lower()
-        matches = []
 
-        for player in data['elements']:
-            full_name = f"{player['first_name']} {player['second_name']}".lower()
-            if name_lower in full_name:
-                matches.append(player)
-                if len(matches) >= limit:
-                    break
+def get_client(base_url: Optional[str] = None) -> FPLClient:
+    """
+    Get the process-wide shared FPLClient for an API base URL.
 
-        return matches
+    All tools share one client, so they share one HTTP session, one bootstrap
+    cache and one set of in-flight requests. The shared client refreshes
+    bootstrap data in the background (stale-while-revalidate), caches
+    responses in memory (or on disk when FPL_CACHE_DIR is set), and shares
+    the process-wide rate limiter (FPL_RATE_LIMIT requests per second).
+    """
+    base_url = base_url or os.getenv('FPL_API_BASE_URL', FPLClient.BASE_URL)
+    with _clients_lock:
+        if base_url not in _clients:
+            cache_dir = os.getenv('FPL_CACHE_DIR')
+            _clients[base_url] = FPLClient(base_url,
+                                           cache=DiskCache(cache_dir) if cache_dir else MemoryCache(),
+                                           stale_while_revalidate=True,
+                                           transport=Transport(rate_limiter=get_rate_limiter(),
+                                                               breaker=CircuitBreaker()))
+        return _clients[base_url]
@@ -0,0 +1,160 @@
+"""Persistent HTTP response cache for the FPL API client."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+FOREVER = float('inf')
+
+
+class CachePolicy:
+    """
+    Per-endpoint time-to-live rules.
+
+    Endpoints for a single gameweek (live points, a manager's picks) are
+    immutable once that gameweek has finished, so they never expire.
+    """
+
+    DEFAULT_RULES: List[Tuple[str, float]] = [
+        (r'^/bootstrap-static/$', 5 * MINUTE),
+        (r'^/fixtures/', 3 * HOUR),
+        (r'^/element-summary/\d+/$', 30 * MINUTE),
+        (r'^/event/\d+/live/$', 1 * MINUTE),
+        (r'^/entry/\d+/event/\d+/picks/$', 30 * MINUTE),
+        (r'^/entry/\d+/(history|transfers)/$', 30 * MINUTE),
+        (r'^/entry/\d+/$', 15 * MINUTE),
+    ]
+    DEFAULT_TTL = 5 * MINUTE
+
+    # Endpoints whose payload is frozen once the captured gameweek has finished
+    # and its data is checked (see is_event_finished)
+    FINISHED_EVENT_PATTERNS = [
+        r'^/event/(\d+)/live/$',
+        r'^/entry/\d+/event/(\d+)/picks/$',
+    ]
+
+    def __init__(self, rules: Optional[List[Tuple[str, float]]] = None,
+                 is_event_finished: Optional[Callable[[int], bool]] = None):
+        self.rules = [(re.compile(pattern), ttl) for pattern, ttl in (rules or self.DEFAULT_RULES)]
+        self.finished_event_patterns = [re.compile(p) for p in self.FINISHED_EVENT_PATTERNS]
+        self.is_event_finished = is_event_finished
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the time-to-live in seconds for an endpoint's cached response."""
+        if self.is_event_finished:
+            for pattern in self.finished_event_patterns:
+                match = pattern.match(endpoint)
+                if match and self.is_event_finished(int(match.group(1))):
+                    return FOREVER
+
+        for pattern, ttl in self.rules:
+            if pattern.match(endpoint):
+                return ttl
+        return self.DEFAULT_TTL
+
+    def expires_at(self, endpoint: str, stored_at: float) -> float:
+        """Get the epoch time at which a response stored at `stored_at` goes stale."""
+        return stored_at + self.ttl_for(endpoint)
+
+
+class ResponseCache:
+    """
+    Storage interface for cached responses.
+
+    Entries are dicts with `body` (decoded JSON), `etag`, `last_modified`,
+    `stored_at` (epoch seconds) and `size` (bytes on the wire).
+    """
+
+    def __init__(self):
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, url: str, entry: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def record(self, event: str, amount: int = 1) -> None:
+        """Count a cache event (hit, miss, revalidated, bytes_saved, ...)."""
+        with self._stats_lock:
+            self.stats[event] += amount
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit/miss/revalidation counts and bandwidth figures."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+
+class MemoryCache(ResponseCache):
+    """In-process response cache (lost on restart), evicting least recently used entries."""
+
+    def __init__(self, max_entries: int = 4096):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _encode_record(obj: Any) -> Dict[str, Any]:
+    """Serialize typed records (anything with to_dict) as plain dicts."""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+class DiskCache(ResponseCache):
+    """
+    Response cache stored as one JSON file per URL, surviving restarts.
+
+    Bodies come back as plain JSON, so callers re-project them into records.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, url: str, entry: Dict[str, Any]) -> None:
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=_encode_record)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
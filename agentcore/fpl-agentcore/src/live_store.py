@@ -0,0 +1,108 @@
+"""Shared, indexed store of live gameweek points."""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from async_fpl_client import AsyncFPLClient, get_async_client, run_sync
+from fpl_client import FPLClient, get_client
+
+
+class LiveGameweek:
+    """
+    One gameweek's live stats as arrays indexed by player ID.
+
+    `points[player_id]` and `minutes[player_id]` replace a scan over the
+    payload's `elements`; `present[player_id]` is False for IDs missing from it.
+    """
+
+    def __init__(self, event: int, data: Dict[str, Any], finished: bool = False):
+        self.event = event
+        self.finished = finished
+
+        elements = data['elements']
+        size = max((e['id'] for e in elements), default=0) + 1
+        ids = np.fromiter((e['id'] for e in elements), dtype=np.int32, count=len(elements))
+        self.points = np.zeros(size, dtype=np.int16)
+        self.minutes = np.zeros(size, dtype=np.int16)
+        self.present = np.zeros(size, dtype=bool)
+        self.points[ids] = np.fromiter((e['stats']['total_points'] for e in elements),
+                                       dtype=np.int16, count=len(elements))
+        self.minutes[ids] = np.fromiter((e['stats']['minutes'] for e in elements),
+                                        dtype=np.int16, count=len(elements))
+        self.present[ids] = True
+
+    def points_for(self, player_id: int) -> Optional[int]:
+        """Get a player's points, or None if the player has no live entry."""
+        if 0 <= player_id < len(self.present) and self.present[player_id]:
+            return int(self.points[player_id])
+        return None
+
+
+class LiveGameweekStore:
+    """
+    Live gameweek data shared by all managers.
+
+    Finished gameweeks are immutable, so they are kept forever as
+    LiveGameweek arrays and served without touching the client. Gameweeks
+    still in progress go through the client and its cache policy every time.
+    """
+
+    def __init__(self, client: Optional[FPLClient] = None, async_client: Optional[AsyncFPLClient] = None):
+        self.client = client or get_client()
+        self.async_client = async_client or get_async_client(self.client)
+        self._finished: Dict[int, LiveGameweek] = {}
+        self._lock = threading.Lock()
+
+    def _is_finished(self, event: int) -> bool:
+        event_data = self.client.get_bootstrap_index().event(event)
+        return bool(event_data and event_data['finished'])
+
+    def _store(self, event: int, data: Dict[str, Any]) -> LiveGameweek:
+        finished = self._is_finished(event)
+        live = LiveGameweek(event, data, finished)
+        if finished:
+            with self._lock:
+                live = self._finished.setdefault(event, live)
+        return live
+
+    def get(self, event: int) -> LiveGameweek:
+        """Get one gameweek's live data."""
+        live = self._finished.get(event)
+        if live is not None:
+            return live
+        return self._store(event, self.client.get_live_gameweek(event))
+
+    def get_many(self, events: Iterable[int]) -> Dict[int, LiveGameweek]:
+        """
+        Get live data for several gameweeks, fetching the missing ones concurrently.
+
+        Gameweeks that fail to load are left out of the result.
+        """
+        events = list(dict.fromkeys(events))
+        result = {event: self._finished[event] for event in events if event in self._finished}
+        missing = [event for event in events if event not in result]
+        if missing:
+            payloads = run_sync(self.async_client.get_live_gameweeks(missing, return_exceptions=True))
+            for event, data in payloads.items():
+                if not isinstance(data, Exception):
+                    result[event] = self._store(event, data)
+        return {event: result[event] for event in events if event in result}
+
+    def cached_events(self) -> List[int]:
+        """Get the finished gameweeks currently held."""
+        return sorted(self._finished)
+
+
+_stores: Dict[FPLClient, LiveGameweekStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_live_store(client: Optional[FPLClient] = None) -> LiveGameweekStore:
+    """Get the process-wide live store for a client (the shared client by default)."""
+    client = client or get_client()
+    with _stores_lock:
+        if client not in _stores:
+            _stores[client] = LiveGameweekStore(client)
+        return _stores[client]
@@ -5,36 +5,45 @@ This uses the bedrock-agentcore-sdk-python to properly integrate
 with AgentCore's memory, runtime, and gateway services.
 """
 
+import asyncio
 import os
 import re
+import threading
+from functools import partial
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Import AgentCore SDK
-try:
-    from bedrock_agentcore import BedrockAgentCoreApp
-except ImportError:
-    print("Installing bedrock-agentcore SDK...")
-    import subprocess
-    subprocess.check_call(['pip', 'install', 'bedrock-agentcore-sdk-python'])
-    from bedrock_agentcore import BedrockAgentCoreApp
+# Import AgentCore SDK (a dependency of the image: agentcore_requirements.txt)
+from bedrock_agentcore import BedrockAgentCoreApp
 
 # Import your Strands agent
-from agent import create_fpl_agent
+from agent import create_fpl_agent, prewarm, stream_turn
+from sessions import AgentPool
 
 # Create the AgentCore app wrapper
 app = BedrockAgentCoreApp()
 
-# Initialize your Strands agent
-fpl_agent = create_fpl_agent()
+# Importing Strands and the tools and loading FPL data (from FPL_CACHE_DIR
+# when set) happen on a background thread while the server starts, rather
+# than before it listens or on the first request
+threading.Thread(target=prewarm, name='fpl-prewarm', daemon=True).start()
+
+# One Strands agent per session, so conversations stay apart and sessions
+# run concurrently; idle sessions are dropped, and the least recently used
+# past FPL_MAX_SESSIONS
+agents = AgentPool(
+    partial(create_fpl_agent, quiet=True),
+    max_sessions=int(os.getenv('FPL_MAX_SESSIONS', '100')),
+    idle_timeout=float(os.getenv('FPL_SESSION_IDLE_TIMEOUT', '1800')),
+)
 
 
 @app.entrypoint()
-def handler(request):
+async def handler(request):
     """
-    AgentCore entrypoint for processing requests.
+    AgentCore entrypoint for processing requests, streaming the response.
 
     AgentCore automatically handles:
     - Memory management (conversation history)
@@ -49,8 +58,14 @@ def handler(request):
             - request.memory: Access to AgentCore Memory service
             - request.user: User identity info
 
-    Returns:
-        Response text from the agent
+    Yields:
+        Events as they happen, streamed to the client:
+            - {'type': 'text', 'text': ...}: the next chunk of the response
+            - {'type': 'tool', 'name': ..., 'status': ...}: a tool call
+              'started', then finished with 'success' or 'error'
+
+    The turn runs on the event loop and its tools on worker threads, so one
+    worker serves many sessions at once.
     """
 
     # Get user input
@@ -62,25 +77,35 @@ def handler(request):
     # AgentCore Memory: Get conversation history (short-term memory)
     # This is automatically maintained by AgentCore across the session
     try:
-        conversation_history = request.memory.get_messages(limit=10)
+        conversation_history = await asyncio.to_thread(request.memory.get_messages, limit=10)
         print(f"Conversation history: {len(conversation_history)} messages")
     except Exception as e:
         print(f"Memory access: {e}")
         conversation_history = []
 
     # AgentCore Memory: Retrieve any long-term context (e.g., user's FPL team ID)
+    user_team_id = None
     try:
-        user_team_id = request.memory.get("fpl_team_id")
+        user_team_id = await asyncio.to_thread(request.memory.get, "fpl_team_id")
         if user_team_id:
             print(f"User's FPL Team ID from memory: {user_team_id}")
-            # You could set this as an env var for the agent if needed
-            os.environ['FPL_TEAM_ID'] = user_team_id
     except Exception as e:
         print(f"Long-term memory access: {e}")
 
-    # Invoke your Strands agent
-    # The agent processes the request with its own internal logic
-    response = fpl_agent(user_message)
+    # Invoke this session's Strands agent
+    # The agent processes the request with its own internal logic, on one
+    # pinned FPL data snapshot for the whole turn; its team tools default to
+    # the session's team ID (not the process-wide FPL_TEAM_ID). Simple lookups
+    # ("search Haaland", "chips left?") go straight to their tool, skipping the model,
+    # and questions already answered on the same FPL data come from the answer cache
+    async with agents.session_async(request.session_id, team_id=user_team_id or None) as fpl_agent:
+        # A new agent for this session (first turn on this container, or the
+        # session was evicted) picks the conversation up from AgentCore Memory;
+        # its conversation manager keeps the history within FPL_CONTEXT_MAX_TOKENS
+        from conversation import seed_history   # Imports Strands, so not at startup
+        seed_history(fpl_agent, conversation_history)
+        async for event in stream_turn(fpl_agent, user_message, use_fast_path=True, use_answer_cache=True):
+            yield event
 
     # AgentCore Memory: Store important info for future sessions (long-term memory)
     # Example: If user mentions their team ID, save it
@@ -90,7 +115,7 @@ def handler(request):
         if team_id_match:
             team_id = team_id_match.group()
             try:
-                request.memory.save("fpl_team_id", team_id)
+                await asyncio.to_thread(request.memory.save, "fpl_team_id", team_id)
                 print(f"Saved team ID to long-term memory: {team_id}")
             except Exception as e:
                 print(f"Failed to save to memory: {e}")
@@ -98,8 +123,6 @@ def handler(request):
     # Note: Conversation history (short-term memory) is automatically saved by AgentCore
     # You don't need to manually save the current message/response
 
-    return response
-
 
 if __name__ == "__main__":
     # For local testing
@@ -121,8 +144,17 @@ if __name__ == "__main__":
                 break
 
             request = MockRequest(user_input)
-            response = handler(request)
-            print(f"\nAssistant: {response}")
+            print("\nAssistant: ", end="", flush=True)
+
+            async def print_stream():
+                async for event in handler(request):
+                    if event['type'] == 'text':
+                        print(event['text'], end="", flush=True)
+                    elif event['status'] == 'started':
+                        print(f"\n[{event['name']}...]", flush=True)
+                print()
+
+            asyncio.run(print_stream())
 
         except KeyboardInterrupt:
             break
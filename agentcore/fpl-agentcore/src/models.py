@@ -0,0 +1,136 @@
+"""Compact typed records for FPL API data."""
+
+from typing import Any, Dict, FrozenSet
+
+
+def _to_float(value) -> float:
+    """Parse the API's numeric strings ('5.3', '' or None) as floats."""
+    return float(value) if value else 0.0
+
+
+class Record:
+    """
+    Base for __slots__ records built from API dicts.
+
+    Fields keep the API's key names, so `player['form']` becomes `player.form`.
+    FLOAT_FIELDS are parsed from the API's decimal strings once, on
+    construction. Records are read-only once built, so snapshots can share
+    them without copying.
+    """
+
+    __slots__ = ()
+    FLOAT_FIELDS: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # (name, slot setter, parse as float) per field; the slot descriptors
+        # write past the read-only __setattr__ below
+        cls._fields = tuple((name, getattr(cls, name).__set__, name in cls.FLOAT_FIELDS)
+                            for name in cls.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    @classmethod
+    def from_api(cls, data: Any) -> 'Record':
+        """Build a record from an API dict (a record is returned unchanged)."""
+        if isinstance(data, cls):
+            return data
+        record = cls.__new__(cls)
+        for name, set_field, is_float in cls._fields:
+            value = data.get(name)
+            set_field(record, _to_float(value) if is_float else value)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the record as an API-shaped dict (e.g. for JSON serialization)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({getattr(self, self.__slots__[0])!r})"
+
+
+class Player(Record):
+    """A bootstrap element, limited to the fields the tools use."""
+
+    __slots__ = (
+        'id', 'code', 'first_name', 'second_name', 'web_name', 'team', 'element_type', 'status', 'news',
+        'chance_of_playing_next_round', 'now_cost', 'cost_change_start', 'cost_change_event',
+        'form', 'points_per_game', 'total_points', 'event_points', 'ep_next', 'selected_by_percent',
+        'transfers_in_event', 'transfers_out_event', 'minutes', 'starts', 'goals_scored', 'assists',
+        'clean_sheets', 'goals_conceded', 'saves', 'bonus', 'bps', 'yellow_cards', 'red_cards',
+        'influence', 'creativity', 'threat', 'ict_index', 'expected_goals', 'expected_assists',
+    )
+    FLOAT_FIELDS = frozenset({
+        'form', 'points_per_game', 'ep_next', 'selected_by_percent', 'influence', 'creativity',
+        'threat', 'ict_index', 'expected_goals', 'expected_assists',
+    })
+
+    @property
+    def price(self) -> float:
+        """Price in £m."""
+        return self.now_cost / 10
+
+
+class Team(Record):
+    """A Premier League club from bootstrap-static."""
+
+    __slots__ = (
+        'id', 'code', 'name', 'short_name', 'strength',
+        'strength_overall_home', 'strength_overall_away', 'strength_attack_home',
+        'strength_attack_away', 'strength_defence_home', 'strength_defence_away',
+        'position', 'played', 'win', 'draw', 'loss', 'points',
+    )
+
+
+class Fixture(Record):
+    """A fixture from /fixtures/ (match stats omitted)."""
+
+    __slots__ = (
+        'id', 'code', 'event', 'team_h', 'team_a', 'team_h_difficulty', 'team_a_difficulty',
+        'kickoff_time', 'started', 'finished', 'team_h_score', 'team_a_score', 'minutes',
+    )
+
+
+class TeamFixture:
+    """A fixture from one club's point of view, as element-summary lists them."""
+
+    __slots__ = ('fixture', 'is_home', 'opponent', 'difficulty')
+
+    def __init__(self, fixture: Fixture, is_home: bool):
+        self.fixture = fixture
+        self.is_home = is_home
+        self.opponent = fixture.team_a if is_home else fixture.team_h
+        self.difficulty = fixture.team_h_difficulty if is_home else fixture.team_a_difficulty
+
+    @property
+    def id(self) -> int:
+        return self.fixture.id
+
+    @property
+    def event(self):
+        return self.fixture.event
+
+    @property
+    def kickoff_time(self):
+        return self.fixture.kickoff_time
+
+    @property
+    def finished(self) -> bool:
+        return self.fixture.finished
+
+    @property
+    def team(self) -> int:
+        return self.fixture.team_h if self.is_home else self.fixture.team_a
+
+    def __repr__(self) -> str:
+        return f"TeamFixture({self.fixture.id!r}, is_home={self.is_home!r})"
+
+
+class Pick(Record):
+    """One squad slot from a manager's gameweek picks."""
+
+    __slots__ = ('element', 'position', 'multiplier', 'is_captain', 'is_vice_captain')
@@ -0,0 +1,75 @@
+"""JSON decoding and projection of FPL API payloads into compact records."""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
+from models import Fixture, Pick, Player, Team
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard library decoder
+    orjson = None
+
+
+# Player fields read by the tools; the API sends ~90 per player.
+PLAYER_FIELDS = Player.__slots__
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _already_projected(items: List[Any], record_type: type) -> bool:
+    return bool(items) and isinstance(items[0], record_type)
+
+
+def project_bootstrap(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn bootstrap elements into Player records and teams into Team records; events stay dicts."""
+    if _already_projected(data['elements'], Player):
+        return data
+    return {
+        **data,
+        'elements': [Player.from_api(p) for p in data['elements']],
+        'teams': [Team.from_api(t) for t in data['teams']],
+    }
+
+
+def project_fixtures(fixtures: List[Any]) -> List[Fixture]:
+    """Turn /fixtures/ entries into Fixture records."""
+    if _already_projected(fixtures, Fixture):
+        return fixtures
+    return [Fixture.from_api(f) for f in fixtures]
+
+
+def project_picks(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a manager's gameweek picks into Pick records; the rest of the payload is unchanged."""
+    if _already_projected(data['picks'], Pick):
+        return data
+    return {**data, 'picks': [Pick.from_api(p) for p in data['picks']]}
+
+
+# Endpoint pattern -> projection applied after decoding, and again to bodies
+# read back from a serialized (disk) cache
+PROJECTIONS: List[Tuple[re.Pattern, Callable[[Any], Any]]] = [
+    (re.compile(r'^/bootstrap-static/$'), project_bootstrap),
+    (re.compile(r'^/fixtures/'), project_fixtures),
+    (re.compile(r'^/entry/\d+/event/\d+/picks/$'), project_picks),
+]
+
+
+def project(endpoint: str, body: Any) -> Any:
+    """Project a decoded body into records if the endpoint has a projection (idempotent)."""
+    for pattern, projection in PROJECTIONS:
+        if pattern.match(endpoint):
+            return projection(body)
+    return body
+
+
+def decode(endpoint: str, content: bytes) -> Any:
+    """Decode an endpoint's response body and project it into records."""
+    return project(endpoint, loads(content))
+
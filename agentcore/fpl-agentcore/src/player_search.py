@@ -0,0 +1,174 @@
+"""Accent-insensitive prefix, substring and fuzzy player name search."""
+
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from models import Player
+
+
+# Letters NFKD does not decompose into a base letter plus accents
+_FOLDS = str.maketrans({
+    'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ß': 'ss', 'đ': 'd', 'ð': 'd',
+    'þ': 'th', 'ł': 'l', 'ı': 'i', 'ħ': 'h',
+})
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+# Match tiers, best first
+EXACT, PREFIX, SUBSTRING, FUZZY = range(4)
+
+# Minimum difflib similarity ratio for a fuzzy word match
+FUZZY_THRESHOLD = 0.75
+
+
+def normalize_name(name: str) -> str:
+    """Fold a name to lowercase ASCII words: 'Ødegaard' -> 'odegaard', 'Heung-min' -> 'heung min'."""
+    text = unicodedata.normalize('NFKD', name.lower().translate(_FOLDS))
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(' ', text).strip()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _padded_trigrams(token: str) -> Set[str]:
+    return _trigrams(f" {token} ")
+
+
+class PlayerSearchIndex:
+    """
+    Name search over one snapshot's players.
+
+    Built once per data snapshot (see Snapshot.search_index). Every player is
+    searchable by accent-folded full name and web_name:
+
+    - exact: the query is the player's web_name, full name or surname
+    - prefix: every query word starts one of the player's name words
+      (bisect over the sorted word list)
+    - substring: the query appears inside the full name or web_name
+      (candidates from a trigram index, then checked)
+    - fuzzy, when nothing else matches: words with a difflib ratio of at
+      least FUZZY_THRESHOLD, among those sharing a trigram (typos, swaps)
+
+    Results are ranked by tier, then by total points.
+    """
+
+    def __init__(self, players: Sequence[Player], version: int = 0):
+        self.version = version
+        self.players = list(players)
+        self.by_id: Dict[int, Player] = {p.id: p for p in self.players}
+
+        self.full_names: List[str] = []
+        self.web_names: List[str] = []
+        self.exact: Dict[str, Set[int]] = defaultdict(set)
+        self.grams: Dict[str, Set[int]] = defaultdict(set)   # substring trigrams -> rows
+        word_rows: Dict[str, Set[int]] = defaultdict(set)
+
+        for row, player in enumerate(self.players):
+            full = normalize_name(f"{player.first_name} {player.second_name}")
+            web = normalize_name(player.web_name or '')
+            self.full_names.append(full)
+            self.web_names.append(web)
+            for name in (full, web, normalize_name(player.second_name or '')):
+                self.exact[name].add(row)
+            for gram in _trigrams(full) | _trigrams(web):
+                self.grams[gram].add(row)
+            for word in set(full.split()) | set(web.split()):
+                word_rows[word].add(row)
+
+        # Sorted vocabulary for prefix ranges; padded trigrams of each word
+        # narrow fuzzy matching down to plausible candidates
+        self.words: List[str] = sorted(word_rows)
+        self.word_rows: List[Set[int]] = [word_rows[w] for w in self.words]
+        self.fuzzy_grams: Dict[str, List[int]] = defaultdict(list)
+        for i, word in enumerate(self.words):
+            for gram in _padded_trigrams(word):
+                self.fuzzy_grams[gram].append(i)
+
+    def _prefix_rows(self, word: str) -> Set[int]:
+        rows: Set[int] = set()
+        i = bisect_left(self.words, word)
+        while i < len(self.words) and self.words[i].startswith(word):
+            rows |= self.word_rows[i]
+            i += 1
+        return rows
+
+    def _substring_rows(self, query: str) -> Set[int]:
+        grams = _trigrams(query)
+        if not grams:
+            return set()
+        postings = sorted((self.grams.get(g, set()) for g in grams), key=len)
+        candidates = set.intersection(*postings)
+        return {r for r in candidates if query in self.full_names[r] or query in self.web_names[r]}
+
+    def _fuzzy_scores(self, words: List[str]) -> Dict[int, float]:
+        """Mean over query words of the best word similarity, per row."""
+        totals: Dict[int, float] = defaultdict(float)
+        for word in words:
+            candidates = {i for g in _padded_trigrams(word) for i in self.fuzzy_grams.get(g, ())}
+            matcher = SequenceMatcher(b=word)
+            best: Dict[int, float] = {}
+            for i in candidates:
+                matcher.set_seq1(self.words[i])
+                if matcher.real_quick_ratio() < FUZZY_THRESHOLD or matcher.quick_ratio() < FUZZY_THRESHOLD:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= FUZZY_THRESHOLD:
+                    for row in self.word_rows[i]:
+                        best[row] = max(best.get(row, 0.0), ratio)
+            for row, score in best.items():
+                totals[row] += score
+        return {row: total / len(words) for row, total in totals.items()
+                if total / len(words) >= FUZZY_THRESHOLD}
+
+    def match(self, query: str, fuzzy: bool = True) -> List[Tuple[int, float, Player]]:
+        """Get every (tier, score, player) match for a query, best first."""
+        q = normalize_name(query)
+        if not q:
+            return []
+        words = q.split()
+
+        tiers: Dict[int, Tuple[int, float]] = {}
+
+        def add(rows: Iterable[int], tier: int, score: float = 1.0) -> None:
+            for row in rows:
+                if row not in tiers or (tier, -score) < (tiers[row][0], -tiers[row][1]):
+                    tiers[row] = (tier, score)
+
+        add(self.exact.get(q, ()), EXACT)
+        prefix = set.intersection(*(self._prefix_rows(w) for w in words))
+        add(prefix, PREFIX)
+        add(self._substring_rows(q), SUBSTRING)
+        if fuzzy and len(tiers) == 0:
+            for row, score in self._fuzzy_scores(words).items():
+                add((row,), FUZZY, score)
+
+        ranked = sorted(tiers.items(), key=lambda item: (item[1][0], -item[1][1],
+                                                         -(self.players[item[0]].total_points or 0),
+                                                         self.players[item[0]].id))
+        return [(tier, score, self.players[row]) for row, (tier, score) in ranked]
+
+    def search(self, query: str, limit: int = 10, fuzzy: bool = True) -> List[Player]:
+        """Get the best-matching players for a name query."""
+        return [player for _, _, player in self.match(query, fuzzy)[:limit]]
+
+    def resolve(self, refs: Iterable[str]) -> List[Optional[Player]]:
+        """
+        Resolve player references, each a player ID or a name, to players.
+
+        Names resolve to their best match (None if nothing matches), so
+        'salah, Odegaard, 351' gives three players in order.
+        """
+        players = []
+        for ref in refs:
+            ref = str(ref).strip()
+            if ref.isdigit():
+                players.append(self.by_id.get(int(ref)))
+            else:
+                matches = self.search(ref, limit=1)
+                players.append(matches[0] if matches else None)
+        return players
@@ -0,0 +1,77 @@
+"""Columnar NumPy view of bootstrap players for vectorized screening."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+from models import Player
+
+
+class PlayerTable:
+    """
+    Struct-of-arrays player table, one row per bootstrap element.
+
+    Built once per data snapshot (see FPLClient.get_snapshot) from
+    Player records, so screening tools become boolean masks plus a top-k
+    selection.
+    """
+
+    def __init__(self, elements: Sequence[Player], version: int = 0):
+        self.version = version
+        self.players: List[Player] = list(elements)
+        n = len(self.players)
+
+        def column(key, dtype):
+            return np.fromiter((getattr(p, key) for p in self.players), dtype=dtype, count=n)
+
+        self.id = column('id', np.int32)
+        self.cost = column('now_cost', np.int32)              # tenths of £m
+        self.price = self.cost / 10                            # £m, same arithmetic as now_cost / 10
+        self.cost_change_start = column('cost_change_start', np.int32)
+        self.form = column('form', np.float64)
+        self.ownership = column('selected_by_percent', np.float64)
+        self.total_points = column('total_points', np.int32)
+        self.position = column('element_type', np.int8)
+        self.team = column('team', np.int16)
+        self.status = np.array([p.status for p in self.players], dtype='<U1')
+        self.available = self.status == 'a'
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def rows(self, mask: np.ndarray) -> np.ndarray:
+        """Get row numbers where a boolean mask is set, in bootstrap order."""
+        return np.flatnonzero(mask)
+
+    def top_k(self, rows: np.ndarray, k: int, *keys: np.ndarray) -> np.ndarray:
+        """
+        Select the best `k` rows, ordered by `keys` descending.
+
+        The first key is primary and later keys break ties; remaining ties keep
+        bootstrap order, matching a stable `sort(..., reverse=True)`.
+
+        Args:
+            rows: Candidate row numbers (ascending)
+            k: Number of rows to return
+            keys: Full-length columns to rank by
+
+        Returns:
+            Up to `k` row numbers, best first.
+        """
+        if k <= 0 or len(rows) == 0:
+            return rows[:0]
+
+        if len(rows) > k:
+            # argpartition finds the k-th best primary value in O(n); keep every
+            # row tied with it so the exact ordering below stays correct.
+            primary = keys[0][rows]
+            threshold = primary[np.argpartition(-primary, k - 1)[:k]].min()
+            rows = rows[primary >= threshold]
+
+        # lexsort treats its last key as primary and is stable
+        order = np.lexsort(tuple(-key[rows] for key in reversed(keys)))
+        return rows[order][:k]
+
+    def players_at(self, rows: np.ndarray) -> List[Player]:
+        """Get the player records for a list of row numbers."""
+        return [self.players[row] for row in rows]
@@ -0,0 +1,105 @@
+"""Expected points for every player over the coming gameweeks, vectorized over the player table."""
+
+from typing import Optional
+
+import numpy as np
+
+from fixture_calendar import FixtureCalendar
+from player_table import PlayerTable
+
+
+# Points per appearance: a blend of recent form, the season's points per
+# game and attacking involvement (ICT index per 90 minutes)
+FORM_WEIGHT = 0.4
+PPG_WEIGHT = 0.4
+ICT_WEIGHT = 0.2
+ICT_POINTS = 0.5            # Points per unit of ICT index per 90
+
+# Per fixture: x(1 + FDR_STEP * (3 - FDR)), +/- HOME_ADVANTAGE at home / away
+FDR_STEP = 0.1
+HOME_ADVANTAGE = 0.05
+
+# Availability after the next gameweek, by status (chance_of_playing_next_round
+# covers the next one): injured and suspended players are assumed half likely
+# to be back; players who left ('u') or are on loan ('n') score nothing
+LATER_AVAILABILITY = {'a': 1.0, 'd': 1.0, 'i': 0.5, 's': 0.5}
+
+HORIZON = 8                 # Gameweeks projected
+
+
+class Projections:
+    """
+    Expected points per player per gameweek, for every player at once.
+
+    Built once per data snapshot (see Snapshot.projections) from the player
+    table and fixture calendar. The horizon starts at `first_event`, the
+    next deadline's gameweek, so fixtures already under way are never
+    counted. `points[row, i]` is the expected points of player table row
+    `row` in gameweek `events[i]`:
+
+        P(plays) x availability x points per appearance x fixture factor
+
+    P(plays) is the share of the club's finished matches' minutes the player
+    played. The fixture factor sums over the club's fixtures that gameweek, so
+    a blank projects 0 and a double about twice a single fixture.
+    """
+
+    def __init__(self, table: PlayerTable, calendar: FixtureCalendar, first_event: int, version: int = 0,
+                 horizon: int = HORIZON):
+        self.version = version
+        self.table = table
+        self.events = np.arange(first_event, first_event + horizon)
+        self._rows = {int(player_id): row for row, player_id in enumerate(table.id)}
+
+        # Team x gameweek fixture factor, zero-padded past the season and for
+        # clubs without fixtures
+        n_teams = max(int(table.team.max(initial=0)) + 1, calendar.counts.shape[0])
+        factor = np.zeros((n_teams, horizon))
+        played = np.zeros(n_teams)
+        for team, fixtures in calendar.by_team.items():
+            played[team] = sum(1 for f in fixtures if f.finished)
+        events = self.events[self.events < calendar.counts.shape[1]]
+        if len(events):
+            counts = calendar.counts[:, events].astype(np.float64)
+            home = calendar.home[:, events].astype(np.float64)
+            difficulty = calendar.difficulty[:, events].astype(np.float64)
+            factor[:counts.shape[0], :len(events)] = (counts * (1 + FDR_STEP * 3 - HOME_ADVANTAGE)
+                                                      - FDR_STEP * difficulty + 2 * HOME_ADVANTAGE * home)
+
+        players = table.players
+        n = len(players)
+        minutes = np.fromiter((p.minutes for p in players), dtype=np.float64, count=n)
+        ppg = np.fromiter((p.points_per_game for p in players), dtype=np.float64, count=n)
+        ict = np.fromiter((p.ict_index for p in players), dtype=np.float64, count=n)
+        chance = np.fromiter((p.chance_of_playing_next_round if p.chance_of_playing_next_round is not None
+                              else 100 if p.status in ('a', 'd') else 0 for p in players), dtype=np.float64, count=n)
+        later = np.fromiter((LATER_AVAILABILITY.get(p.status, 0.0) for p in players), dtype=np.float64, count=n)
+
+        team_played = played[table.team]
+        plays = np.where(team_played > 0, np.clip(minutes / (90 * np.maximum(team_played, 1)), 0, 1), 1.0)
+        ict_per_90 = ict / np.maximum(minutes, 90) * 90
+        per_appearance = FORM_WEIGHT * table.form + PPG_WEIGHT * ppg + ICT_WEIGHT * ICT_POINTS * ict_per_90
+
+        availability = np.repeat(later[:, None], horizon, axis=1)
+        availability[:, 0] = chance / 100
+        self.points = (plays * per_appearance)[:, None] * availability * factor[table.team]
+
+    def total(self, gameweeks: int = 5) -> np.ndarray:
+        """Get every player's expected points over the next `gameweeks` (a player table column)."""
+        return self.points[:, :max(0, gameweeks)].sum(axis=1)
+
+    def gameweek(self, event: int) -> np.ndarray:
+        """Get every player's expected points in one gameweek (zeros outside the horizon)."""
+        i = event - int(self.events[0])
+        if not 0 <= i < self.points.shape[1]:
+            return np.zeros(self.points.shape[0])
+        return self.points[:, i]
+
+    def player(self, player_id: int, event: Optional[int] = None, gameweeks: int = 5) -> float:
+        """Get a player's expected points in one gameweek, or over the next `gameweeks`."""
+        row = self._rows.get(player_id)
+        if row is None:
+            return 0.0
+        if event is not None:
+            return float(self.gameweek(event)[row])
+        return float(self.points[row, :max(0, gameweeks)].sum())
@@ -0,0 +1,146 @@
+"""Deterministic intent router: maps simple lookups straight to one tool, without the LLM."""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+
+POSITIONS = {
+    'goalkeeper': 'GK', 'keeper': 'GK', 'gk': 'GK',
+    'defender': 'DEF', 'def': 'DEF',
+    'midfielder': 'MID', 'mid': 'MID',
+    'forward': 'FWD', 'striker': 'FWD', 'fwd': 'FWD',
+    'player': 'all',
+}
+
+# Tools that act for the session's team; routed only when a team is known,
+# so the agent can ask for one otherwise
+TEAM_TOOLS = frozenset({
+    'get_my_current_team', 'get_my_team_summary', 'get_chips_status', 'get_transfer_status',
+    'get_transfer_history', 'get_gameweek_briefing',
+})
+
+# Words that never appear in a player name: a "name" with one of them is a
+# question for the agent ("find me cheap defenders", "compare Salah and Saka for captain")
+_NOT_NAME_WORDS = frozenset("""
+    a about all an and any are best budget by can captain captaincy cheap cheapest differential differentials
+    do does for form good have i in is it me mid midfielder midfielders my of on or out players points
+    price should some team than the this under value vs week what which who why with worth you your
+    defender defenders forward forwards goalkeeper goalkeepers keeper keepers striker strikers fixtures
+    transfer transfers gameweek gw next
+""".split())
+
+_NAME = re.compile(r"[^\W\d_][\w'.-]*(?: [^\W\d_][\w'.-]*){0,3}")
+_LEADING = re.compile(r"^(?:(?:hey|hi|ok|okay|please|pls|can you|could you|would you|quickly)[,\s]+)+", re.I)
+_TRAILING = re.compile(r"(?:[\s,]+(?:please|pls|thanks|thank you))+$", re.I)
+
+
+def normalize(message: str) -> str:
+    """Trim a message to its request: no politeness words, closing punctuation or extra spaces."""
+    text = ' '.join(message.replace('’', "'").split())
+    text = text.rstrip('?!. ')
+    text = _LEADING.sub('', text)
+    return _TRAILING.sub('', text).rstrip('?!. ')
+
+
+def _name(text: Optional[str]) -> Optional[str]:
+    """The text as a player name (1-4 words, no digits), or None if it reads like anything else."""
+    if not text or not _NAME.fullmatch(text):
+        return None
+    if any(word.lower().strip(".'") in _NOT_NAME_WORDS for word in text.split()):
+        return None
+    return text
+
+
+def _position(word: str) -> Optional[str]:
+    word = word.lower()
+    if word not in POSITIONS and word.endswith('s'):
+        word = word[:-1]
+    return POSITIONS.get(word)
+
+
+def _fixed(**arguments: Any) -> Callable[[re.Match], Dict[str, Any]]:
+    return lambda match: dict(arguments)
+
+
+def _search(match: re.Match) -> Optional[Dict[str, Any]]:
+    name = _name(match['name'])
+    return {'name': name} if name else None
+
+
+def _compare(match: re.Match) -> Optional[Dict[str, Any]]:
+    first, second = _name(match['first']), _name(match['second'])
+    return {'player_ids': f"{first},{second}"} if first and second else None
+
+
+def _top(match: re.Match) -> Optional[Dict[str, Any]]:
+    limit = int(match['limit']) if match['limit'] else 10
+    position = _position(match['position'])
+    if position is None or not 1 <= limit <= 50:
+        return None
+    return {'position': position, 'limit': limit}
+
+
+_MY_TEAM = r"(?:team|squad|side|line-?up|players)"
+_POSITION_WORDS = r"goalkeepers?|keepers?|gks?|defenders?|defs?|midfielders?|mids?|forwards?|strikers?|fwds?|players"
+
+# (pattern the whole normalized message must match, tool, arguments from the
+# match or None to leave the message to the agent). Case-insensitive.
+_ROUTES = [
+    (r"(?:search for|search player|search|find player|find|look ?up) (?P<name>.+)",
+     'search_player', _search),
+    (rf"(?:(?:show|view|see|display|get|list)(?: me)? )?my (?:current )?{_MY_TEAM}"
+     rf"|(?:what(?:'s| is)|who(?:'s| is) in) my (?:current )?{_MY_TEAM}"
+     rf"|what does my (?:current )?{_MY_TEAM} look like",
+     'get_my_current_team', _fixed()),
+    (r"(?:(?:show|get)(?: me)? )?my (?:team )?(?:summary|overall rank|rank|total points|points)"
+     r"|what(?:'s| is) my (?:overall )?rank|how many points do i have",
+     'get_my_team_summary', _fixed()),
+    (r"(?:what |which )?chips(?: do i have)?(?: left| remaining| available)?"
+     r"|(?:what|which) chips (?:do i have|have i got|have i used|are left|remain)(?: left)?"
+     r"|(?:(?:show|get)(?: me)? )?my chips(?: status)?|chips? status|have i used my (?:wildcard|chips)",
+     'get_chips_status', _fixed()),
+    (r"how many (?:free )?(?:transfers|fts) (?:do i have|have i got)(?: left)?(?: this (?:week|gameweek|gw))?"
+     r"|(?:my )?(?:free transfers|transfer status)|what(?:'s| is) my transfer status|do i have a free transfer",
+     'get_transfer_status', _fixed()),
+    (r"(?:(?:show|get)(?: me)? )?my (?:transfer history|past transfers|transfers)|what transfers have i made",
+     'get_transfer_history', _fixed()),
+    (r"(?:(?:any|show|show me|check)(?: the)? )?price (?:changes|rises|falls)(?: today| tonight)?"
+     r"|who(?:'s| is) (?:rising|falling) in price",
+     'check_price_changes', _fixed()),
+    (r"(?:who (?:are|is) the )?most captained(?: players)?|who is everyone captaining",
+     'get_most_captained_players', _fixed()),
+    (rf"(?:(?:show|show me|list|get)(?: the)? )?top (?:(?P<limit>\d{{1,2}}) )?(?P<position>{_POSITION_WORDS})"
+     r"(?: by (?:total )?points)?",
+     'get_top_players', _top),
+    (r"compare (?P<first>.+?) (?:and|vs\.?|versus|with|to) (?P<second>.+)", 'compare_players', _compare),
+    (r"(?P<first>.+?) (?:vs\.?|versus) (?P<second>.+)", 'compare_players', _compare),
+    (r"(?:(?:give me|show me|get)(?: my| the| a)? )?(?:(?:gameweek|gw) )?briefing"
+     r"|(?:my |the )?(?:gameweek|gw) (?:briefing|overview)",
+     'get_gameweek_briefing', _fixed()),
+]
+ROUTES: List[Tuple[Pattern, str, Callable[[re.Match], Optional[Dict[str, Any]]]]] = [
+    (re.compile(pattern, re.I), tool, arguments) for pattern, tool, arguments in _ROUTES
+]
+
+
+def route(message: str, team_known: bool = True) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Route a simple lookup to the one tool that answers it.
+
+    Only whole-message matches count, so anything with more to it ("search
+    Haaland and tell me if he's worth it") is left to the agent, as are team
+    lookups when no team is known.
+
+    Returns:
+        (tool name, arguments), or None to run the agent.
+    """
+    text = normalize(message)
+    for pattern, tool, arguments in ROUTES:
+        match = pattern.fullmatch(text)
+        if match is None:
+            continue
+        if tool in TEAM_TOOLS and not team_known:
+            return None
+        routed = arguments(match)
+        return (tool, routed) if routed is not None else None
+    return None
@@ -0,0 +1,191 @@
+"""Per-session agents, and the FPL team each session's tools act for."""
+
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+
+# The team ID of the session whose turn is running; copied into the threads
+# and tasks the turn runs tools on, like any context variable
+_team_id: ContextVar[Optional[str]] = ContextVar('fpl_team_id', default=None)
+
+
+def current_team_id() -> Optional[str]:
+    """
+    Get the team ID tools act for when called without one.
+
+    Set per session with use_team(); otherwise the FPL_TEAM_ID environment
+    variable, for the single-user CLI.
+    """
+    team_id = _team_id.get()
+    if team_id is not None:
+        return team_id
+    return os.getenv('FPL_TEAM_ID')
+
+
+@contextmanager
+def use_team(team_id: Optional[str]) -> Iterator[None]:
+    """Make tools default to this team ID inside the block (None keeps the current default)."""
+    if team_id is None:
+        yield
+        return
+    token = _team_id.set(str(team_id))
+    try:
+        yield
+    finally:
+        _team_id.reset(token)
+
+
+class _Session:
+    """One session's agent, the lock serializing its turns, and its team ID."""
+
+    __slots__ = ('agent', 'lock', 'team_id', 'last_used', 'active')
+
+    def __init__(self, agent: Any):
+        self.agent = agent
+        self.lock = threading.Lock()
+        self.team_id: Optional[str] = None
+        self.last_used = time.monotonic()
+        self.active = 0
+
+
+async def _acquire_async(lock: threading.Lock) -> None:
+    """Acquire a thread lock without blocking the event loop, waiting on a worker thread if it's held."""
+    if lock.acquire(blocking=False):
+        return
+    acquire = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # The thread still takes the lock: hand it straight back
+        acquire.add_done_callback(lambda _: lock.release())
+        raise
+
+
+class AgentPool:
+    """
+    Thread-safe pool of one agent per session.
+
+    Each session gets its own agent, so conversations never share history,
+    and turns of different sessions run concurrently; turns of one session
+    run one at a time. Sessions idle for longer than idle_timeout seconds are
+    dropped, and past max_sessions the least recently used idle session is.
+    A session with a turn in flight is never evicted, so the pool may briefly
+    exceed max_sessions when that many turns are running at once.
+    """
+
+    def __init__(self, factory: Callable[[], Any], max_sessions: int = 100, idle_timeout: float = 30 * 60):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions: 'OrderedDict[str, _Session]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def _checkout(self, session_id: str) -> _Session:
+        with self._lock:
+            self._evict(time.monotonic())
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+                session.active += 1
+                return session
+        # Build the agent outside the lock; a concurrent first turn of the
+        # same session keeps whichever agent is stored first
+        agent = self.factory()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = _Session(agent)
+                self.created += 1
+            self._sessions.move_to_end(session_id)
+            session.active += 1
+            self._evict(time.monotonic())
+            return session
+
+    def _checkin(self, session: _Session) -> None:
+        with self._lock:
+            session.active -= 1
+            session.last_used = time.monotonic()
+
+    def _evict(self, now: float) -> None:
+        # Caller holds self._lock
+        for session_id, session in list(self._sessions.items()):
+            if not session.active and now - session.last_used > self.idle_timeout:
+                del self._sessions[session_id]
+                self.evictions += 1
+        while len(self._sessions) > self.max_sessions:
+            idle = next((sid for sid, s in self._sessions.items() if not s.active), None)
+            if idle is None:
+                break
+            del self._sessions[idle]
+            self.evictions += 1
+
+    @contextmanager
+    def session(self, session_id: str, team_id: Optional[str] = None) -> Iterator[Any]:
+        """
+        Hold a session's agent for one turn, with tools defaulting to its team.
+
+        A team_id given here is remembered for the session's later turns.
+        """
+        session = self._checkout(session_id)
+        try:
+            with session.lock:
+                if team_id is not None:
+                    session.team_id = str(team_id)
+                with use_team(session.team_id):
+                    yield session.agent
+        finally:
+            self._checkin(session)
+
+    @asynccontextmanager
+    async def session_async(self, session_id: str, team_id: Optional[str] = None) -> AsyncIterator[Any]:
+        """
+        Like session(), for async handlers: waits for the session's previous
+        turn without blocking the event loop.
+        """
+        session = self._checkout(session_id)
+        try:
+            await _acquire_async(session.lock)
+            try:
+                if team_id is not None:
+                    session.team_id = str(team_id)
+                with use_team(session.team_id):
+                    yield session.agent
+            finally:
+                session.lock.release()
+        finally:
+            self._checkin(session)
+
+    def evict(self, session_id: str) -> bool:
+        """Drop a session (its next turn starts a new conversation); False if unknown or busy."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None or session.active:
+                return False
+            del self._sessions[session_id]
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the number of live, busy and created sessions, and evictions so far."""
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'active': sum(1 for s in self._sessions.values() if s.active),
+                'created': self.created,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,141 @@
+"""Immutable, versioned snapshots of FPL data, pinned for one agent turn."""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence
+
+from bootstrap_index import BootstrapIndex
+from fixture_calendar import FixtureCalendar
+from models import Fixture
+from player_search import PlayerSearchIndex
+from player_table import PlayerTable
+from projections import Projections
+
+
+def freeze_bootstrap(data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Get a read-only view of a bootstrap-static payload (tuples and mapping proxies)."""
+    return MappingProxyType({
+        **data,
+        'elements': tuple(data['elements']),
+        'teams': tuple(data['teams']),
+        'events': tuple(MappingProxyType(e) for e in data['events']),
+    })
+
+
+class Snapshot:
+    """
+    One consistent, read-only version of the bootstrap-static and fixture data.
+
+    FPLClient publishes a new snapshot, with the next version, whenever either
+    payload changes; a published snapshot never changes. Its player table,
+    name search index and fixture calendar are built on first use, once per
+    snapshot. Fixtures are bound on first use too, so tools that only need
+    bootstrap data never fetch them.
+
+    The client keeps only the latest snapshot; older versions live exactly as
+    long as a pinned turn (or a caller) still references them.
+    """
+
+    def __init__(self, owner: Any, version: int, bootstrap: Dict[str, Any],
+                 load_fixtures: Callable[[], List[Fixture]],
+                 fixtures: Optional[List[Fixture]] = None):
+        self.owner = owner
+        self.version = version
+        self.bootstrap_source = bootstrap
+        self.bootstrap = freeze_bootstrap(bootstrap)
+        self.index = BootstrapIndex(self.bootstrap, version)
+        self._load_fixtures = load_fixtures
+        self.fixtures_source: Optional[List[Fixture]] = fixtures
+        self._fixtures = tuple(fixtures) if fixtures is not None else None
+        self._player_table: Optional[PlayerTable] = None
+        self._search_index: Optional[PlayerSearchIndex] = None
+        self._fixture_calendar: Optional[FixtureCalendar] = None
+        self._projections: Optional[Projections] = None
+        self._lock = threading.Lock()
+
+    @property
+    def fixtures_loaded(self) -> bool:
+        """Whether fixtures have been bound to this snapshot yet."""
+        return self._fixtures is not None
+
+    @property
+    def fixtures(self) -> Sequence[Fixture]:
+        """All fixture records, fetched (from cache) and bound on first use."""
+        if self._fixtures is None:
+            with self._lock:
+                if self._fixtures is None:
+                    self.fixtures_source = self._load_fixtures()
+                    self._fixtures = tuple(self.fixtures_source)
+        return self._fixtures
+
+    @property
+    def player_table(self) -> PlayerTable:
+        """The columnar player table for this snapshot's players."""
+        if self._player_table is None:
+            with self._lock:
+                if self._player_table is None:
+                    self._player_table = PlayerTable(self.bootstrap['elements'], self.version)
+        return self._player_table
+
+    @property
+    def search_index(self) -> PlayerSearchIndex:
+        """The player name search index for this snapshot's players."""
+        if self._search_index is None:
+            with self._lock:
+                if self._search_index is None:
+                    self._search_index = PlayerSearchIndex(self.bootstrap['elements'], self.version)
+        return self._search_index
+
+    @property
+    def fixture_calendar(self) -> FixtureCalendar:
+        """The team x gameweek fixture calendar for this snapshot's fixtures."""
+        if self._fixture_calendar is None:
+            fixtures = self.fixtures
+            with self._lock:
+                if self._fixture_calendar is None:
+                    self._fixture_calendar = FixtureCalendar(fixtures, self.version)
+        return self._fixture_calendar
+
+    @property
+    def projections(self) -> Projections:
+        """Every player's expected points over the coming gameweeks, from this snapshot's data."""
+        if self._projections is None:
+            table, calendar = self.player_table, self.fixture_calendar
+            with self._lock:
+                if self._projections is None:
+                    self._projections = Projections(table, calendar, self.index.next_deadline_event,
+                                                    self.version)
+        return self._projections
+
+    @property
+    def label(self) -> str:
+        """The line tool results end with, naming this snapshot's version."""
+        return f"[FPL data snapshot v{self.version}]"
+
+    def __repr__(self) -> str:
+        return f"Snapshot(v{self.version})"
+
+
+# The snapshot pinned by the current agent turn; copied into the threads and
+# tasks the turn runs tools on, like any context variable
+_pinned: ContextVar[Optional[Snapshot]] = ContextVar('fpl_snapshot', default=None)
+
+
+def pinned_snapshot(owner: Any) -> Optional[Snapshot]:
+    """Get the snapshot of `owner` (an FPLClient) pinned in this context, if any."""
+    snapshot = _pinned.get()
+    if snapshot is not None and snapshot.owner is owner:
+        return snapshot
+    return None
+
+
+@contextmanager
+def pin(snapshot: Snapshot) -> Iterator[Snapshot]:
+    """Make every read from the snapshot's client in this context use `snapshot`."""
+    token = _pinned.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _pinned.reset(token)
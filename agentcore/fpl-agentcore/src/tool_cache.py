@@ -0,0 +1,193 @@
+"""Memoization of tool results, keyed by arguments, team and data snapshot version."""
+
+import functools
+import inspect
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from fpl_client import get_client
+from sessions import current_team_id
+from snapshot import pin
+from tool_output import output_settings
+
+
+class ToolFailure(Exception):
+    """
+    Raised by a tool whose result reports a failure: the FPL API failed, or
+    data it needs could not be fetched. memoize_tool returns the message as
+    the tool's result but never caches it, so the call is retried next time.
+    """
+
+
+# Names of the tools that failed in the current agent turn (see record_failures)
+_failures: ContextVar[Optional[List[str]]] = ContextVar('fpl_tool_failures', default=None)
+
+
+@contextmanager
+def record_failures() -> Iterator[List[str]]:
+    """Collect the names of the memoized tools that fail in this context (one agent turn)."""
+    failures: List[str] = []
+    token = _failures.set(failures)
+    try:
+        yield failures
+    finally:
+        _failures.reset(token)
+
+
+def _normalize(value: Any) -> Hashable:
+    """Normalize an argument for the cache key: trimmed, space-collapsed strings."""
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    return value
+
+
+class ToolResultCache:
+    """
+    Thread-safe LRU cache of tool result strings.
+
+    Keys are (tool, normalized arguments, team ID, snapshot version, output
+    settings), with no team ID for tools that don't depend on the manager's
+    team: a new data snapshot changes every key, so results never
+    outlive the data they were computed from. Team-specific API data
+    (picks, history, transfers) has its own cache lifetime, so entries also
+    expire after max_age seconds. Bounded by entry count and by total
+    result size.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 2_000_000, max_age: float = 10 * 60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._entries: 'OrderedDict[Tuple, Tuple[str, float]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+        self.evictions = 0
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """Get a cached result, or None (and count the hit or miss for the key's tool)."""
+        tool = key[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.max_age:
+                self._entries.move_to_end(key)
+                self.hits[tool] += 1
+                return entry[0]
+            if entry is not None:
+                self._remove(key)
+            self.misses[tool] += 1
+            return None
+
+    def put(self, key: Tuple, result: str) -> None:
+        """Store a result, evicting least recently used entries past the bounds."""
+        size = len(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (result, time.monotonic())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Tuple) -> None:
+        result, _ = self._entries.pop(key)
+        self._bytes -= len(result)
+
+    def clear(self) -> None:
+        """Drop every cached result (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-tool hits, misses and hit rates, plus the cache's size."""
+        with self._lock:
+            tools = {}
+            for tool in sorted(set(self.hits) | set(self.misses)):
+                hits, misses = self.hits[tool], self.misses[tool]
+                tools[tool] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}
+            return {
+                'tools': tools,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'evictions': self.evictions,
+            }
+
+
+_cache = ToolResultCache()
+
+
+def get_tool_cache() -> ToolResultCache:
+    """Get the process-wide tool result cache."""
+    return _cache
+
+
+def memoize_tool(func: Optional[Callable[..., str]] = None, *,
+                 team_scoped: bool = True) -> Callable[..., str]:
+    """
+    Memoize a tool function's result in the shared ToolResultCache.
+
+    Apply it under @tool, so Strands still sees the original signature and
+    docstring. The tool runs pinned to the snapshot its key names, so a
+    refresh landing mid-call cannot file newer data under an older version.
+
+    Results are keyed by the team the tool acts for (its team_id, else the
+    session's team). Tools whose results don't depend on the manager's
+    team declare it with @memoize_tool(team_scoped=False), and their results
+    are shared across sessions.
+    """
+    if func is None:
+        return functools.partial(memoize_tool, team_scoped=team_scoped)
+
+    signature = inspect.signature(func)
+    if not team_scoped and 'team_id' in signature.parameters:
+        raise TypeError(f"{func.__name__} takes a team_id, so its results can't be shared across teams")
+
+    def call(*args, **kwargs) -> Tuple[str, bool]:
+        """Run the tool: (result, whether it failed)."""
+        try:
+            return func(*args, **kwargs), False
+        except ToolFailure as failure:
+            failures = _failures.get()
+            if failures is not None:
+                failures.append(func.__name__)
+            return str(failure), True
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> str:
+        try:
+            snapshot = get_client().get_snapshot()
+        except Exception:
+            # No data to key on; the tool reports the API error itself
+            return call(*args, **kwargs)[0]
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        team_id = None
+        if team_scoped:
+            # Omitting team_id means the session's team: key both calls the same
+            team_id = bound.arguments.get('team_id') or current_team_id()
+            team_id = _normalize(str(team_id)) if team_id is not None else None
+        arguments = tuple((name, team_id if name == 'team_id' else _normalize(value))
+                          for name, value in bound.arguments.items())
+        key = (func.__name__, arguments, team_id, snapshot.version, output_settings())
+
+        result = _cache.get(key)
+        if result is None:
+            with pin(snapshot):
+                result, failed = call(*args, **kwargs)
+            if isinstance(result, str) and not failed:
+                _cache.put(key, result)
+        return result
+
+    return wrapper
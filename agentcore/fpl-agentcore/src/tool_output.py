@@ -0,0 +1,266 @@
+"""Structured tool results, rendered verbose, compact or as JSON within a token budget."""
+
+import functools
+import json
+import logging
+import math
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+VERBOSE, COMPACT, JSON = 'verbose', 'compact', 'json'
+MODES = (VERBOSE, COMPACT, JSON)
+
+# (mode, token budget) for the current turn, when set with use_output()
+_settings: ContextVar[Optional[Tuple[str, Optional[int]]]] = ContextVar('tool_output', default=None)
+
+# Word, digit-run, newline-run, indentation and symbol pieces of a text
+_TOKEN_PIECES = re.compile(r"[A-Za-z]+|\d+|\n+| {2,}|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate a text's LLM token count.
+
+    Words count one token per 4 letters, digit runs one per 3 digits,
+    newline runs and indentation one each, and every other symbol one
+    (two if non-ASCII, like '£' and '★'). Close enough to compare renderings
+    and enforce budgets without a model-specific tokenizer.
+    """
+    tokens = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        first = piece[0]
+        if first.isascii() and first.isalpha():
+            tokens += math.ceil(len(piece) / 4)
+        elif first.isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        else:
+            tokens += 1 if first.isascii() else 2
+    return tokens
+
+
+def output_settings() -> Tuple[str, Optional[int]]:
+    """
+    Get the (mode, token budget) tool results are rendered with.
+
+    Set for a turn or session with use_output(); otherwise from the
+    FPL_TOOL_OUTPUT ('verbose', 'compact' or 'json') and FPL_TOOL_TOKEN_BUDGET
+    environment variables. Defaults to verbose with no budget; unknown
+    modes and budgets that aren't a positive integer are logged and ignored.
+    """
+    settings = _settings.get()
+    if settings is not None:
+        return settings
+    return _env_settings(os.getenv('FPL_TOOL_OUTPUT', VERBOSE), os.getenv('FPL_TOOL_TOKEN_BUDGET'))
+
+
+@functools.lru_cache(maxsize=8)
+def _env_settings(mode: str, budget: Optional[str]) -> Tuple[str, Optional[int]]:
+    """Parse the environment's output settings (once per value), warning about bad ones."""
+    mode = mode.strip().lower()
+    if mode not in MODES:
+        logger.warning("Ignoring FPL_TOOL_OUTPUT=%r: expected one of %s", mode, ', '.join(MODES))
+        mode = VERBOSE
+    if not budget or not budget.strip():
+        return mode, None
+    try:
+        tokens = int(budget)
+    except ValueError:
+        tokens = 0
+    if tokens <= 0:
+        logger.warning("Ignoring FPL_TOOL_TOKEN_BUDGET=%r: expected a positive number of tokens", budget)
+        return mode, None
+    return mode, tokens
+
+
+@contextmanager
+def use_output(mode: str = VERBOSE, budget: Optional[int] = None) -> Iterator[None]:
+    """Render tool results in this mode, within this token budget, inside the block."""
+    if mode not in MODES:
+        raise ValueError(f"Unknown tool output mode '{mode}' (use one of {', '.join(MODES)})")
+    token = _settings.set((mode, budget))
+    try:
+        yield
+    finally:
+        _settings.reset(token)
+
+
+def _cell(value: Any) -> str:
+    """Format a value for a compact table cell."""
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        return format(value, 'g')
+    if isinstance(value, (list, tuple)):
+        return ' '.join(_cell(v) for v in value)
+    return str(value).replace('|', '/')
+
+
+class Text:
+    """Fixed text of a result (headings, notes, summaries); never truncated."""
+
+    __slots__ = ('verbose', 'compact')
+
+    def __init__(self, verbose: str, compact: Optional[str] = None):
+        self.verbose = verbose
+        self.compact = compact
+
+
+class Fields:
+    """Named values shown together, like a player's statistics; never truncated."""
+
+    __slots__ = ('name', 'values', 'verbose')
+
+    def __init__(self, name: str, values: Dict[str, Any], verbose: Union[str, Callable[[Dict[str, Any]], str]]):
+        self.name = name
+        self.values = values
+        self.verbose = verbose
+
+
+class Table:
+    """
+    Rows of one kind of item, like a list of players.
+
+    Each row is a dict: `columns` are the keys shown in compact and JSON
+    output, and `verbose` (a format string or a function of the row) renders
+    one row as prose and may use any key. Rows are added best first, so a
+    token budget drops them from the end, down to `keep` rows.
+    """
+
+    __slots__ = ('name', 'columns', 'verbose', 'keep', 'rows')
+
+    def __init__(self, name: str, columns: Sequence[str],
+                 verbose: Union[str, Callable[[Dict[str, Any]], str]], keep: int = 1):
+        self.name = name
+        self.columns = tuple(columns)
+        self.verbose = verbose
+        self.keep = keep
+        self.rows: List[Dict[str, Any]] = []
+
+    def add(self, **values: Any) -> None:
+        """Add a row."""
+        self.rows.append(values)
+
+
+def _verbose(template: Union[str, Callable[[Dict[str, Any]], str]], values: Dict[str, Any]) -> str:
+    return template(values) if callable(template) else template.format(**values)
+
+
+class ToolResult:
+    """
+    A tool's result as text, fields and tables, in display order.
+
+    render() gives the original prose (verbose), dense '|' tables with short
+    keys (compact), or JSON; with a token budget, rows are dropped from the
+    longest tables first, and each truncated table says how many were cut.
+    """
+
+    def __init__(self):
+        self.blocks: List[Union[Text, Fields, Table]] = []
+
+    def text(self, verbose: str, compact: Optional[str] = None) -> None:
+        """Add text; compact and JSON output use `compact`, or skip it if None."""
+        self.blocks.append(Text(verbose, compact))
+
+    def fields(self, name: str, verbose: Union[str, Callable[[Dict[str, Any]], str]], /, **values: Any) -> None:
+        """Add named values."""
+        self.blocks.append(Fields(name, values, verbose))
+
+    def table(self, name: str, columns: Sequence[str],
+              verbose: Union[str, Callable[[Dict[str, Any]], str]], keep: int = 1) -> Table:
+        """Add a table and return it, for adding rows."""
+        table = Table(name, columns, verbose, keep)
+        self.blocks.append(table)
+        return table
+
+    def render(self, mode: Optional[str] = None, budget: Optional[int] = None, footer: Optional[str] = None) -> str:
+        """
+        Render the result.
+
+        Args:
+            mode: VERBOSE, COMPACT or JSON (default: the current output_settings())
+            budget: Token budget, footer included (default: the current output_settings())
+            footer: A last line, like the data snapshot's label, set off by a blank line
+
+        Returns:
+            The rendered result, with rows cut to fit the budget where possible.
+        """
+        default_mode, default_budget = output_settings()
+        mode = mode or default_mode
+        budget = default_budget if budget is None else budget
+
+        shown = [len(block.rows) if isinstance(block, Table) else 0 for block in self.blocks]
+        text = self._render(mode, shown, footer)
+        while budget is not None and estimate_tokens(text) > budget:
+            # Cut a row from the table showing the most rows (the later one on ties)
+            cuttable = [i for i, block in enumerate(self.blocks)
+                        if isinstance(block, Table) and shown[i] > block.keep]
+            if not cuttable:
+                break
+            shown[max(cuttable, key=lambda i: (shown[i], i))] -= 1
+            text = self._render(mode, shown, footer)
+        return text
+
+    def _render(self, mode: str, shown: List[int], footer: Optional[str]) -> str:
+        if mode == JSON:
+            text = self._render_json(shown)
+        elif mode == COMPACT:
+            text = self._render_compact(shown)
+        else:
+            text = self._render_verbose(shown)
+        return f"{text.rstrip()}\n\n{footer}\n" if footer else text
+
+    def _render_verbose(self, shown: List[int]) -> str:
+        parts = []
+        for block, count in zip(self.blocks, shown):
+            if isinstance(block, Text):
+                parts.append(block.verbose)
+            elif isinstance(block, Fields):
+                parts.append(_verbose(block.verbose, block.values))
+            else:
+                parts.extend(_verbose(block.verbose, row) for row in block.rows[:count])
+                if count < len(block.rows):
+                    parts.append(f"(+{len(block.rows) - count} more not shown)\n\n")
+        return ''.join(parts)
+
+    def _render_compact(self, shown: List[int]) -> str:
+        lines = []
+        for block, count in zip(self.blocks, shown):
+            if isinstance(block, Text):
+                if block.compact is not None:
+                    lines.append(block.compact)
+            elif isinstance(block, Fields):
+                values = ' '.join(f"{key}={_cell(value)}" for key, value in block.values.items())
+                lines.append(f"{block.name}: {values}")
+            elif block.rows:
+                lines.append(block.name)
+                lines.append('|'.join(block.columns))
+                lines.extend('|'.join(_cell(row.get(column)) for column in block.columns)
+                             for row in block.rows[:count])
+                if count < len(block.rows):
+                    lines.append(f"+{len(block.rows) - count} more")
+        return '\n'.join(lines) + '\n'
+
+    def _render_json(self, shown: List[int]) -> str:
+        items = []
+        for block, count in zip(self.blocks, shown):
+            if isinstance(block, Text):
+                if block.compact is not None:
+                    items.append(block.compact)
+            elif isinstance(block, Fields):
+                items.append({'n': block.name, **block.values})
+            elif block.rows:
+                item = {
+                    'n': block.name,
+                    'c': block.columns,
+                    'r': [[row.get(column) for column in block.columns] for row in block.rows[:count]],
+                }
+                if count < len(block.rows):
+                    item['more'] = len(block.rows) - count
+                items.append(item)
+        return json.dumps(items, ensure_ascii=False, separators=(',', ':')) + '\n'
@@ -0,0 +1,153 @@
+"""Composite gameweek briefing tool for FPL Assistant."""
+
+import asyncio
+
+from strands import tool
+from fpl_client import get_client
+from tool_cache import ToolFailure, memoize_tool
+from tool_output import ToolResult
+from async_fpl_client import get_async_client, run_sync
+from tools.team_tools import chip_usage, count_free_transfers, fixture_code
+from tools.captain_tools import fixture_rating, rank_captains
+from sessions import current_team_id
+
+
+client = get_client()
+async_client = get_async_client(client)
+
+
+async def fetch_briefing_data(team_id: int, current_gw: int):
+    """Fetch a manager's entry, picks and history concurrently."""
+    return await asyncio.gather(
+        async_client.get_team_info(team_id),
+        async_client.get_team_picks(team_id, current_gw),
+        async_client.get_team_history(team_id),
+    )
+
+
+@tool
+@memoize_tool
+def get_gameweek_briefing(team_id: str = None, num_gameweeks: int = 5) -> str:
+    """
+    Get a one-call briefing for the coming gameweek: your squad with upcoming fixtures,
+    captain picks, free transfers, bank and chips.
+
+    Use this first for broad questions like "what should I do this week?" instead of
+    calling the team, fixture, captain, transfer status and chips tools one by one.
+
+    Args:
+        team_id: Your FPL team ID (optional if set in environment variable)
+        num_gameweeks: Number of upcoming gameweeks of fixtures to show (default: 5)
+
+    Returns:
+        Compact briefing: squad and fixtures, captain ranking, transfers and chips.
+    """
+    if not team_id:
+        team_id = current_team_id()
+
+    if not team_id:
+        return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
+
+    try:
+        team_id = int(team_id)
+    except ValueError:
+        return "Invalid team ID"
+
+    try:
+        snapshot = client.get_snapshot()
+        index = snapshot.index
+        current_gw = client.get_current_gameweek()
+        next_gw = client.get_next_gameweek()
+
+        # One concurrent pass over everything the briefing needs
+        team_info, picks, history = run_sync(fetch_briefing_data(team_id, current_gw))
+    except Exception as e:
+        raise ToolFailure(f"Error fetching gameweek briefing: {str(e)}")
+
+    calendar = snapshot.fixture_calendar
+    gw = next_gw if next_gw > current_gw else current_gw
+    first_gw = calendar.next_event or current_gw
+    gameweeks = range(first_gw, first_gw + num_gameweeks)
+
+    current_event = index.current_event
+    gw_finished = current_event.get('finished', False) if current_event else False
+    next_event = index.next_event
+    entry_history = picks.get('entry_history', {})
+    used, available = chip_usage(history)
+
+    result = ToolResult()
+    result.text(f"=== GW{gw} Briefing: {team_info['name']} ===\n\n", f"GW{gw} briefing: {team_info['name']}")
+
+    status = {
+        'deadline': next_event['deadline_time'] if next_event else None,
+        'free_transfers': count_free_transfers(history, current_gw) if gw_finished and next_event else 'unknown',
+        'bank': entry_history.get('bank', 0) / 10,
+        'value': team_info['last_deadline_value'] / 10,
+        'chips_left': ', '.join(available) or 'none',
+        'active_chip': picks.get('active_chip') or 'none',
+    }
+    result.fields("Status",
+                  lambda values: f"Deadline: {values['deadline'] or 'n/a'}\n"
+                                 f"Free transfers: {values['free_transfers']}"
+                                 f"{'' if gw_finished else ' (gameweek in progress - check the FPL app)'}\n"
+                                 f"Bank: £{values['bank']:.1f}m | Squad value: £{values['value']:.1f}m\n"
+                                 f"Chips available: {values['chips_left']}"
+                                 f"{' | Used: ' + ', '.join(f'{name} GW{event}' for name, event in used) if used else ''}\n"
+                                 f"Active chip: {values['active_chip']}\n\n",
+                  **status)
+
+    # The squad with each player's next fixtures; always shown whole
+    result.text(f"Squad (fixtures GW{first_gw}-{first_gw + num_gameweeks - 1}, - = blank):\n")
+    squad = result.table("squad", ('role', 'id', 'pos', 'name', 'cap', 'team', 'price', 'form', 'pts', 'status',
+                                   'fixtures', 'avg_diff'),
+                         lambda row: f"  {'' if row['role'] == 'XI' else '(bench) '}{row['pos']} {row['name']}"
+                                     f"{' (' + row['cap'] + ')' if row['cap'] else ''} - {row['team']} "
+                                     f"£{row['price']}m | Form {row['form']} | {row['pts']} pts"
+                                     f"{' | ' + row['news'] if row['news'] else ''}\n"
+                                     f"      {' '.join(row['fixtures'])} (avg {row['avg_diff']})\n",
+                         keep=len(picks['picks']))
+
+    for position, pick in enumerate(picks['picks']):
+        player = index.player(pick.element)
+        if not player:
+            continue
+
+        fixtures = []
+        difficulties = []
+        for event in gameweeks:
+            upcoming = [f for f in calendar.gameweek(player.team, event) if not f.finished]
+            if not upcoming and calendar.fixture_count(player.team, event) == 0:
+                fixtures.append("-")
+                continue
+            fixtures.append('+'.join(fixture_code(index, f) for f in upcoming) or "played")
+            difficulties.extend(f.difficulty for f in upcoming)
+
+        captain = "C" if pick.is_captain else "VC" if pick.is_vice_captain else ""
+        squad.add(role="XI" if position < 11 else "bench", id=player.id,
+                  pos=index.position_name(player.element_type), name=player.web_name, cap=captain,
+                  team=index.team_short_name(player.team), price=player.now_cost / 10, form=player.form, pts=player.total_points,
+                  status=player.status, news=player.news, fixtures=fixtures,
+                  avg_diff=round(sum(difficulties) / len(difficulties), 1) if difficulties else None)
+
+    # Captaincy for the coming gameweek
+    captain_candidates, blanks = rank_captains(index, calendar, picks, gw)
+    result.text(f"\nCaptain picks for GW{gw}:\n")
+    captains = result.table("captains", ('rank', 'id', 'name', 'fixtures', 'form', 'score'),
+                            "  {rank}. {name} {fixture_text} | Form {form} | Score {score}\n")
+    for i, candidate in enumerate(captain_candidates[:3], 1):
+        player = candidate['player']
+        codes = [fixture_code(index, f) for f in candidate['fixtures']]
+        captains.add(rank=i, id=player.id, name=player.web_name, fixtures=codes, fixture_text=' '.join(codes),
+                     form=player.form, score=round(candidate['score'], 1))
+
+    if blanks:
+        names = ', '.join(p.web_name for p in blanks)
+        result.text(f"  Blank in GW{gw}: {names}\n", f"Blank GW{gw}: {names}")
+
+    if captain_candidates:
+        top_pick = captain_candidates[0]
+        rating = fixture_rating(top_pick['difficulty'])
+        result.text(f"\nRecommendation: Captain {top_pick['player'].web_name} ({rating} fixture)\n",
+                    f"Recommendation: {top_pick['player'].web_name} ({rating} fixture)")
+
+    return result.render(footer=snapshot.label)
@@ -1,27 +1,95 @@
 """Captain selection tools for FPL Assistant."""
 
 from strands import tool
-from fpl_client import FPLClient
-from typing import List, Dict, Any
-import os
+from fpl_client import get_client
+from tool_cache import ToolFailure, memoize_tool
+from tool_output import ToolResult
+from async_fpl_client import get_async_client, run_sync
+from live_store import get_live_store
+from tools.team_tools import fixture_code
+from sessions import current_team_id
+from typing import List, Dict, Any, Tuple
 
 
-client = FPLClient()
+client = get_client()
+async_client = get_async_client(client)
+live_store = get_live_store(client)
+
+
+def rank_captains(index, calendar, picks: Dict[str, Any], gw: int,
+                  projections=None) -> Tuple[List[Dict[str, Any]], List[Any]]:
+    """
+    Rank a squad's starting XI as captains for a gameweek, on form and fixtures.
+
+    Args:
+        index: The snapshot's BootstrapIndex
+        calendar: The snapshot's FixtureCalendar
+        picks: The manager's picks payload
+        gw: The captaincy gameweek
+        projections: The snapshot's Projections, to score players by their
+            expected points in the gameweek instead
+
+    Returns:
+        Candidates ({'player', 'fixtures', 'difficulty', 'score'}), best first,
+        and the starters with no fixture in the gameweek.
+    """
+    captain_candidates = []
+    blanks = []
+
+    starters = [index.player(pick.element) for pick in picks['picks'][:11]]  # Starting XI only
+    starters = [player for player in starters if player]
+
+    for player in starters:
+        # All of the club's fixtures in the captaincy gameweek (two in a double)
+        fixtures = [f for f in calendar.gameweek(player.team, gw) if not f.finished]
+
+        if not fixtures:
+            if calendar.fixture_count(player.team, gw) == 0:
+                blanks.append(player)
+            continue
+
+        # Calculate captain score (lower difficulty is better), per fixture played
+        form_score = player.form
+        fixture_score = sum(6 - f.difficulty for f in fixtures)  # Invert difficulty (easier = higher score)
+        home_bonus = 0.5 * sum(1 for f in fixtures if f.is_home)
+
+        captain_score = (form_score * 2) * len(fixtures) + fixture_score + home_bonus
+        if projections is not None:
+            captain_score = projections.player(player.id, event=gw)
+
+        captain_candidates.append({
+            'player': player,
+            'fixtures': fixtures,
+            'difficulty': max(f.difficulty for f in fixtures),
+            'score': captain_score
+        })
+
+    # Sort by captain score
+    captain_candidates.sort(key=lambda x: x['score'], reverse=True)
+    return captain_candidates, blanks
+
+
+def fixture_rating(difficulty: int) -> str:
+    """Describe a fixture difficulty for a captaincy recommendation."""
+    return 'easy' if difficulty <= 2 else 'favorable' if difficulty == 3 else 'tough'
 
 
 @tool
-def suggest_captain(team_id: str = None) -> str:
+@memoize_tool
+def suggest_captain(team_id: str = None, projected: bool = False) -> str:
     """
     Suggest the best captain choice from your current team based on fixtures and form.
 
     Args:
         team_id: Your FPL team ID (optional if set in environment variable)
+        projected: Rank by projected points for the gameweek (form, minutes,
+            ICT, fixture difficulty, doubles) instead of the captain score
 
     Returns:
         Recommended captain choices with reasoning based on fixtures and form.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -38,140 +106,130 @@ def suggest_captain(team_id: str = None) -> str:
         gw = next_gw if next_gw > current_gw else current_gw
         picks = client.get_team_picks(team_id, current_gw)
     except Exception as e:
-        return f"Error fetching team: {str(e)}"
+        raise ToolFailure(f"Error fetching team: {str(e)}")
 
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    calendar = snapshot.fixture_calendar
 
     # Analyze each player in the starting XI
-    captain_candidates = []
-
-    for pick in picks['picks'][:11]:  # Starting XI only
-        player = client.get_player_by_id(pick['element'])
-        if not player:
-            continue
-
-        summary = client.get_player_summary(pick['element'])
-        fixtures = summary.get('fixtures', [])
-
-        if not fixtures:
-            continue
-
-        # Get next fixture
-        next_fixture = fixtures[0]
-        is_home = next_fixture['is_home']
-        opponent_id = next_fixture['team_a'] if is_home else next_fixture['team_h']
-        opponent = teams_map.get(opponent_id, 'Unknown')
-        difficulty = next_fixture['difficulty']
-
-        # Calculate captain score (lower difficulty is better)
-        form_score = float(player['form']) if player['form'] else 0
-        fixture_score = (6 - difficulty)  # Invert difficulty (easier = higher score)
-        home_bonus = 0.5 if is_home else 0
-
-        captain_score = (form_score * 2) + fixture_score + home_bonus
-
-        captain_candidates.append({
-            'player': player,
-            'fixture': next_fixture,
-            'is_home': is_home,
-            'opponent': opponent,
-            'difficulty': difficulty,
-            'score': captain_score
-        })
-
-    # Sort by captain score
-    captain_candidates.sort(key=lambda x: x['score'], reverse=True)
-
-    result = f"=== Captain Suggestions for GW{gw} ===\n\n"
+    captain_candidates, blanks = rank_captains(index, calendar, picks, gw,
+                                               snapshot.projections if projected else None)
+    score_label = "Projected Points" if projected else "Captain Score"
+
+    def verbose(row):
+        text = f"{row['rank']}. {row['name']} ({row['team_name']}){' (Double Gameweek)' if row['dgw'] else ''}\n"
+        for fixture in row['fixture_list']:
+            text += (f"   Fixture: {'Home' if fixture.is_home else 'Away'} vs "
+                     f"{index.team_name(fixture.opponent)} {'★' * fixture.difficulty}\n")
+        text += f"   Form: {row['form']} | Total Points: {row['pts']}\n"
+        text += f"   Goals: {row['goals']} | Assists: {row['assists']}\n"
+        text += f"   {score_label}: {row['score']:.1f}\n\n"
+        return text
+
+    result = ToolResult()
+    result.text(f"=== Captain Suggestions for GW{gw} ===\n\n",
+                f"Captain suggestions GW{gw}{' (score = projected points)' if projected else ''}")
+    suggestions = result.table("candidates", ('rank', 'id', 'name', 'team', 'fixtures', 'form', 'pts',
+                                              'goals', 'assists', 'score'),
+                               verbose)
 
     for i, candidate in enumerate(captain_candidates[:5], 1):
         player = candidate['player']
-        team_name = teams_map.get(player['team'], 'Unknown')
-        venue = "Home" if candidate['is_home'] else "Away"
-        difficulty_stars = '★' * candidate['difficulty']
+        fixtures = candidate['fixtures']
+        suggestions.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                        team_name=index.team_name(player.team), dgw=len(fixtures) > 1, fixture_list=fixtures,
+                        fixtures=[fixture_code(index, f) for f in fixtures],
+                        form=player.form, pts=player.total_points, goals=player.goals_scored,
+                        assists=player.assists, score=round(candidate['score'], 1))
 
-        result += f"{i}. {player['web_name']} ({team_name})\n"
-        result += f"   Fixture: {venue} vs {candidate['opponent']} {difficulty_stars}\n"
-        result += f"   Form: {player['form']} | Total Points: {player['total_points']}\n"
-        result += f"   Goals: {player['goals_scored']} | Assists: {player['assists']}\n"
-        result += f"   Captain Score: {candidate['score']:.1f}\n\n"
+    if blanks:
+        names = ', '.join(p.web_name for p in blanks)
+        result.text(f"No fixture in GW{gw} (blank): {names}\n\n", f"Blank GW{gw}: {names}")
 
     if captain_candidates:
         top_pick = captain_candidates[0]
-        result += f"Recommendation: Captain {top_pick['player']['web_name']} "
-        result += f"({'easy' if top_pick['difficulty'] <= 2 else 'favorable' if top_pick['difficulty'] == 3 else 'tough'} fixture)\n"
+        fixture = fixture_rating(top_pick['difficulty'])
+        result.text(f"Recommendation: Captain {top_pick['player'].web_name} ({fixture} fixture)\n",
+                    f"Recommendation: {top_pick['player'].web_name} ({fixture} fixture)")
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def compare_captain_options(player_ids: str) -> str:
     """
     Compare specific players as captain options for the next gameweek.
 
     Args:
-        player_ids: Comma-separated player IDs to compare (e.g., "234,345,456")
+        player_ids: Comma-separated player IDs or names to compare (e.g., "234,345,456" or "Haaland, Salah")
 
     Returns:
         Detailed captain comparison including fixtures, form, and historical performance.
     """
-    try:
-        ids = [int(pid.strip()) for pid in player_ids.split(',')]
-    except ValueError:
-        return "Invalid player IDs format. Use comma-separated numbers like '234,345,456'"
-
-    if len(ids) < 2:
-        return "Please provide at least 2 player IDs to compare"
-
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    result = "=== Captain Comparison ===\n\n"
-
-    for player_id in ids:
-        player = client.get_player_by_id(player_id)
+    refs = [ref.strip() for ref in player_ids.split(',') if ref.strip()]
+
+    if len(refs) < 2:
+        return "Please provide at least 2 players to compare"
+
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    calendar = snapshot.fixture_calendar
+    players = snapshot.search_index.resolve(refs)
+
+    next_gw = client.get_next_gameweek()
+    current_gw = client.get_current_gameweek()
+    gw = next_gw if next_gw > current_gw else current_gw
+
+    def verbose(row):
+        if row['player'] is None:
+            ref = row['ref']
+            return f"Player ID {ref} not found\n\n" if ref.isdigit() else f"No player found matching '{ref}'\n\n"
+        text = (f"{row['name']} ({row['team_name']})\n"
+                f"  Form: {row['form']} | PPG: {row['ppg']}\n"
+                f"  Total Points: {row['pts']}\n"
+                f"  Goals: {row['goals']} | Assists: {row['assists']}\n")
+        if row['blank']:
+            text += f"  Next Fixture: none in GW{gw} (blank)\n"
+        for fixture in row['next_list']:
+            text += (f"  Next Fixture: {'Home' if fixture.is_home else 'Away'} vs "
+                     f"{index.team_name(fixture.opponent)} {'★' * fixture.difficulty}\n")
+        if row['later_list']:
+            text += "  Upcoming: " + ''.join(f"{'H' if fix.is_home else 'A'}:{index.team_name(fix.opponent)[:3]}"
+                                             f"({fix.difficulty}) " for fix in row['later_list']) + "\n"
+        return text + "\n"
+
+    result = ToolResult()
+    result.text("=== Captain Comparison ===\n\n", f"Captain comparison GW{gw}")
+    comparison = result.table("players", ('ref', 'id', 'name', 'team', 'form', 'ppg', 'pts', 'goals', 'assists',
+                                          'next', 'later'),
+                              verbose, keep=len(refs))
+
+    for ref, player in zip(refs, players):
         if not player:
-            result += f"Player ID {player_id} not found\n\n"
+            comparison.add(ref=ref, player=None, name="not found")
             continue
 
-        summary = client.get_player_summary(player_id)
-        fixtures = summary.get('fixtures', [])
-
-        team_name = teams_map.get(player['team'], 'Unknown')
-
-        result += f"{player['web_name']} ({team_name})\n"
-        result += f"  Form: {player['form']} | PPG: {player['points_per_game']}\n"
-        result += f"  Total Points: {player['total_points']}\n"
-        result += f"  Goals: {player['goals_scored']} | Assists: {player['assists']}\n"
-
-        if fixtures:
-            next_fixture = fixtures[0]
-            is_home = next_fixture['is_home']
-            opponent_id = next_fixture['team_a'] if is_home else next_fixture['team_h']
-            opponent = teams_map.get(opponent_id, 'Unknown')
-            difficulty = next_fixture['difficulty']
-            venue = "Home" if is_home else "Away"
-            stars = '★' * difficulty
+        next_fixtures = [f for f in calendar.gameweek(player.team, gw) if not f.finished]
+        blank = not next_fixtures and calendar.fixture_count(player.team, gw) == 0
 
-            result += f"  Next Fixture: {venue} vs {opponent} {stars}\n"
+        # Show next few fixtures after the captaincy gameweek
+        later = [f for f in calendar.upcoming(player.team) if f.event is None or f.event > gw][:3]
 
-            # Show next few fixtures
-            if len(fixtures) > 1:
-                result += f"  Upcoming: "
-                for i, fix in enumerate(fixtures[1:4], 2):
-                    opp_id = fix['team_a'] if fix['is_home'] else fix['team_h']
-                    opp = teams_map.get(opp_id, 'Unknown')[:3]
-                    v = "H" if fix['is_home'] else "A"
-                    result += f"{v}:{opp}({fix['difficulty']}) "
-                result += "\n"
+        comparison.add(ref=ref, player=player, id=player.id, name=player.web_name,
+                       team=index.team_short_name(player.team), team_name=index.team_name(player.team),
+                       form=player.form, ppg=player.points_per_game, pts=player.total_points,
+                       goals=player.goals_scored, assists=player.assists,
+                       blank=blank, next_list=next_fixtures, later_list=later,
+                       next="blank" if blank else [fixture_code(index, f) for f in next_fixtures],
+                       later=[fixture_code(index, f) for f in later])
 
-        result += "\n"
-
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def get_most_captained_players(limit: int = 10) -> str:
     """
     Get the most captained players based on ownership and form.
@@ -182,38 +240,39 @@ def get_most_captained_players(limit: int = 10) -> str:
     Returns:
         List of most popular captain choices among FPL managers.
     """
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    table = snapshot.player_table
 
     # Filter for commonly captained players (high ownership + attacking)
-    candidates = []
-    for player in data['elements']:
-        if (player['element_type'] in [3, 4] and  # MID or FWD
-            float(player['selected_by_percent']) > 5.0 and
-            player['total_points'] > 20):
-            candidates.append(player)
-
-    # Sort by ownership and form
-    candidates.sort(
-        key=lambda x: (float(x['selected_by_percent']), float(x['form']) if x['form'] else 0),
-        reverse=True
-    )
+    rows = table.rows(((table.position == 3) | (table.position == 4)) &  # MID or FWD
+                      (table.ownership > 5.0) &
+                      (table.total_points > 20))
 
-    result = f"=== Most Captained Players (High Ownership + Form) ===\n\n"
+    # Rank by ownership and form
+    candidates = table.players_at(table.top_k(rows, limit, table.ownership, table.form))
 
-    for i, player in enumerate(candidates[:limit], 1):
-        team_name = teams_map.get(player['team'], 'Unknown')
-        price = player['now_cost'] / 10
+    result = ToolResult()
+    result.text(f"=== Most Captained Players (High Ownership + Form) ===\n\n",
+                "Most captained (ownership + form)")
+    popular = result.table("players", ('rank', 'id', 'name', 'team', 'price', 'sel_pct', 'form', 'pts',
+                                       'goals', 'assists'),
+                           "{rank}. {name} (ID: {id})\n"
+                           "   {team_name} | £{price}m\n"
+                           "   Ownership: {sel_pct}% | Form: {form}\n"
+                           "   Points: {pts} | Goals: {goals} | Assists: {assists}\n\n")
 
-        result += f"{i}. {player['web_name']} (ID: {player['id']})\n"
-        result += f"   {team_name} | £{price}m\n"
-        result += f"   Ownership: {player['selected_by_percent']}% | Form: {player['form']}\n"
-        result += f"   Points: {player['total_points']} | Goals: {player['goals_scored']} | Assists: {player['assists']}\n\n"
+    for i, player in enumerate(candidates, 1):
+        popular.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                    team_name=index.team_name(player.team), price=player.now_cost / 10,
+                    sel_pct=player.selected_by_percent, form=player.form, pts=player.total_points,
+                    goals=player.goals_scored, assists=player.assists)
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool
 def analyze_captaincy_history(team_id: str = None, num_gameweeks: int = 5) -> str:
     """
     Analyze your recent captaincy choices and their returns.
@@ -226,7 +285,7 @@ def analyze_captaincy_history(team_id: str = None, num_gameweeks: int = 5) -> st
         Analysis of your recent captain choices and points scored.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -239,51 +298,64 @@ def analyze_captaincy_history(team_id: str = None, num_gameweeks: int = 5) -> st
     try:
         history = client.get_team_history(team_id)
         current_gw = client.get_current_gameweek()
+        snapshot = client.get_snapshot()
+        index = snapshot.index
     except Exception as e:
-        return f"Error fetching history: {str(e)}"
+        raise ToolFailure(f"Error fetching history: {str(e)}")
 
-    result = f"=== Captaincy History (Last {num_gameweeks} GWs) ===\n\n"
+    result = ToolResult()
+    result.text(f"=== Captaincy History (Last {num_gameweeks} GWs) ===\n\n",
+                f"Captaincy history, last {num_gameweeks} GWs")
+    captains = result.table("captains", ('gw', 'id', 'name', 'points', 'multiplier', 'total'),
+                            "GW{gw}: {name}\n"
+                            "  Points: {points} x {multiplier} = {total}\n\n")
 
     total_captain_points = 0
     gws_analyzed = 0
+    gws_missing = 0
+
+    # Fetch every gameweek's picks and live points concurrently; finished
+    # gameweeks come from cache after the first analysis of any manager.
+    gameweeks = list(range(max(1, current_gw - num_gameweeks), current_gw))
+    all_picks = run_sync(async_client.get_team_picks_many(team_id, gameweeks, return_exceptions=True))
+    all_live = live_store.get_many(gameweeks)
 
     # Analyze recent gameweeks
-    for gw in range(max(1, current_gw - num_gameweeks), current_gw):
-        try:
-            picks = client.get_team_picks(team_id, gw)
-            gw_live = client.get_live_gameweek(gw)
-
-            # Find captain
-            for pick in picks['picks']:
-                if pick['is_captain']:
-                    player = client.get_player_by_id(pick['element'])
-                    if not player:
-                        continue
-
-                    # Find player's points in live data
-                    player_live = None
-                    for elem in gw_live['elements']:
-                        if elem['id'] == pick['element']:
-                            player_live = elem
-                            break
-
-                    if player_live:
-                        points = player_live['stats']['total_points']
-                        captain_points = points * pick['multiplier']  # 2x for captain
-                        total_captain_points += captain_points
-                        gws_analyzed += 1
-
-                        result += f"GW{gw}: {player['web_name']}\n"
-                        result += f"  Points: {points} x {pick['multiplier']} = {captain_points}\n\n"
-
-        except Exception:
+    for gw in gameweeks:
+        picks, gw_live = all_picks[gw], all_live.get(gw)
+        if isinstance(picks, Exception) or gw_live is None:
+            gws_missing += 1
             continue  # Skip if data not available
 
+        # Find captain
+        for pick in picks['picks']:
+            if pick.is_captain:
+                player = index.player(pick.element)
+                if not player:
+                    continue
+
+                # Player's points from the live data
+                points = gw_live.points_for(pick.element)
+
+                if points is not None:
+                    captain_points = points * pick.multiplier  # 2x for captain
+                    total_captain_points += captain_points
+                    gws_analyzed += 1
+
+                    captains.add(gw=gw, id=player.id, name=player.web_name, points=points,
+                                 multiplier=pick.multiplier, total=captain_points)
+
     if gws_analyzed > 0:
         avg_captain_points = total_captain_points / gws_analyzed
-        result += f"Average Captain Points: {avg_captain_points:.1f} per GW\n"
-        result += f"Total Captain Points: {total_captain_points}\n"
+        result.fields("Summary",
+                      "Average Captain Points: {avg:.1f} per GW\n"
+                      "Total Captain Points: {total}\n",
+                      avg=round(avg_captain_points, 1), total=total_captain_points)
     else:
-        result += "No captaincy data available for recent gameweeks\n"
+        result.text("No captaincy data available for recent gameweeks\n", "No captaincy data for recent GWs")
 
-    return result
+    text = result.render(footer=snapshot.label)
+    if gws_missing:
+        # Incomplete: answer with what loaded, but fetch again next time
+        raise ToolFailure(text)
+    return text
@@ -1,49 +1,54 @@
 """Player analysis tools for FPL Assistant."""
 
 from strands import tool
-from fpl_client import FPLClient
+from fpl_client import get_client
+from tool_cache import memoize_tool
+from tool_output import ToolResult
+from bootstrap_index import POSITION_IDS
 from typing import List, Dict, Any
 
 
-client = FPLClient()
+client = get_client()
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def search_player(name: str) -> str:
     """
-    Search for FPL players by name.
+    Search for FPL players by name (accents and small typos are fine).
 
     Args:
-        name: The player's name to search for (e.g., "Salah", "Haaland")
+        name: The player's name to search for (e.g., "Salah", "Haaland", "Odegaard")
 
     Returns:
         Formatted string with player information including ID, name, team, position, price, and form.
     """
-    players = client.search_players(name, limit=5)
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    players = snapshot.search_index.search(name, limit=5)
 
     if not players:
         return f"No players found matching '{name}'"
 
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-
-    result = f"Found {len(players)} player(s) matching '{name}':\n\n"
+    result = ToolResult()
+    result.text(f"Found {len(players)} player(s) matching '{name}':\n\n", f"Players matching '{name}'")
+    matches = result.table("players", ('id', 'name', 'team', 'pos', 'price', 'form', 'pts', 'sel_pct'),
+                           "• {name} (ID: {id})\n"
+                           "  {team_name} | {pos} | £{price}m\n"
+                           "  Form: {form} | Total Points: {pts}\n"
+                           "  Selected by: {sel_pct}%\n\n")
 
     for player in players:
-        team_name = teams_map.get(player['team'], 'Unknown')
-        position = position_map.get(player['element_type'], 'Unknown')
-        price = player['now_cost'] / 10
-
-        result += f"• {player['web_name']} (ID: {player['id']})\n"
-        result += f"  {team_name} | {position} | £{price}m\n"
-        result += f"  Form: {player['form']} | Total Points: {player['total_points']}\n"
-        result += f"  Selected by: {player['selected_by_percent']}%\n\n"
+        matches.add(id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                    team_name=index.team_name(player.team), pos=index.position_name(player.element_type),
+                    price=player.now_cost / 10, form=player.form, pts=player.total_points,
+                    sel_pct=player.selected_by_percent)
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def get_player_details(player_id: int) -> str:
     """
     Get detailed statistics for a specific player.
@@ -54,51 +59,60 @@ def get_player_details(player_id: int) -> str:
     Returns:
         Detailed player statistics including form, fixtures, and performance metrics.
     """
-    player = client.get_player_by_id(player_id)
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    player = index.player(player_id)
 
     if not player:
         return f"Player with ID {player_id} not found"
 
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-
-    team_name = teams_map.get(player['team'], 'Unknown')
-    position = position_map.get(player['element_type'], 'Unknown')
-    price = player['now_cost'] / 10
-
-    result = f"=== {player['web_name']} ({player['first_name']} {player['second_name']}) ===\n\n"
-    result += f"Team: {team_name}\n"
-    result += f"Position: {position}\n"
-    result += f"Price: £{price}m\n\n"
-
-    result += "Performance:\n"
-    result += f"  Total Points: {player['total_points']}\n"
-    result += f"  Form: {player['form']}\n"
-    result += f"  Points per Game: {player['points_per_game']}\n"
-    result += f"  Minutes Played: {player['minutes']}\n\n"
-
-    result += "Statistics:\n"
-    result += f"  Goals: {player['goals_scored']}\n"
-    result += f"  Assists: {player['assists']}\n"
-    result += f"  Clean Sheets: {player['clean_sheets']}\n"
-    result += f"  Bonus Points: {player['bonus']}\n\n"
-
-    result += "Value:\n"
-    result += f"  Selected by: {player['selected_by_percent']}%\n"
-    result += f"  ICT Index: {player['ict_index']}\n"
-    result += f"  Influence: {player['influence']}\n"
-    result += f"  Creativity: {player['creativity']}\n"
-    result += f"  Threat: {player['threat']}\n\n"
-
-    result += "Status:\n"
-    result += f"  Availability: {player['status']}\n"
-    result += f"  News: {player['news'] if player['news'] else 'None'}\n"
-
-    return result
+    result = ToolResult()
+    result.text(f"=== {player.web_name} ({player.first_name} {player.second_name}) ===\n\n",
+                f"{player.web_name} ({player.first_name} {player.second_name}) id={player.id}")
+    result.fields("Player",
+                  "Team: {team_name}\n"
+                  "Position: {pos}\n"
+                  "Price: £{price}m\n\n",
+                  team_name=index.team_name(player.team), pos=index.position_name(player.element_type),
+                  price=player.now_cost / 10)
+
+    result.fields("Performance",
+                  "Performance:\n"
+                  "  Total Points: {pts}\n"
+                  "  Form: {form}\n"
+                  "  Points per Game: {ppg}\n"
+                  "  Minutes Played: {mins}\n\n",
+                  pts=player.total_points, form=player.form, ppg=player.points_per_game, mins=player.minutes)
+
+    result.fields("Statistics",
+                  "Statistics:\n"
+                  "  Goals: {goals}\n"
+                  "  Assists: {assists}\n"
+                  "  Clean Sheets: {cs}\n"
+                  "  Bonus Points: {bonus}\n\n",
+                  goals=player.goals_scored, assists=player.assists, cs=player.clean_sheets, bonus=player.bonus)
+
+    result.fields("Value",
+                  "Value:\n"
+                  "  Selected by: {sel_pct}%\n"
+                  "  ICT Index: {ict}\n"
+                  "  Influence: {influence}\n"
+                  "  Creativity: {creativity}\n"
+                  "  Threat: {threat}\n\n",
+                  sel_pct=player.selected_by_percent, ict=player.ict_index, influence=player.influence,
+                  creativity=player.creativity, threat=player.threat)
+
+    result.fields("Status",
+                  "Status:\n"
+                  "  Availability: {status}\n"
+                  "  News: {news}\n",
+                  status=player.status, news=player.news if player.news else 'None')
+
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> str:
     """
     Get upcoming fixtures for a player with difficulty ratings.
@@ -110,86 +124,85 @@ def get_player_fixtures(player_id: int, num_fixtures: int = 5) -> str:
     Returns:
         Formatted string with upcoming fixtures and difficulty ratings.
     """
-    player = client.get_player_by_id(player_id)
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    player = index.player(player_id)
 
     if not player:
         return f"Player with ID {player_id} not found"
 
-    summary = client.get_player_summary(player_id)
-    fixtures = summary.get('fixtures', [])[:num_fixtures]
+    calendar = snapshot.fixture_calendar
+    fixtures = calendar.upcoming(player.team, num_fixtures)
 
     if not fixtures:
-        return f"No upcoming fixtures found for {player['web_name']}"
+        return f"No upcoming fixtures found for {player.web_name}"
 
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    result = f"=== Upcoming Fixtures for {player['web_name']} ===\n\n"
+    result = ToolResult()
+    result.text(f"=== Upcoming Fixtures for {player.web_name} ===\n\n", f"Upcoming fixtures: {player.web_name}")
+    upcoming = result.table("fixtures", ('gw', 'venue', 'opp', 'diff', 'dgw'),
+                            lambda row: f"GW{row['gw']}: {'Home' if row['venue'] == 'H' else 'Away'} "
+                                        f"vs {row['opp_name']}{' (Double Gameweek)' if row['dgw'] else ''}\n"
+                                        f"  Difficulty: {'★' * row['diff']} ({row['diff']}/5)\n\n")
 
     for fixture in fixtures:
-        is_home = fixture['is_home']
-        opponent_id = fixture['team_a'] if is_home else fixture['team_h']
-        opponent = teams_map.get(opponent_id, 'Unknown')
-        difficulty = fixture['difficulty']
-        event = fixture['event']
-
-        venue = "Home" if is_home else "Away"
-        difficulty_stars = '★' * difficulty
-
-        result += f"GW{event}: {venue} vs {opponent}\n"
-        result += f"  Difficulty: {difficulty_stars} ({difficulty}/5)\n\n"
+        event = fixture.event
+        upcoming.add(gw=event, venue="H" if fixture.is_home else "A",
+                     opp=index.team_short_name(fixture.opponent), opp_name=index.team_name(fixture.opponent),
+                     diff=fixture.difficulty,
+                     dgw="Y" if event and calendar.fixture_count(player.team, event) > 1 else "")
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def compare_players(player_ids: str) -> str:
     """
     Compare multiple players side by side.
 
     Args:
-        player_ids: Comma-separated player IDs to compare (e.g., "234,345,456")
+        player_ids: Comma-separated player IDs or names to compare (e.g., "234,345,456" or "Salah, Saka, Palmer")
 
     Returns:
         Side-by-side comparison of player statistics.
     """
-    try:
-        ids = [int(pid.strip()) for pid in player_ids.split(',')]
-    except ValueError:
-        return "Invalid player IDs format. Use comma-separated numbers like '234,345,456'"
+    refs = [ref.strip() for ref in player_ids.split(',') if ref.strip()]
 
-    if len(ids) < 2:
-        return "Please provide at least 2 player IDs to compare"
+    if len(refs) < 2:
+        return "Please provide at least 2 players to compare"
 
-    if len(ids) > 5:
+    if len(refs) > 5:
         return "Maximum 5 players can be compared at once"
 
-    players = []
-    for pid in ids:
-        player = client.get_player_by_id(pid)
-        if player:
-            players.append(player)
-        else:
-            return f"Player with ID {pid} not found"
-
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    result = "=== Player Comparison ===\n\n"
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    players = snapshot.search_index.resolve(refs)
+    for ref, player in zip(refs, players):
+        if not player:
+            return f"Player with ID {ref} not found" if ref.isdigit() else f"No player found matching '{ref}'"
+
+    result = ToolResult()
+    result.text("=== Player Comparison ===\n\n", "Player comparison")
+    comparison = result.table("players", ('id', 'name', 'team', 'price', 'pts', 'form', 'ppg', 'goals',
+                                          'assists', 'bonus', 'sel_pct', 'ict'),
+                              "{name} ({team_name}) - £{price}m\n"
+                              "  Total Points: {pts} | Form: {form} | PPG: {ppg}\n"
+                              "  Goals: {goals} | Assists: {assists} | Bonus: {bonus}\n"
+                              "  Selected by: {sel_pct}% | ICT: {ict}\n\n",
+                              keep=len(players))
 
     for player in players:
-        team_name = teams_map.get(player['team'], 'Unknown')
-        price = player['now_cost'] / 10
+        comparison.add(id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                       team_name=index.team_name(player.team), price=player.now_cost / 10,
+                       pts=player.total_points, form=player.form, ppg=player.points_per_game,
+                       goals=player.goals_scored, assists=player.assists, bonus=player.bonus,
+                       sel_pct=player.selected_by_percent, ict=player.ict_index)
 
-        result += f"{player['web_name']} ({team_name}) - £{price}m\n"
-        result += f"  Total Points: {player['total_points']} | Form: {player['form']} | PPG: {player['points_per_game']}\n"
-        result += f"  Goals: {player['goals_scored']} | Assists: {player['assists']} | Bonus: {player['bonus']}\n"
-        result += f"  Selected by: {player['selected_by_percent']}% | ICT: {player['ict_index']}\n\n"
-
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def get_top_players(position: str = "all", limit: int = 10) -> str:
     """
     Get the top performing players by total points.
@@ -201,32 +214,31 @@ def get_top_players(position: str = "all", limit: int = 10) -> str:
     Returns:
         List of top performing players with their statistics.
     """
-    data = client.get_bootstrap_static()
-    players = data['elements']
-
-    position_map = {'GK': 1, 'DEF': 2, 'MID': 3, 'FWD': 4}
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    players = index.data['elements']
 
     if position.upper() != 'ALL':
-        if position.upper() not in position_map:
+        if position.upper() not in POSITION_IDS:
             return f"Invalid position. Use: GK, DEF, MID, FWD, or ALL"
-        position_id = position_map[position.upper()]
-        players = [p for p in players if p['element_type'] == position_id]
+        players = index.players_by_position.get(POSITION_IDS[position.upper()], [])
 
-    # Sort by total points
-    players.sort(key=lambda x: x['total_points'], reverse=True)
-    top_players = players[:limit]
+    # Sort by total points (without mutating the shared bootstrap data)
+    top_players = sorted(players, key=lambda x: x.total_points, reverse=True)[:limit]
 
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    result = f"=== Top {limit} {position.upper()} Players by Total Points ===\n\n"
+    result = ToolResult()
+    result.text(f"=== Top {limit} {position.upper()} Players by Total Points ===\n\n",
+                f"Top {limit} {position.upper()} by total points")
+    ranking = result.table("players", ('rank', 'id', 'name', 'team', 'price', 'pts', 'form', 'ppg', 'goals', 'assists'),
+                           "{rank}. {name} (ID: {id})\n"
+                           "   {team_name} | £{price}m\n"
+                           "   Points: {pts} | Form: {form} | PPG: {ppg}\n"
+                           "   Goals: {goals} | Assists: {assists}\n\n")
 
     for i, player in enumerate(top_players, 1):
-        team_name = teams_map.get(player['team'], 'Unknown')
-        price = player['now_cost'] / 10
-
-        result += f"{i}. {player['web_name']} (ID: {player['id']})\n"
-        result += f"   {team_name} | £{price}m\n"
-        result += f"   Points: {player['total_points']} | Form: {player['form']} | PPG: {player['points_per_game']}\n"
-        result += f"   Goals: {player['goals_scored']} | Assists: {player['assists']}\n\n"
+        ranking.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                    team_name=index.team_name(player.team), price=player.now_cost / 10,
+                    pts=player.total_points, form=player.form, ppg=player.points_per_game,
+                    goals=player.goals_scored, assists=player.assists)
 
-    return result
+    return result.render(footer=snapshot.label)
@@ -1,15 +1,102 @@
 """Team analysis tools for FPL Assistant."""
 
 from strands import tool
-from fpl_client import FPLClient
-from typing import List, Dict, Any
-import os
+from fpl_client import get_client
+from tool_cache import ToolFailure, memoize_tool
+from tool_output import ToolResult
+from sessions import current_team_id
+from typing import List, Dict, Any, Tuple
 
 
-client = FPLClient()
+client = get_client()
+
+CHIP_NAMES = {
+    'wildcard': 'Wildcard',
+    'freehit': 'Free Hit',
+    'bboost': 'Bench Boost',
+    '3xc': 'Triple Captain'
+}
+
+
+def fixture_code(index, fixture) -> str:
+    """Short form of a fixture for compact output: 'H:ARS(4)' (venue, opponent, difficulty)."""
+    return f"{'H' if fixture.is_home else 'A'}:{index.team_short_name(fixture.opponent)}({fixture.difficulty})"
+
+
+def count_free_transfers(history: Dict[str, Any], current_gw: int) -> int:
+    """
+    Count the free transfers available after a finished gameweek.
+
+    Tracks the season's transfers and chips gameweek by gameweek.
+
+    Args:
+        history: The manager's /history/ payload
+        current_gw: The last finished gameweek
+
+    Returns:
+        Free transfers for the next gameweek (1-5).
+    """
+    current_season = history.get('current', [])
+    chips_used = history.get('chips', [])
+
+    # Build a map of which chips were used in which gameweeks
+    chip_map = {chip['event']: chip['name'] for chip in chips_used}
+
+    ft_available = None  # Will be set to 1 when we hit GW2
+
+    # Track through each gameweek to calculate exact FT
+    for gw_data in current_season:
+        if gw_data['event'] > current_gw:
+            break  # Don't process future gameweeks
+
+        gw_event = gw_data['event']
+        transfers_made = gw_data.get('event_transfers', 0)
+        transfer_cost = gw_data.get('event_transfers_cost', 0)
+
+        # GW1 has unlimited transfers, skip it
+        if gw_event == 1:
+            ft_available = 1  # Start GW2 with 1 FT
+            continue
+
+        # GW16 AFCON bonus: Everyone topped up to 5 FT
+        if gw_event == 16:
+            ft_available = 5
+
+        # Check if a chip was used this gameweek
+        chip_used = chip_map.get(gw_event)
+
+        if chip_used in ['wildcard', 'freehit']:
+            # Chip used: FT are preserved (new rule)
+            # Transfers during chip week don't consume FT
+            ft_used = 0
+            ft_remaining = ft_available
+            # Next gameweek: add 1 new FT to existing (capped at 5)
+            ft_available = min(ft_remaining + 1, 5)
+        else:
+            # Normal gameweek: calculate exact FT used
+            # FT_used = transfers - (cost / 4)
+            ft_used = transfers_made - (transfer_cost // 4)
+
+            # FT remaining after this gameweek
+            ft_remaining = max(0, ft_available - ft_used)
+
+            # Next gameweek gets 1 new FT (capped at 5)
+            ft_available = min(ft_remaining + 1, 5)
+
+    return ft_available if ft_available is not None else 1
+
+
+def chip_usage(history: Dict[str, Any]) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """Get the (chip name, gameweek) of each chip used, and the names of the chips still available."""
+    chips_used = history.get('chips', [])
+    used_chip_names = [chip['name'] for chip in chips_used]
+    used = [(CHIP_NAMES.get(chip['name'], chip['name']), chip['event']) for chip in chips_used]
+    available = [chip_name for chip_key, chip_name in CHIP_NAMES.items() if chip_key not in used_chip_names]
+    return used, available
 
 
 @tool
+@memoize_tool
 def get_my_team_summary(team_id: str = None) -> str:
     """
     Get summary of your FPL team including current points, rank, and value.
@@ -21,7 +108,7 @@ def get_my_team_summary(team_id: str = None) -> str:
         Summary of your team's performance and current status.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -34,29 +121,44 @@ def get_my_team_summary(team_id: str = None) -> str:
     try:
         team_info = client.get_team_info(team_id)
     except Exception as e:
-        return f"Error fetching team information: {str(e)}"
-
-    result = f"=== {team_info['name']} ===\n"
-    result += f"Manager: {team_info['player_first_name']} {team_info['player_last_name']}\n\n"
-
-    result += "Overall Performance:\n"
-    result += f"  Overall Points: {team_info['summary_overall_points']:,}\n"
-    result += f"  Overall Rank: {team_info['summary_overall_rank']:,}\n"
-    result += f"  Gameweek Points: {team_info['summary_event_points']}\n"
-    result += f"  Gameweek Rank: {team_info['summary_event_rank']:,}\n\n"
-
-    result += "Team Value:\n"
-    result += f"  Squad Value: £{team_info['last_deadline_value'] / 10:.1f}m\n"
-    result += f"  Bank: £{team_info['last_deadline_bank'] / 10:.1f}m\n"
-    result += f"  Total Value: £{(team_info['last_deadline_value'] + team_info['last_deadline_bank']) / 10:.1f}m\n\n"
-
-    result += "Transfers:\n"
-    result += f"  Total Transfers: {team_info['last_deadline_total_transfers']}\n"
-
-    return result
+        raise ToolFailure(f"Error fetching team information: {str(e)}")
+
+    manager = f"{team_info['player_first_name']} {team_info['player_last_name']}"
+
+    result = ToolResult()
+    result.text(f"=== {team_info['name']} ===\n"
+                f"Manager: {manager}\n\n",
+                f"{team_info['name']} (manager: {manager})")
+
+    result.fields("Overall",
+                  "Overall Performance:\n"
+                  "  Overall Points: {pts:,}\n"
+                  "  Overall Rank: {rank:,}\n"
+                  "  Gameweek Points: {gw_pts}\n"
+                  "  Gameweek Rank: {gw_rank:,}\n\n",
+                  pts=team_info['summary_overall_points'], rank=team_info['summary_overall_rank'],
+                  gw_pts=team_info['summary_event_points'], gw_rank=team_info['summary_event_rank'])
+
+    value = team_info['last_deadline_value'] / 10
+    bank = team_info['last_deadline_bank'] / 10
+    result.fields("Value",
+                  "Team Value:\n"
+                  "  Squad Value: £{squad:.1f}m\n"
+                  "  Bank: £{bank:.1f}m\n"
+                  "  Total Value: £{total:.1f}m\n\n",
+                  squad=value, bank=bank,
+                  total=(team_info['last_deadline_value'] + team_info['last_deadline_bank']) / 10)
+
+    result.fields("Transfers",
+                  "Transfers:\n"
+                  "  Total Transfers: {total}\n",
+                  total=team_info['last_deadline_total_transfers'])
+
+    return result.render()
 
 
 @tool
+@memoize_tool
 def get_my_current_team(team_id: str = None) -> str:
     """
     Get your current FPL team lineup with player details.
@@ -68,7 +170,7 @@ def get_my_current_team(team_id: str = None) -> str:
         Your current team lineup with player statistics.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -82,46 +184,43 @@ def get_my_current_team(team_id: str = None) -> str:
         current_gw = client.get_current_gameweek()
         picks = client.get_team_picks(team_id, current_gw)
     except Exception as e:
-        return f"Error fetching team picks: {str(e)}"
-
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-
-    result = f"=== Your Team (GW{current_gw}) ===\n\n"
-
-    # Starting XI
-    result += "Starting XI:\n"
-    for pick in picks['picks'][:11]:
-        player = client.get_player_by_id(pick['element'])
-        if player:
-            team_name = teams_map.get(player['team'], 'Unknown')
-            position = position_map.get(player['element_type'], 'Unknown')
-            price = player['now_cost'] / 10
-
-            captain = " (C)" if pick['is_captain'] else " (VC)" if pick['is_vice_captain'] else ""
-
-            result += f"  {position} | {player['web_name']}{captain} - {team_name} (£{price}m)\n"
-            result += f"       Form: {player['form']} | Points: {player['total_points']}\n"
-
-    result += "\nBench:\n"
-    for pick in picks['picks'][11:]:
-        player = client.get_player_by_id(pick['element'])
-        if player:
-            team_name = teams_map.get(player['team'], 'Unknown')
-            position = position_map.get(player['element_type'], 'Unknown')
-            price = player['now_cost'] / 10
-
-            result += f"  {position} | {player['web_name']} - {team_name} (£{price}m)\n"
+        raise ToolFailure(f"Error fetching team picks: {str(e)}")
+
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+
+    result = ToolResult()
+    result.text(f"=== Your Team (GW{current_gw}) ===\n\n", f"Your team GW{current_gw}")
+
+    # Starting XI, then the bench; the whole squad is always shown
+    for heading, name, squad_picks, verbose in [
+        ("Starting XI:\n", "xi", picks['picks'][:11],
+         "  {pos} | {name}{armband} - {team_name} (£{price}m)\n"
+         "       Form: {form} | Points: {pts}\n"),
+        ("\nBench:\n", "bench", picks['picks'][11:],
+         "  {pos} | {name} - {team_name} (£{price}m)\n"),
+    ]:
+        result.text(heading)
+        lineup = result.table(name, ('id', 'pos', 'name', 'cap', 'team', 'price', 'form', 'pts'),
+                              verbose, keep=len(squad_picks))
+        for pick in squad_picks:
+            player = index.player(pick.element)
+            if player:
+                captain = "C" if pick.is_captain else "VC" if pick.is_vice_captain else ""
+                lineup.add(id=player.id, pos=index.position_name(player.element_type), name=player.web_name,
+                           cap=captain, armband=f" ({captain})" if captain else "",
+                           team=index.team_short_name(player.team), team_name=index.team_name(player.team),
+                           price=player.now_cost / 10, form=player.form, pts=player.total_points)
 
     # Active chip
     if picks.get('active_chip'):
-        result += f"\nActive Chip: {picks['active_chip']}\n"
+        result.text(f"\nActive Chip: {picks['active_chip']}\n", f"Active chip: {picks['active_chip']}")
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool
 def analyze_team_fixtures(team_id: str = None, num_gameweeks: int = 5) -> str:
     """
     Analyze fixture difficulty for your team's players.
@@ -134,7 +233,7 @@ def analyze_team_fixtures(team_id: str = None, num_gameweeks: int = 5) -> str:
         Analysis of fixture difficulty for your players.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -148,51 +247,65 @@ def analyze_team_fixtures(team_id: str = None, num_gameweeks: int = 5) -> str:
         current_gw = client.get_current_gameweek()
         picks = client.get_team_picks(team_id, current_gw)
     except Exception as e:
-        return f"Error fetching team: {str(e)}"
+        raise ToolFailure(f"Error fetching team: {str(e)}")
 
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
+    snapshot = client.get_snapshot()
+    index = snapshot.index
 
-    result = f"=== Fixture Analysis (Next {num_gameweeks} GWs) ===\n\n"
+    calendar = snapshot.fixture_calendar
+    first_gw = calendar.next_event or current_gw
+    gameweeks = range(first_gw, first_gw + num_gameweeks)
 
-    # Get unique player IDs from picks
-    player_ids = [pick['element'] for pick in picks['picks']]
+    # Starting XI only
+    starters = [index.player(pick.element) for pick in picks['picks'][:11]]
+    starters = [player for player in starters if player]
 
-    # Analyze fixtures for each player
-    for player_id in player_ids[:11]:  # Starting XI only
-        player = client.get_player_by_id(player_id)
-        if not player:
-            continue
-
-        summary = client.get_player_summary(player_id)
-        fixtures = summary.get('fixtures', [])[:num_gameweeks]
+    result = ToolResult()
+    result.text(f"=== Fixture Analysis (Next {num_gameweeks} GWs) ===\n\n",
+                f"Fixtures GW{first_gw}-{first_gw + num_gameweeks - 1} (venue:opponent(difficulty), - = blank)")
+    analysis = result.table("players", ('id', 'name', 'team', 'fixtures', 'avg_diff', 'n'),
+                            lambda row: f"{row['name']} ({row['team_name']}):\n{''.join(row['lines'])}"
+                                        f"  Avg Difficulty: {row['avg_diff']:.1f}/5 ({row['n']} fixtures)\n\n")
 
-        if not fixtures:
+    # Analyze fixtures for each player, gameweek by gameweek
+    for player in starters:
+        if not calendar.upcoming(player.team):
             continue
 
-        team_name = teams_map.get(player['team'], 'Unknown')
-        result += f"{player['web_name']} ({team_name}):\n"
-
+        lines = []
+        short = []
         total_difficulty = 0
-        for fixture in fixtures:
-            is_home = fixture['is_home']
-            opponent_id = fixture['team_a'] if is_home else fixture['team_h']
-            opponent = teams_map.get(opponent_id, 'Unknown')
-            difficulty = fixture['difficulty']
-            total_difficulty += difficulty
+        num_fixtures = 0
+        for gw in gameweeks:
+            fixtures = [f for f in calendar.gameweek(player.team, gw) if not f.finished]
+            if not fixtures and calendar.fixture_count(player.team, gw) == 0:
+                lines.append(f"  GW{gw}: BLANK\n")
+                short.append("-")
+                continue
 
-            venue = "H" if is_home else "A"
-            stars = '★' * difficulty
+            for fixture in fixtures:
+                opponent = index.team_name(fixture.opponent)
+                difficulty = fixture.difficulty
+                total_difficulty += difficulty
+                num_fixtures += 1
 
-            result += f"  GW{fixture['event']}: {venue} vs {opponent} {stars}\n"
+                venue = "H" if fixture.is_home else "A"
+                stars = '★' * difficulty
+                double = " (DGW)" if len(fixtures) > 1 else ""
 
-        avg_difficulty = total_difficulty / len(fixtures) if fixtures else 0
-        result += f"  Avg Difficulty: {avg_difficulty:.1f}/5\n\n"
+                lines.append(f"  GW{gw}: {venue} vs {opponent} {stars}{double}\n")
+            short.append('+'.join(fixture_code(index, f) for f in fixtures) or "played")
 
-    return result
+        avg_difficulty = total_difficulty / num_fixtures if num_fixtures else 0
+        analysis.add(id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                     team_name=index.team_name(player.team), lines=lines, fixtures=short,
+                     avg_diff=round(avg_difficulty, 1), n=num_fixtures)
+
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool
 def get_transfer_history(team_id: str = None) -> str:
     """
     Get your recent transfer history.
@@ -204,7 +317,7 @@ def get_transfer_history(team_id: str = None) -> str:
         List of recent transfers with player names and costs.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -217,14 +330,17 @@ def get_transfer_history(team_id: str = None) -> str:
     try:
         transfers = client.get_team_transfers(team_id)
     except Exception as e:
-        return f"Error fetching transfers: {str(e)}"
+        raise ToolFailure(f"Error fetching transfers: {str(e)}")
 
     if not transfers:
         return "No transfers made yet this season"
 
-    result = "=== Transfer History ===\n\n"
-
-    result += f"Total Transfers This Season: {len(transfers)}\n\n"
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    result = ToolResult()
+    result.text("=== Transfer History ===\n\n"
+                f"Total Transfers This Season: {len(transfers)}\n\n",
+                f"Transfer history ({len(transfers)} this season, prices £m)")
 
     # Group transfers by gameweek
     gw_transfers = {}
@@ -237,24 +353,31 @@ def get_transfer_history(team_id: str = None) -> str:
     # Show last 5 gameweeks with transfers
     sorted_gws = sorted(gw_transfers.keys(), reverse=True)[:5]
 
+    history = result.table("gameweeks", ('gw', 'n', 'sold', 'bought'),
+                           lambda row: f"Gameweek {row['gw']} ({row['n']} transfer{'s' if row['n'] != 1 else ''}):\n"
+                                       f"{''.join(row['lines'])}\n")
+
     for gw in sorted_gws:
         transfers_list = gw_transfers[gw]
-        result += f"Gameweek {gw} ({len(transfers_list)} transfer{'s' if len(transfers_list) != 1 else ''}):\n"
+        lines, sold, bought = [], [], []
 
         for transfer in transfers_list:
-            player_in = client.get_player_by_id(transfer['element_in'])
-            player_out = client.get_player_by_id(transfer['element_out'])
+            player_in = index.player(transfer['element_in'])
+            player_out = index.player(transfer['element_out'])
 
             if player_in and player_out:
-                result += f"  OUT: {player_out['web_name']} (£{transfer['element_out_cost'] / 10}m)\n"
-                result += f"  IN:  {player_in['web_name']} (£{transfer['element_in_cost'] / 10}m)\n"
+                lines.append(f"  OUT: {player_out.web_name} (£{transfer['element_out_cost'] / 10}m)\n"
+                             f"  IN:  {player_in.web_name} (£{transfer['element_in_cost'] / 10}m)\n")
+                sold.append(f"{player_out.web_name}({transfer['element_out_cost'] / 10})")
+                bought.append(f"{player_in.web_name}({transfer['element_in_cost'] / 10})")
 
-        result += "\n"
+        history.add(gw=gw, n=len(transfers_list), lines=lines, sold=sold, bought=bought)
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool
 def get_chips_status(team_id: str = None) -> str:
     """
     Get information about available and used chips.
@@ -266,7 +389,7 @@ def get_chips_status(team_id: str = None) -> str:
         Status of all chips (Wildcard, Free Hit, Bench Boost, Triple Captain).
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -279,43 +402,26 @@ def get_chips_status(team_id: str = None) -> str:
     try:
         history = client.get_team_history(team_id)
     except Exception as e:
-        return f"Error fetching team history: {str(e)}"
+        raise ToolFailure(f"Error fetching team history: {str(e)}")
 
-    result = "=== Chips Status ===\n\n"
-
-    chips_used = history.get('chips', [])
-
-    # All available chips
-    all_chips = {
-        'wildcard': 'Wildcard',
-        'freehit': 'Free Hit',
-        'bboost': 'Bench Boost',
-        '3xc': 'Triple Captain'
-    }
-
-    result += "Used Chips:\n"
-    if chips_used:
-        for chip in chips_used:
-            chip_name = all_chips.get(chip['name'], chip['name'])
-            result += f"  ✓ {chip_name} - Used in GW{chip['event']}\n"
-    else:
-        result += "  None used yet\n"
-
-    result += "\nAvailable Chips:\n"
-    used_chip_names = [chip['name'] for chip in chips_used]
-    available = False
-    for chip_key, chip_name in all_chips.items():
-        if chip_key not in used_chip_names:
-            result += f"  • {chip_name}\n"
-            available = True
+    used, available = chip_usage(history)
 
-    if not available:
-        result += "  All chips have been used\n"
+    result = ToolResult()
+    result.text("=== Chips Status ===\n\n", "Chips")
+    result.fields("Used",
+                  lambda values: "Used Chips:\n" + (''.join(f"  ✓ {chip_name} - Used in GW{gw}\n"
+                                                             for chip_name, gw in used) or "  None used yet\n"),
+                  chips=', '.join(f"{chip_name} GW{gw}" for chip_name, gw in used) or "none")
+    result.fields("Available",
+                  lambda values: "\nAvailable Chips:\n" + (''.join(f"  • {chip_name}\n" for chip_name in available)
+                                                             or "  All chips have been used\n"),
+                  chips=', '.join(available) or "none")
 
-    return result
+    return result.render()
 
 
 @tool
+@memoize_tool
 def get_transfer_status(team_id: str = None) -> str:
     """
     Get current transfer status including free transfers available and transfer cost.
@@ -327,7 +433,7 @@ def get_transfer_status(team_id: str = None) -> str:
         Current free transfers, bank balance, and transfer costs.
     """
     if not team_id:
-        team_id = os.getenv('FPL_TEAM_ID')
+        team_id = current_team_id()
 
     if not team_id:
         return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
@@ -342,20 +448,14 @@ def get_transfer_status(team_id: str = None) -> str:
         current_gw = client.get_current_gameweek()
         picks = client.get_team_picks(team_id, current_gw)
         history = client.get_team_history(team_id)
-        bootstrap = client.get_bootstrap_static()
+        snapshot = client.get_snapshot()
+        index = snapshot.index
     except Exception as e:
-        return f"Error fetching transfer status: {str(e)}"
-
-    result = "=== Transfer Status ===\n\n"
+        raise ToolFailure(f"Error fetching transfer status: {str(e)}")
 
     # Get current gameweek status
-    current_gw_data = None
-    next_gw_data = None
-    for event in bootstrap['events']:
-        if event['is_current']:
-            current_gw_data = event
-        if event['is_next']:
-            next_gw_data = event
+    current_gw_data = index.current_event
+    next_gw_data = index.next_event
 
     # Entry history for current gameweek
     entry_history = picks.get('entry_history', {})
@@ -366,87 +466,61 @@ def get_transfer_status(team_id: str = None) -> str:
     # Determine if we can calculate free transfers
     gw_finished = current_gw_data.get('finished', False) if current_gw_data else False
 
-    result += "Current Status:\n"
-    result += f"  Current Gameweek: {current_gw}\n"
-    result += f"  GW Status: {'Finished' if gw_finished else 'In Progress'}\n"
+    result = ToolResult()
+    result.text("=== Transfer Status ===\n\n", "Transfer status")
 
+    status = {'gw': current_gw, 'status': 'Finished' if gw_finished else 'In Progress'}
     if next_gw_data:
-        result += f"  Next Gameweek: {next_gw_data['id']}\n"
-        result += f"  Next Deadline: {next_gw_data['deadline_time']}\n"
-    result += "\n"
+        status.update(next_gw=next_gw_data['id'], deadline=next_gw_data['deadline_time'])
+    result.fields("Status",
+                  lambda values: "Current Status:\n"
+                                 f"  Current Gameweek: {values['gw']}\n"
+                                 f"  GW Status: {values['status']}\n"
+                                 + (f"  Next Gameweek: {values['next_gw']}\n"
+                                    f"  Next Deadline: {values['deadline']}\n" if 'next_gw' in values else "")
+                                 + "\n",
+                  **status)
 
     # Calculate free transfers if gameweek is finished
     if gw_finished and next_gw_data:
-        result += f"Free Transfers for GW{next_gw_data['id']}:\n"
-
-        # Calculate exact FT by tracking through the entire season
-        current_season = history.get('current', [])
-        chips_used = history.get('chips', [])
-
-        # Build a map of which chips were used in which gameweeks
-        chip_map = {chip['event']: chip['name'] for chip in chips_used}
-
-        ft_available = None  # Will be set to 1 when we hit GW2
-
-        # Track through each gameweek to calculate exact FT
-        for gw_data in current_season:
-            if gw_data['event'] > current_gw:
-                break  # Don't process future gameweeks
-
-            gw_event = gw_data['event']
-            transfers_made = gw_data.get('event_transfers', 0)
-            transfer_cost = gw_data.get('event_transfers_cost', 0)
-
-            # GW1 has unlimited transfers, skip it
-            if gw_event == 1:
-                ft_available = 1  # Start GW2 with 1 FT
-                continue
-
-            # GW16 AFCON bonus: Everyone topped up to 5 FT
-            if gw_event == 16:
-                ft_available = 5
-
-            # Check if a chip was used this gameweek
-            chip_used = chip_map.get(gw_event)
-
-            if chip_used in ['wildcard', 'freehit']:
-                # Chip used: FT are preserved (new rule)
-                # Transfers during chip week don't consume FT
-                ft_used = 0
-                ft_remaining = ft_available
-                # Next gameweek: add 1 new FT to existing (capped at 5)
-                ft_available = min(ft_remaining + 1, 5)
-            else:
-                # Normal gameweek: calculate exact FT used
-                # FT_used = transfers - (cost / 4)
-                ft_used = transfers_made - (transfer_cost // 4)
-
-                # FT remaining after this gameweek
-                ft_remaining = max(0, ft_available - ft_used)
-
-                # Next gameweek gets 1 new FT (capped at 5)
-                ft_available = min(ft_remaining + 1, 5)
-
-        free_transfers = ft_available if ft_available is not None else 1
-
-        result += f"  ✓ {free_transfers} free transfer{'s' if free_transfers != 1 else ''} available (max 5)\n"
-        result += f"  Additional transfers cost 4 points each\n\n"
+        free_transfers = count_free_transfers(history, current_gw)
+
+        # The finished gameweek's final transfer count is in the season history
+        played = [gw_data for gw_data in history.get('current', []) if gw_data['event'] <= current_gw]
+        if played:
+            transfers_made = played[-1].get('event_transfers', 0)
+            transfer_cost = played[-1].get('event_transfers_cost', 0)
+
+        result.fields("Free transfers",
+                      "Free Transfers for GW{gw}:\n"
+                      "  ✓ {free} free transfer{plural} available (max 5)\n"
+                      "  Additional transfers cost 4 points each\n\n",
+                      gw=next_gw_data['id'], free=free_transfers, plural='s' if free_transfers != 1 else '',
+                      hit=4)
     else:
-        result += f"Free Transfers for GW{current_gw}:\n"
-        result += "  ⚠️  Cannot determine - gameweek in progress\n"
-        result += "  Transfers may have been made after deadline\n"
-        result += "  Check FPL website/app for current status\n\n"
-
-    result += f"Last Gameweek (GW{current_gw}):\n"
-    result += f"  Transfers Made: {transfers_made}\n"
-    result += f"  Points Deducted: {transfer_cost}\n"
-    if active_chip:
-        result += f"  Chip Used: {active_chip.upper()}\n"
-    result += "\n"
+        result.text(f"Free Transfers for GW{current_gw}:\n"
+                    "  ⚠️  Cannot determine - gameweek in progress\n"
+                    "  Transfers may have been made after deadline\n"
+                    "  Check FPL website/app for current status\n\n",
+                    f"Free transfers GW{current_gw}: unknown while the gameweek is in progress (check the FPL app)")
 
-    result += "Team Value:\n"
-    result += f"  Squad Value: £{team_info['last_deadline_value'] / 10:.1f}m\n"
-    result += f"  In The Bank: £{entry_history.get('bank', 0) / 10:.1f}m\n"
-    result += f"  Total Budget: £{(team_info['last_deadline_value'] + entry_history.get('bank', 0)) / 10:.1f}m\n"
-
-    return result
+    last_gw = {'gw': current_gw, 'transfers': transfers_made, 'hits': transfer_cost}
+    if active_chip:
+        last_gw['chip'] = active_chip.upper()
+    result.fields("Last GW",
+                  lambda values: f"Last Gameweek (GW{values['gw']}):\n"
+                                 f"  Transfers Made: {values['transfers']}\n"
+                                 f"  Points Deducted: {values['hits']}\n"
+                                 + (f"  Chip Used: {values['chip']}\n" if 'chip' in values else "")
+                                 + "\n",
+                  **last_gw)
+
+    result.fields("Value",
+                  "Team Value:\n"
+                  "  Squad Value: £{squad:.1f}m\n"
+                  "  In The Bank: £{bank:.1f}m\n"
+                  "  Total Budget: £{total:.1f}m\n",
+                  squad=team_info['last_deadline_value'] / 10, bank=entry_history.get('bank', 0) / 10,
+                  total=(team_info['last_deadline_value'] + entry_history.get('bank', 0)) / 10)
+
+    return result.render(footer=snapshot.label)
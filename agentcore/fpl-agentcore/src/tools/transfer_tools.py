@@ -1,15 +1,30 @@
 """Transfer recommendation tools for FPL Assistant."""
 
 from strands import tool
-from fpl_client import FPLClient
+from fpl_client import get_client
+from tool_cache import ToolFailure, memoize_tool
+from tool_output import ToolResult
+from bootstrap_index import POSITION_IDS
+from sessions import current_team_id
+from tools.team_tools import count_free_transfers
+from transfer_planner import optimize_transfers
 from typing import List, Dict, Any
 
 
-client = FPLClient()
+client = get_client()
+
+# Horizon of the projected-points rankings, and its line in verbose output
+PROJECTION_GAMEWEEKS = 5
+PROJECTED_LINE = f"   Projected Points (next {PROJECTION_GAMEWEEKS} GWs): {{xp}}\n"
+
+# Most transfers plan_transfers searches: the search grows combinatorially past this
+MAX_PLANNED_TRANSFERS = 3
 
 
 @tool
-def analyze_transfer_options(position: str, max_price: float, min_form: float = 0.0) -> str:
+@memoize_tool(team_scoped=False)
+def analyze_transfer_options(position: str, max_price: float, min_form: float = 0.0,
+                             projected: bool = False) -> str:
     """
     Find potential transfer targets based on position, price, and form.
 
@@ -17,154 +32,172 @@ def analyze_transfer_options(position: str, max_price: float, min_form: float =
         position: Player position to search for ('GK', 'DEF', 'MID', 'FWD')
         max_price: Maximum price in millions (e.g., 8.5)
         min_form: Minimum form rating (default: 0.0)
+        projected: Rank by projected points over the next 5 gameweeks (form,
+            minutes, ICT, fixture difficulty, blanks and doubles) instead of form
 
     Returns:
         List of players matching the criteria with their statistics.
     """
-    position_map = {'GK': 1, 'DEF': 2, 'MID': 3, 'FWD': 4}
-
-    if position.upper() not in position_map:
+    if position.upper() not in POSITION_IDS:
         return "Invalid position. Use: GK, DEF, MID, or FWD"
 
-    position_id = position_map[position.upper()]
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    # Filter players
-    candidates = []
-    for player in data['elements']:
-        price = player['now_cost'] / 10
-        form = float(player['form']) if player['form'] else 0.0
-
-        if (player['element_type'] == position_id and
-            price <= max_price and
-            form >= min_form and
-            player['status'] == 'a'):  # Available
-            candidates.append(player)
-
-    # Sort by form and total points
-    candidates.sort(key=lambda x: (float(x['form']) if x['form'] else 0, x['total_points']), reverse=True)
+    position_id = POSITION_IDS[position.upper()]
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    table = snapshot.player_table
+
+    # Filter available players, then take the best 15 by form and total points (or projected points)
+    rows = table.rows((table.position == position_id) &
+                      (table.price <= max_price) &
+                      (table.form >= min_form) &
+                      table.available)
+    xp = snapshot.projections.total(PROJECTION_GAMEWEEKS) if projected else None
+    keys = (xp, table.form) if projected else (table.form, table.total_points)
+    rows = table.top_k(rows, 15, *keys)
+    candidates = table.players_at(rows)
 
     if not candidates:
         return f"No {position.upper()} players found under £{max_price}m with form >= {min_form}"
 
-    result = f"=== Transfer Targets: {position.upper()} under £{max_price}m ===\n\n"
+    result = ToolResult()
+    result.text(f"=== Transfer Targets: {position.upper()} under £{max_price}m ===\n\n",
+                f"Transfer targets: {position.upper()} <= £{max_price}m")
+    targets = result.table("players", ('rank', 'id', 'name', 'team', 'price', 'form', 'pts', 'ppg',
+                                       'goals', 'assists', 'sel_pct') + (('xp',) if projected else ()),
+                           "{rank}. {name} (ID: {id})\n"
+                           "   {team_name} | £{price}m\n"
+                           "   Form: {form} | Total Points: {pts} | PPG: {ppg}\n"
+                           "   Goals: {goals} | Assists: {assists} | Selected by: {sel_pct}%\n"
+                           + (PROJECTED_LINE if projected else "") + "\n")
 
-    for i, player in enumerate(candidates[:15], 1):
-        team_name = teams_map.get(player['team'], 'Unknown')
-        price = player['now_cost'] / 10
+    for i, (row, player) in enumerate(zip(rows, candidates), 1):
+        targets.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                    team_name=index.team_name(player.team), price=player.now_cost / 10,
+                    form=player.form, pts=player.total_points, ppg=player.points_per_game,
+                    goals=player.goals_scored, assists=player.assists, sel_pct=player.selected_by_percent,
+                    xp=round(float(xp[row]), 1) if projected else None)
 
-        result += f"{i}. {player['web_name']} (ID: {player['id']})\n"
-        result += f"   {team_name} | £{price}m\n"
-        result += f"   Form: {player['form']} | Total Points: {player['total_points']} | PPG: {player['points_per_game']}\n"
-        result += f"   Goals: {player['goals_scored']} | Assists: {player['assists']} | Selected by: {player['selected_by_percent']}%\n\n"
-
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
-def find_differentials(max_ownership: float = 10.0, min_points: int = 20) -> str:
+@memoize_tool(team_scoped=False)
+def find_differentials(max_ownership: float = 10.0, min_points: int = 20, projected: bool = False) -> str:
     """
     Find differential players (low ownership but good performance).
 
     Args:
         max_ownership: Maximum ownership percentage (default: 10.0)
         min_points: Minimum total points (default: 20)
+        projected: Rank by projected points over the next 5 gameweeks instead
+            of points per ownership
 
     Returns:
         List of differential players with low ownership but good points.
     """
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-
-    differentials = []
-    for player in data['elements']:
-        ownership = float(player['selected_by_percent'])
-        points = player['total_points']
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    table = snapshot.player_table
 
-        if ownership <= max_ownership and points >= min_points and player['status'] == 'a':
-            differentials.append(player)
+    rows = table.rows((table.ownership <= max_ownership) &
+                      (table.total_points >= min_points) &
+                      table.available)
 
-    # Sort by points per ownership ratio
-    differentials.sort(key=lambda x: x['total_points'] / (float(x['selected_by_percent']) + 0.1), reverse=True)
+    # Rank by points per ownership ratio (or projected points)
+    xp = snapshot.projections.total(PROJECTION_GAMEWEEKS) if projected else None
+    points_per_ownership = table.total_points / (table.ownership + 0.1)
+    rows = table.top_k(rows, 15, xp if projected else points_per_ownership)
+    differentials = table.players_at(rows)
 
     if not differentials:
         return f"No differentials found with ownership <= {max_ownership}% and points >= {min_points}"
 
-    result = f"=== Differential Players (Ownership <= {max_ownership}%) ===\n\n"
-
-    for i, player in enumerate(differentials[:15], 1):
-        team_name = teams_map.get(player['team'], 'Unknown')
-        position = position_map.get(player['element_type'], 'Unknown')
-        price = player['now_cost'] / 10
+    result = ToolResult()
+    result.text(f"=== Differential Players (Ownership <= {max_ownership}%) ===\n\n",
+                f"Differentials: ownership <= {max_ownership}%")
+    picks = result.table("players", ('rank', 'id', 'name', 'team', 'pos', 'price', 'pts', 'form', 'sel_pct')
+                         + (('xp',) if projected else ()),
+                         "{rank}. {name} (ID: {id})\n"
+                         "   {team_name} | {pos} | £{price}m\n"
+                         "   Points: {pts} | Form: {form} | Ownership: {sel_pct}%\n"
+                         + (PROJECTED_LINE if projected else "") + "\n")
 
-        result += f"{i}. {player['web_name']} (ID: {player['id']})\n"
-        result += f"   {team_name} | {position} | £{price}m\n"
-        result += f"   Points: {player['total_points']} | Form: {player['form']} | Ownership: {player['selected_by_percent']}%\n\n"
+    for i, (row, player) in enumerate(zip(rows, differentials), 1):
+        picks.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                  team_name=index.team_name(player.team), pos=index.position_name(player.element_type),
+                  price=player.now_cost / 10, pts=player.total_points, form=player.form,
+                  sel_pct=player.selected_by_percent, xp=round(float(xp[row]), 1) if projected else None)
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
-def suggest_transfer_swap(player_out_id: int, budget: float) -> str:
+@memoize_tool(team_scoped=False)
+def suggest_transfer_swap(player_out_id: int, budget: float, projected: bool = False) -> str:
     """
     Suggest replacement players for a specific player you want to transfer out.
 
     Args:
         player_out_id: ID of the player you want to transfer out
         budget: Total budget available for the transfer (player's selling price + any extra funds)
+        projected: Rank replacements by projected points over the next 5
+            gameweeks instead of form
 
     Returns:
         List of recommended replacement players in the same position.
     """
-    player_out = client.get_player_by_id(player_out_id)
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    player_out = index.player(player_out_id)
 
     if not player_out:
         return f"Player with ID {player_out_id} not found"
 
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-    position = position_map.get(player_out['element_type'], 'Unknown')
-    position_name = position
-
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-
-    result = f"=== Transfer Suggestions ===\n"
-    result += f"Out: {player_out['web_name']} ({teams_map.get(player_out['team'], 'Unknown')})\n"
-    result += f"Budget: £{budget}m | Position: {position_name}\n\n"
-
-    # Find replacements
-    replacements = []
-    for player in data['elements']:
-        price = player['now_cost'] / 10
-        if (player['element_type'] == player_out['element_type'] and
-            price <= budget and
-            player['id'] != player_out_id and
-            player['status'] == 'a'):
-            replacements.append(player)
-
-    # Sort by form and points
-    replacements.sort(key=lambda x: (float(x['form']) if x['form'] else 0, x['total_points']), reverse=True)
+    position_name = index.position_name(player_out.element_type)
+
+    result = ToolResult()
+    result.text("=== Transfer Suggestions ===\n", "Transfer suggestions")
+    result.fields("Out",
+                  "Out: {name} ({team_name})\n"
+                  "Budget: £{budget}m | Position: {pos}\n\n",
+                  id=player_out.id, name=player_out.web_name, team=index.team_short_name(player_out.team),
+                  team_name=index.team_name(player_out.team), budget=budget, pos=position_name)
+
+    # Find available replacements, best 10 by form and points
+    table = snapshot.player_table
+    rows = table.rows((table.position == player_out.element_type) &
+                      (table.price <= budget) &
+                      (table.id != player_out_id) &
+                      table.available)
+    xp = snapshot.projections.total(PROJECTION_GAMEWEEKS) if projected else None
+    keys = (xp, table.form) if projected else (table.form, table.total_points)
+    rows = table.top_k(rows, 10, *keys)
+    replacements = table.players_at(rows)
 
     if not replacements:
-        return result + f"No suitable replacements found under £{budget}m"
-
-    result += "Recommended replacements:\n\n"
+        result.text(f"No suitable replacements found under £{budget}m", f"No replacements under £{budget}m")
+        return result.render()
 
-    for i, player in enumerate(replacements[:10], 1):
-        team_name = teams_map.get(player['team'], 'Unknown')
-        price = player['now_cost'] / 10
+    result.text("Recommended replacements:\n\n")
+    options = result.table("replacements", ('rank', 'id', 'name', 'team', 'price', 'form', 'pts', 'goals', 'assists')
+                           + (('xp',) if projected else ()),
+                           "{rank}. {name} (ID: {id})\n"
+                           "   {team_name} | £{price}m\n"
+                           "   Form: {form} | Total Points: {pts}\n"
+                           "   Goals: {goals} | Assists: {assists}\n"
+                           + (PROJECTED_LINE if projected else "") + "\n")
 
-        result += f"{i}. {player['web_name']} (ID: {player['id']})\n"
-        result += f"   {team_name} | £{price}m\n"
-        result += f"   Form: {player['form']} | Total Points: {player['total_points']}\n"
-        result += f"   Goals: {player['goals_scored']} | Assists: {player['assists']}\n\n"
+    for i, (row, player) in enumerate(zip(rows, replacements), 1):
+        options.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                    team_name=index.team_name(player.team), price=player.now_cost / 10,
+                    form=player.form, pts=player.total_points, goals=player.goals_scored, assists=player.assists,
+                    xp=round(float(xp[row]), 1) if projected else None)
 
-    return result
+    return result.render(footer=snapshot.label)
 
 
 @tool
+@memoize_tool(team_scoped=False)
 def check_price_changes(min_change: float = 0.5) -> str:
     """
     Check which players have had significant price changes this season.
@@ -175,49 +208,132 @@ def check_price_changes(min_change: float = 0.5) -> str:
     Returns:
         List of players with significant price changes.
     """
-    data = client.get_bootstrap_static()
-    teams_map = {team['id']: team['name'] for team in data['teams']}
-    position_map = {1: 'GK', 2: 'DEF', 3: 'MID', 4: 'FWD'}
-
-    risers = []
-    fallers = []
-
-    for player in data['elements']:
-        now_cost = player['now_cost'] / 10
-        cost_change = player['cost_change_start'] / 10
-
-        if cost_change >= min_change:
-            risers.append(player)
-        elif cost_change <= -min_change:
-            fallers.append(player)
-
-    result = "=== Significant Price Changes ===\n\n"
-
-    if risers:
-        risers.sort(key=lambda x: x['cost_change_start'], reverse=True)
-        result += "Top Price Rises:\n\n"
-        for i, player in enumerate(risers[:10], 1):
-            team_name = teams_map.get(player['team'], 'Unknown')
-            position = position_map.get(player['element_type'], 'Unknown')
-            change = player['cost_change_start'] / 10
-
-            result += f"{i}. {player['web_name']} ({team_name}, {position})\n"
-            result += f"   Current: £{player['now_cost'] / 10}m | Change: +£{change}m\n"
-            result += f"   Points: {player['total_points']} | Owned by: {player['selected_by_percent']}%\n\n"
-
-    if fallers:
-        fallers.sort(key=lambda x: x['cost_change_start'])
-        result += "\nTop Price Falls:\n\n"
-        for i, player in enumerate(fallers[:10], 1):
-            team_name = teams_map.get(player['team'], 'Unknown')
-            position = position_map.get(player['element_type'], 'Unknown')
-            change = player['cost_change_start'] / 10
-
-            result += f"{i}. {player['web_name']} ({team_name}, {position})\n"
-            result += f"   Current: £{player['now_cost'] / 10}m | Change: £{change}m\n"
-            result += f"   Points: {player['total_points']} | Owned by: {player['selected_by_percent']}%\n\n"
+    snapshot = client.get_snapshot()
+    index = snapshot.index
+    table = snapshot.player_table
+
+    cost_change = table.cost_change_start / 10
+    rising = cost_change >= min_change
+    falling = (cost_change <= -min_change) & ~rising
+
+    risers = table.players_at(table.top_k(table.rows(rising), 10, table.cost_change_start))
+    fallers = table.players_at(table.top_k(table.rows(falling), 10, -table.cost_change_start))
+
+    result = ToolResult()
+    result.text("=== Significant Price Changes ===\n\n", "Price changes since season start")
+
+    columns = ('rank', 'id', 'name', 'team', 'pos', 'price', 'change', 'pts', 'sel_pct')
+    for heading, name, players, sign in [("Top Price Rises:\n\n", "rises", risers, "+"),
+                                         ("\nTop Price Falls:\n\n", "falls", fallers, "")]:
+        if not players:
+            continue
+        result.text(heading)
+        changes = result.table(name, columns,
+                               "{rank}. {name} ({team_name}, {pos})\n"
+                               "   Current: £{price}m | Change: " + sign + "£{change}m\n"
+                               "   Points: {pts} | Owned by: {sel_pct}%\n\n")
+        for i, player in enumerate(players, 1):
+            changes.add(rank=i, id=player.id, name=player.web_name, team=index.team_short_name(player.team),
+                        team_name=index.team_name(player.team), pos=index.position_name(player.element_type),
+                        price=player.now_cost / 10, change=player.cost_change_start / 10,
+                        pts=player.total_points, sel_pct=player.selected_by_percent)
 
     if not risers and not fallers:
-        result += f"No players found with price changes >= £{min_change}m"
+        result.text(f"No players found with price changes >= £{min_change}m",
+                    f"No price changes >= £{min_change}m")
+
+    return result.render(footer=snapshot.label)
+
+
+@tool
+@memoize_tool
+def plan_transfers(team_id: str = None, max_transfers: int = 2, num_gameweeks: int = 5,
+                   free_transfers: int = None) -> str:
+    """
+    Plan the best transfers for your squad over the coming gameweeks, by projected points.
+
+    Searches every plan of up to max_transfers moves across the whole player pool,
+    within your bank and the 3-per-club rule, counting -4 hits past your free
+    transfers; a move may wait a gameweek to use a rolled free transfer.
+
+    Args:
+        team_id: Your FPL team ID (optional if set in environment variable)
+        max_transfers: Most transfers to make, from 1 to 3 (default: 2)
+        num_gameweeks: Gameweeks of projected points to plan for (default: 5)
+        free_transfers: Free transfers available (default: worked out from your
+            history once the gameweek is finished, else 1)
 
-    return result
+    Returns:
+        The plan's transfers with their projected gains, hits, net gain and bank after.
+    """
+    if not team_id:
+        team_id = current_team_id()
+
+    if not team_id:
+        return "Please provide your FPL team ID or set FPL_TEAM_ID environment variable"
+
+    try:
+        team_id = int(team_id)
+    except ValueError:
+        return "Invalid team ID"
+
+    try:
+        current_gw = client.get_current_gameweek()
+        picks = client.get_team_picks(team_id, current_gw)
+        history = client.get_team_history(team_id) if free_transfers is None else None
+        snapshot = client.get_snapshot()
+        projections = snapshot.projections
+    except Exception as e:
+        raise ToolFailure(f"Error fetching team: {str(e)}")
+
+    index = snapshot.index
+    if free_transfers is None:
+        current_event = index.current_event
+        gw_finished = current_event.get('finished', False) if current_event else False
+        free_transfers = count_free_transfers(history, current_gw) if gw_finished else 1
+
+    requested = max_transfers
+    max_transfers = min(max(max_transfers, 1), MAX_PLANNED_TRANSFERS)
+
+    bank = picks.get('entry_history', {}).get('bank', 0)
+    # Week 0 is the next deadline's gameweek: the current one can't take transfers
+    first_gw = index.next_deadline_event
+    plan = optimize_transfers(projections, snapshot.player_table, [pick.element for pick in picks['picks']],
+                              bank, free_transfers=free_transfers, max_transfers=max_transfers,
+                              horizon=num_gameweeks, first_event=first_gw)
+
+    result = ToolResult()
+    result.text(f"=== Transfer Plan (GW{first_gw}-{first_gw + num_gameweeks - 1}) ===\n\n",
+                f"Transfer plan GW{first_gw}-{first_gw + num_gameweeks - 1}")
+    result.fields("Inputs",
+                  "Free transfers: {free} | Bank: £{bank}m | Up to {max} transfer{plural}\n\n",
+                  free=free_transfers, bank=bank / 10, max=max_transfers, plural='s' if max_transfers != 1 else '')
+    if max_transfers != requested:
+        result.fields("Clamped",
+                      "(Asked for {requested} transfers: plans are searched for 1 to {limit})\n\n",
+                      requested=requested, limit=MAX_PLANNED_TRANSFERS)
+
+    if not plan.moves:
+        result.text("No transfers gain projected points over the hits they cost: roll the transfer.\n",
+                    "No gain: roll the transfer")
+    else:
+        moves = result.table("moves", ('gw', 'out_id', 'out_name', 'in_id', 'in_name', 'in_team', 'in_price', 'gain'),
+                             "GW{gw}: OUT {out_name} ({out_team}, £{out_price}m) -> IN {in_name} ({in_team}, £{in_price}m)"
+                             " | +{gain} pts\n",
+                             keep=len(plan.moves))
+        for move in plan.moves:
+            player_out, player_in = index.player(move.out_id), index.player(move.in_id)
+            moves.add(gw=move.event, out_id=move.out_id, out_name=player_out.web_name,
+                      out_team=index.team_short_name(player_out.team), out_price=player_out.now_cost / 10,
+                      in_id=move.in_id, in_name=player_in.web_name, in_team=index.team_short_name(player_in.team),
+                      in_price=player_in.now_cost / 10, gain=round(move.gain, 1))
+        result.fields("Total",
+                      "\nProjected gain: +{gain} pts | Hits: -{hits} pts | Net: {net:+.1f} pts\n"
+                      "Bank after: £{bank}m\n",
+                      gain=round(plan.gain, 1), hits=plan.hits, net=round(plan.net, 1), bank=plan.bank / 10)
+
+    if not plan.complete:
+        result.text("(Search stopped at its time limit: this is the best plan found so far)\n",
+                    "Best plan found within the time limit")
+
+    return result.render(footer=snapshot.label)
@@ -0,0 +1,224 @@
+"""Multi-transfer planning: the best transfers over the coming gameweeks, by branch and bound on projected points."""
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from player_table import PlayerTable
+from projections import Projections
+
+
+MAX_PER_CLUB = 3
+MAX_FREE_TRANSFERS = 5
+HIT_COST = 4                    # Points per transfer past the free ones
+
+
+class Move:
+    """One transfer: a player out for one of the same position in, made before gameweek `event`."""
+
+    __slots__ = ('event', 'out_id', 'in_id', 'gain')
+
+    def __init__(self, event: int, out_id: int, in_id: int, gain: float):
+        self.event = event
+        self.out_id = out_id
+        self.in_id = in_id
+        self.gain = gain
+
+    def __repr__(self) -> str:
+        return f"Move(GW{self.event}: {self.out_id} -> {self.in_id}, {self.gain:+.1f})"
+
+
+class TransferPlan:
+    """
+    The best plan found: its moves, projected points gained over the horizon,
+    points spent on hits, and the bank after every move (tenths of £m).
+
+    `complete` is False when the time limit stopped the search first; the
+    plan is then the best of those searched.
+    """
+
+    __slots__ = ('moves', 'gain', 'hits', 'bank', 'complete', 'nodes', 'seconds')
+
+    def __init__(self, moves: List[Move], gain: float, hits: int, bank: int, complete: bool = True,
+                 nodes: int = 0, seconds: float = 0.0):
+        self.moves = moves
+        self.gain = gain
+        self.hits = hits
+        self.bank = bank
+        self.complete = complete
+        self.nodes = nodes
+        self.seconds = seconds
+
+    @property
+    def net(self) -> float:
+        """Projected points gained, less hits."""
+        return self.gain - self.hits
+
+    def __repr__(self) -> str:
+        return f"TransferPlan({self.moves}, net {self.net:+.1f}, {'complete' if self.complete else 'time limit'})"
+
+
+def hit_points(weeks: Sequence[int], free_transfers: int, n_weeks: int) -> int:
+    """
+    Points spent on hits for transfers made in the given weeks (0 = the next gameweek).
+
+    Unused free transfers roll over, one more each gameweek, up to five.
+    """
+    hits = 0
+    free = free_transfers
+    for week in range(n_weeks):
+        made = sum(1 for w in weeks if w == week)
+        hits += HIT_COST * max(0, made - free)
+        free = min(MAX_FREE_TRANSFERS, max(0, free - made) + 1)
+    return hits
+
+
+def optimize_transfers(projections: Projections, table: PlayerTable, squad: Sequence[int], bank: int,
+                       free_transfers: int = 1, max_transfers: int = 2, horizon: int = 5, weeks: int = 2,
+                       time_limit: float = 2.0, first_event: Optional[int] = None) -> TransferPlan:
+    """
+    Find the transfers that gain the most projected points over the horizon, net of hits.
+
+    Searches every plan of up to max_transfers moves, each made before any of
+    the next `weeks` gameweeks (a later move forgoes the earlier weeks' gain,
+    but can use a rolled free transfer), by depth-first branch and bound.
+    Plans keep the bank from going negative at any gameweek and at most three
+    players per club. A move's gain assumes the new player takes the old
+    one's place in the team; players sell at their current price.
+
+    Branches are cut when even the best remaining moves, ignoring hits,
+    club limits and most of the budget, couldn't beat the best plan so far.
+
+    Args:
+        projections: The snapshot's Projections
+        table: The snapshot's PlayerTable
+        squad: The squad's player IDs
+        bank: Money in the bank, in tenths of £m
+        free_transfers: Free transfers for the next gameweek
+        max_transfers: Most transfers in a plan
+        horizon: Gameweeks of projected points to count
+        weeks: Gameweeks in which moves may be made
+        time_limit: Seconds to search before returning the best plan found
+        first_event: The gameweek of the next deadline, when moves start
+            (default: the projections' first gameweek)
+
+    Returns:
+        The best plan; no moves if no plan gains points (roll the transfer).
+    """
+    start = time.perf_counter()
+    if first_event is None:
+        first_event = int(projections.events[0])
+    offset = max(0, first_event - int(projections.events[0]))
+    if offset >= projections.points.shape[1]:
+        return TransferPlan([], 0.0, 0, bank, seconds=time.perf_counter() - start)
+    horizon = max(1, min(horizon, projections.points.shape[1] - offset))
+    weeks = max(1, min(weeks, horizon))
+
+    row_of = {int(player_id): row for row, player_id in enumerate(table.id)}
+    outs = [row_of[player_id] for player_id in squad if player_id in row_of]
+    in_squad = np.zeros(len(table), dtype=bool)
+    in_squad[outs] = True
+
+    # Points from each gameweek on, for a move made before it: value[row, week]
+    points = projections.points[:, offset:offset + horizon]
+    value = np.cumsum(points[:, ::-1], axis=1)[:, ::-1][:, :weeks]
+    cost = table.cost.tolist()
+    club = table.team.tolist()
+    clubs: Dict[int, int] = {}
+    for row in outs:
+        clubs[club[row]] = clubs.get(club[row], 0) + 1
+
+    # Cheapest possible replacement per position: a bound on what a sale can fund
+    buyable = ~in_squad & (table.status != 'u')
+    cheapest = {int(pos): int(table.cost[buyable & (table.position == pos)].min(initial=10 ** 6))
+                for pos in np.unique(table.position)}
+    refunds = sorted((max(0, cost[row] - cheapest[int(table.position[row])]) for row in outs), reverse=True)
+    best_refund = sum(refunds[:max(0, max_transfers - 1)])
+
+    # Per squad player: candidates in (same position), best possible gain first
+    candidates: List[List[Tuple[float, int, List[Tuple[float, int]]]]] = []
+    optimistic: List[float] = []
+    for row in outs:
+        pool = np.flatnonzero(buyable & (table.position == table.position[row]))
+        gains = value[pool] - value[row]
+        top_gain = gains.max(axis=1)
+        options = []
+        for i in np.argsort(-top_gain, kind='stable'):
+            by_week = sorted(((float(g), w) for w, g in enumerate(gains[i])), reverse=True)
+            options.append((float(top_gain[i]), int(pool[i]), by_week))
+        candidates.append(options)
+        affordable = [gain for gain, p, _ in options if cost[p] <= bank + cost[row] + best_refund]
+        optimistic.append(max(0.0, affordable[0]) if affordable else 0.0)
+
+    # rest[j][k]: the most k moves with squad players j.. could gain
+    n = len(outs)
+    rest = []
+    for j in range(n + 1):
+        top = sorted(optimistic[j:], reverse=True)
+        rest.append([sum(top[:k]) for k in range(max_transfers + 1)])
+
+    best = TransferPlan([], 0.0, 0, bank)
+    best_net = 0.0
+    nodes = 0
+    stopped = False
+    moves: List[Tuple[int, int, int, float]] = []      # (out row, in row, week, gain)
+    bought = set()
+
+    def feasible() -> Optional[int]:
+        """The bank after the plan's moves, or None if a gameweek's bank or a club limit is broken."""
+        balance = bank
+        for week in range(weeks):
+            balance += sum(cost[o] - cost[p] for o, p, w, _ in moves if w == week)
+            if balance < 0:
+                return None
+        counts = dict(clubs)
+        for o, p, _, _ in moves:
+            counts[club[o]] -= 1
+            counts[club[p]] = counts.get(club[p], 0) + 1
+        if any(counts[club[p]] > MAX_PER_CLUB for _, p, _, _ in moves):
+            return None
+        return balance
+
+    def search(j: int, gain: float, balance: int, slots: int) -> None:
+        nonlocal best, best_net, nodes, stopped
+        nodes += 1
+        if moves and gain > best_net:
+            hits = hit_points([w for _, _, w, _ in moves], free_transfers, weeks)
+            if gain - hits > best_net:
+                final = feasible()
+                if final is not None:
+                    best_net = gain - hits
+                    best = TransferPlan([Move(first_event + w, int(table.id[o]), int(table.id[p]), g)
+                                         for o, p, w, g in sorted(moves, key=lambda m: m[2])], gain, hits, final)
+        if slots == 0 or stopped:
+            return
+        if nodes % 1024 == 0 and time.perf_counter() - start > time_limit:
+            stopped = True
+            return
+
+        for k in range(j, n):
+            if gain + rest[k][slots] <= best_net:
+                break
+            o = outs[k]
+            bound = rest[k + 1][slots - 1]
+            funds = balance + cost[o] + sum(refunds[:slots - 1])
+            for best_gain, p, by_week in candidates[k]:
+                if gain + best_gain + bound <= best_net or stopped:
+                    break
+                if p in bought or cost[p] > funds:
+                    continue
+                bought.add(p)
+                for move_gain, week in by_week:
+                    if gain + move_gain + bound <= best_net:
+                        break
+                    moves.append((o, p, week, move_gain))
+                    search(k + 1, gain + move_gain, balance + cost[o] - cost[p], slots - 1)
+                    moves.pop()
+                bought.discard(p)
+
+    search(0, 0.0, bank, max(0, max_transfers))
+    best.complete = not stopped
+    best.nodes = nodes
+    best.seconds = time.perf_counter() - start
+    return best
@@ -0,0 +1,219 @@
+"""Resilient HTTP transport for the FPL API: pooling, rate limiting, retries and a circuit breaker."""
+
+import os
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised without contacting the API while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Allows bursts of up to `burst` requests, refilled at `rate` per second.
+    One bucket can be shared by every client in the process.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the time waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the API is down.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are refused for `reset_timeout` seconds; then a single trial
+    request is let through (half-open) and its outcome closes or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+            if self.state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = 'closed'
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == 'half_open' or self._failures >= self.failure_threshold:
+                self.state = 'open'
+                self._opened_at = time.monotonic()
+
+
+class Transport:
+    """
+    HTTP GETs with a sized connection pool, timeouts, rate limiting and retries.
+
+    Requests answered with 429/5xx, or failing to connect or time out, are
+    retried up to `max_retries` times with exponential backoff and full jitter
+    (honouring Retry-After). Failures feed the circuit breaker; while it is
+    open, `get` raises CircuitOpenError immediately.
+    """
+
+    def __init__(self, pool_size: int = 16, timeout: Tuple[float, float] = (5.0, 15.0),
+                 rate_limiter: Optional[TokenBucket] = None, max_retries: int = 3,
+                 backoff_base: float = 0.25, backoff_max: float = 8.0,
+                 breaker: Optional[CircuitBreaker] = None):
+        """
+        Args:
+            pool_size: Connections kept per host (room for concurrent fan-out)
+            timeout: (connect, read) timeout in seconds for each attempt
+            rate_limiter: Token bucket every attempt must pass (None: unlimited)
+            max_retries: Retries after the first attempt
+            backoff_base: First backoff ceiling in seconds, doubled per retry
+            backoff_max: Upper bound for a single backoff (and for Retry-After)
+            breaker: Circuit breaker (None: never fail fast)
+        """
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _record(self, event: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[event] += amount
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get counts of attempts, retries, throttled responses, errors and rate-limit waits."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass  # HTTP-date form; fall back to our own backoff
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Send a GET request, retrying transient failures.
+
+        Returns:
+            The final response (any status; the caller checks it).
+
+        Raises:
+            CircuitOpenError: The breaker is open
+            requests.RequestException: Connection errors or timeouts on every attempt
+        """
+        for attempt in range(self.max_retries + 1):
+            if self.breaker is not None and not self.breaker.allow():
+                self._record('circuit_open')
+                raise CircuitOpenError(f"Circuit open, not requesting {url}")
+            if self.rate_limiter is not None:
+                self._record('rate_limit_wait', self.rate_limiter.acquire())
+
+            self._record('attempts')
+            response = None
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record('errors')
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    if self.breaker is not None:
+                        self.breaker.record_success()
+                    return response
+                if response.status_code == 429:
+                    # Throttled: the API is up, so don't trip the breaker
+                    self._record('throttled')
+                    if self.breaker is not None:
+                        self.breaker.record_success()
+                else:
+                    self._record('errors')
+                    if self.breaker is not None:
+                        self.breaker.record_failure()
+                if attempt == self.max_retries:
+                    return response
+
+            self._record('retries')
+            time.sleep(self._backoff(attempt, response))
+
+
+_shared_rate_limiter: Optional[TokenBucket] = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """
+    Get the process-wide token bucket for the FPL API.
+
+    Sized by FPL_RATE_LIMIT (requests per second, default 20; 0 disables it),
+    with bursts of twice that.
+    """
+    global _shared_rate_limiter
+    rate = float(os.getenv('FPL_RATE_LIMIT', '20'))
+    if rate <= 0:
+        return None
+    with _shared_rate_limiter_lock:
+        if _shared_rate_limiter is None:
+            _shared_rate_limiter = TokenBucket(rate, burst=int(rate * 2))
+        return _shared_rate_limiter
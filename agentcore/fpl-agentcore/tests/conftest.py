@@ -0,0 +1,31 @@
+"""Shared fixtures: the src directory on the path and a local stub of the FPL API."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, '..', 'src'))
+sys.path.insert(0, os.path.join(ROOT, '..', '..', '..', 'benchmarks'))
+
+from fpl_stub import StubFPLServer
+
+# Started before any test imports the tools, whose shared client reads the
+# base URL at import time. In the stub's season GW10 is in progress (no
+# fixture finished yet) and GW11 is next.
+STUB = StubFPLServer(latency=0).start()
+os.environ['FPL_API_BASE_URL'] = STUB.base_url
+os.environ.pop('FPL_TEAM_ID', None)
+
+CURRENT_GW = 10
+NEXT_GW = 11
+
+
+@pytest.fixture(scope='session')
+def stub():
+    yield STUB
+
+
+def pytest_unconfigure(config):
+    STUB.stop()
@@ -0,0 +1,57 @@
+"""Tests for the answer cache and its use in agent turns."""
+
+from agent import create_fpl_agent, run_turn
+from answer_cache import SHARED, AnswerCache, get_answer_cache, question_key
+from scripted_model import ScriptedModel, step
+from sessions import use_team
+
+
+def shared_questions():
+    cache = get_answer_cache()
+    return {key[0] for key in cache._entries if key[2] == SHARED}
+
+
+def test_question_key_normalizes_and_rejects_references():
+    assert question_key("Who are the best  differentials??") == question_key("who are the best differentials")
+    assert question_key("What about him instead?") is None
+
+
+def test_lookup_prefers_shared_then_team():
+    cache = AnswerCache()
+    cache.store('q', 1, '7', "team answer", personal=True)
+    assert cache.lookup('q', 1, '7') == "team answer"
+    assert cache.lookup('q', 1, '8') is None
+    cache.store('q', 1, '8', "shared answer", personal=False)
+    assert cache.lookup('q', 1, '9') == "shared answer"
+    assert cache.lookup('q', 2, '9') is None      # Another snapshot version
+
+
+def test_opening_question_is_shared(stub):
+    get_answer_cache().clear()
+    agent = create_fpl_agent(model=ScriptedModel([step('get_top_players', position='MID', limit=5)], 0, 0),
+                             quiet=True)
+    with use_team('1234567'):
+        run_turn(agent, "Which midfielders are the best value?", use_answer_cache=True)
+    assert question_key("Which midfielders are the best value?") in shared_questions()
+
+
+def test_follow_up_is_never_shared(stub):
+    get_answer_cache().clear()
+    model = ScriptedModel([], 0, 0)
+    agent = create_fpl_agent(model=model, quiet=True)
+    question = "Who should I buy for 8.5m?"
+    with use_team('1234567'):
+        run_turn(agent, "My budget is 8.5m and I already own Salah and Saka", use_answer_cache=True)
+        model.plan = [step('analyze_transfer_options', position='MID', max_price=8.5)]
+        run_turn(agent, question, use_answer_cache=True)
+
+    assert question_key(question) not in shared_questions()
+    assert not any(key[0] == question_key(question) for key in get_answer_cache()._entries)
+
+    # Nor is an opening answer from another session served mid-conversation
+    fresh = create_fpl_agent(model=ScriptedModel([], 0, 0), quiet=True)
+    with use_team('1000001'):
+        run_turn(fresh, question, use_answer_cache=True)
+        hits = get_answer_cache().hits['answers']
+        run_turn(agent, question, use_answer_cache=True)
+    assert get_answer_cache().hits['answers'] == hits
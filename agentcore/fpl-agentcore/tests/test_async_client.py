@@ -0,0 +1,33 @@
+"""Tests for the async client's fan-out and its shared thread pool."""
+
+from async_fpl_client import MAX_CONCURRENCY, AsyncFPLClient, get_async_client, run_sync
+from conftest import CURRENT_GW
+from fpl_client import FPLClient, get_client
+
+
+def test_clients_share_one_thread_pool(stub):
+    import live_store
+    import tools.briefing_tools as briefing_tools
+    import tools.captain_tools as captain_tools
+
+    shared = get_async_client()
+    assert get_async_client(get_client()) is shared
+    assert captain_tools.async_client is shared and briefing_tools.async_client is shared
+    assert live_store.get_live_store().async_client is shared
+    assert AsyncFPLClient(FPLClient(stub.base_url))._executor is shared._executor
+    assert shared._executor._max_workers == MAX_CONCURRENCY
+
+
+def test_fan_out_maps_each_gameweek(stub):
+    client = FPLClient(stub.base_url)
+    async_client = AsyncFPLClient(client)
+    gameweeks = [1, 2, 2, 3]
+
+    picks = run_sync(async_client.get_team_picks_many(1234567, gameweeks, max_concurrency=2))
+    assert list(picks) == [1, 2, 3]
+    expected = client.get_team_picks(1234567, 2)['picks']
+    assert [pick.element for pick in picks[2]['picks']] == [pick.element for pick in expected]
+
+    live = run_sync(async_client.get_live_gameweeks([CURRENT_GW - 1, CURRENT_GW], return_exceptions=True))
+    assert sorted(live) == [CURRENT_GW - 1, CURRENT_GW]
+    assert all('elements' in data for data in live.values())
@@ -0,0 +1,35 @@
+"""Tests for the calendar-driven cache policy."""
+
+from datetime import datetime, timezone
+
+from cache_policy import CalendarCachePolicy
+from http_cache import FOREVER, HOUR
+
+NOW = 1_760_000_000.0
+DAY = 24 * HOUR
+
+
+def event(gw, deadline, finished=False, data_checked=False, is_current=False):
+    return {'id': gw, 'deadline_time': datetime.fromtimestamp(deadline, timezone.utc).isoformat(),
+            'finished': finished, 'data_checked': data_checked, 'is_current': is_current}
+
+
+def test_only_checked_gameweeks_freeze():
+    events = [
+        event(1, NOW - 14 * DAY, finished=True, data_checked=True),
+        event(2, NOW - 7 * DAY, finished=True),            # bonus still to be confirmed
+        event(3, NOW - 1 * DAY, is_current=True),
+        event(4, NOW + 6 * DAY),
+    ]
+    policy = CalendarCachePolicy(events=lambda: events, kickoffs=lambda: [NOW + 3 * DAY])
+    quiet = {kind: ttl for kind, (_, ttl) in CalendarCachePolicy.TTLS.items()}
+
+    assert policy.expires_at('/event/1/live/', NOW) == FOREVER
+    assert policy.expires_at('/entry/42/event/1/picks/', NOW) == FOREVER
+    assert policy.expires_at('/event/2/live/', NOW) == NOW + quiet['live']
+    assert policy.expires_at('/entry/42/event/2/picks/', NOW) == NOW + quiet['picks']
+    assert policy.expires_at('/event/3/live/', NOW) < FOREVER
+
+    # Once the API checks the gameweek's data, its cached copies freeze
+    events = [dict(e, data_checked=e['finished']) for e in events]
+    assert policy.expires_at('/event/2/live/', NOW) == FOREVER
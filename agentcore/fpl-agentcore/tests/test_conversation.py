@@ -0,0 +1,102 @@
+"""Tests for the bounded conversation history."""
+
+from types import SimpleNamespace
+
+import pytest
+from strands.types.exceptions import ContextWindowOverflowException
+
+from conversation import BoundedConversationManager, _tokens, seed_history
+
+
+def turn(n, lines=3, tools=('get_top_players',)):
+    """One turn: a prompt, a tool call per tool with its result, then the answer."""
+    messages = [{'role': 'user', 'content': [{'text': f"question {n}"}]}]
+    for i, tool in enumerate(tools):
+        messages.append({'role': 'assistant', 'content': [
+            {'toolUse': {'toolUseId': f"t{n}{i}", 'name': tool, 'input': {}}}]})
+        messages.append({'role': 'user', 'content': [
+            {'toolResult': {'toolUseId': f"t{n}{i}", 'status': 'success',
+                            'content': [{'text': '\n'.join(f"{tool} line {k}" for k in range(lines))}]}}]})
+    messages.append({'role': 'assistant', 'content': [{'text': f"answer {n}"}]})
+    return messages
+
+
+def conversation(*turns):
+    return SimpleNamespace(messages=[message for t in turns for message in t])
+
+
+def test_older_turns_compacted_to_prompt_and_answer():
+    manager = BoundedConversationManager(recent_turns=2, max_tokens=100_000)
+    agent = conversation(*(turn(n) for n in range(5)))
+    recent = turn(3) + turn(4)
+
+    manager.apply_management(agent)
+
+    assert agent.messages[-len(recent):] == recent
+    older = agent.messages[:-len(recent)]
+    assert len(older) == 6
+    assert older[0] == {'role': 'user', 'content': [{'text': 'question 0'}]}
+    assert older[1] == {'role': 'assistant', 'content': [
+        {'text': "[Earlier turn; tool output no longer shown: get_top_players]"}, {'text': 'answer 0'}]}
+    assert manager.removed_message_count == 3 * 2
+
+
+def test_unanswered_turn_dropped_when_compacted():
+    manager = BoundedConversationManager(recent_turns=1, max_tokens=100_000)
+    agent = conversation(turn(0)[:-1], turn(1))
+    manager.apply_management(agent)
+    assert agent.messages == turn(1)
+
+
+def test_fit_drops_oldest_turns_first():
+    first, second, third = turn(0, lines=40), turn(1, lines=40), turn(2, lines=40)
+    ceiling = sum(_tokens(m) for m in second + third)
+    manager = BoundedConversationManager(recent_turns=10, max_tokens=ceiling)
+    agent = conversation(first, second, third)
+
+    manager._fit(agent.messages)
+
+    assert agent.messages == second + third
+    assert manager.removed_message_count == len(first)
+
+
+def test_fit_cuts_older_tool_results_of_a_long_turn():
+    long_turn = turn(0, lines=200, tools=('get_top_players', 'get_fixtures', 'search_player'))
+    manager = BoundedConversationManager(max_tokens=sum(_tokens(m) for m in long_turn) // 2)
+    agent = conversation(long_turn)
+
+    manager._fit(agent.messages)
+
+    results = [block['toolResult']['content'][0]['text'] for m in agent.messages
+               for block in m['content'] if 'toolResult' in block]
+    assert results[0] == "get_top_players line 0\n[199 more lines trimmed to fit the context]"
+    assert results[1] == "get_fixtures line 0\n[199 more lines trimmed to fit the context]"
+    # The newest result is what the model is about to read
+    assert results[2].count('\n') == 199
+
+
+def test_reduce_context_drops_oldest_turn_then_gives_up():
+    manager = BoundedConversationManager()
+    agent = conversation(turn(0), turn(1, tools=()))
+
+    manager.reduce_context(agent)
+    assert agent.messages == turn(1, tools=())
+
+    with pytest.raises(ContextWindowOverflowException):
+        manager.reduce_context(agent, ValueError("overflow"))
+
+
+def test_seed_history_keeps_alternating_text():
+    agent = SimpleNamespace(messages=[])
+    added = seed_history(agent, [
+        {'role': 'assistant', 'content': 'hello'},               # can't open the conversation
+        {'role': 'user', 'content': 'first'},
+        {'role': 'user', 'content': [{'text': 'second'}]},       # replaces the unanswered first
+        {'role': 'tool', 'content': 'ignored'},
+        SimpleNamespace(role='assistant', content='reply'),
+        {'role': 'user', 'content': 'unanswered'},
+    ])
+    assert added == 2
+    assert agent.messages == [{'role': 'user', 'content': [{'text': 'second'}]},
+                              {'role': 'assistant', 'content': [{'text': 'reply'}]}]
+    assert seed_history(agent, [{'role': 'user', 'content': 'more'}]) == 0
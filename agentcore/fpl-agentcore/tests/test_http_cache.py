@@ -0,0 +1,89 @@
+"""Tests for the HTTP response caches: freshness, 304 revalidation and persistence."""
+
+import os
+
+from fpl_client import FPLClient
+from fpl_stub import StubFPLServer
+from http_cache import CachePolicy, DiskCache, MemoryCache
+from transport import Transport
+
+TEAM_ID = 1234567
+EXPIRED = CachePolicy(rules=[(r'.*', 0)])
+
+
+def history_calls(client):
+    return client.upstream_calls[f"/entry/{TEAM_ID}/history/"]
+
+
+def test_fresh_entries_served_without_request(stub):
+    client = FPLClient(stub.base_url, cache=MemoryCache(), cache_policy=CachePolicy())
+    first = client.get_team_history(TEAM_ID)
+    assert client.get_team_history(TEAM_ID) == first
+    assert history_calls(client) == 1
+    stats = client.cache.get_stats()
+    assert stats['misses'] == 1 and stats['hits'] == 1 and stats['bytes_saved'] > 0
+
+
+def test_expired_entries_revalidated_with_304(stub):
+    client = FPLClient(stub.base_url, cache=MemoryCache(), cache_policy=EXPIRED)
+    first = client.get_team_history(TEAM_ID)
+    stored_at = client.cache.get(f"{stub.base_url}/entry/{TEAM_ID}/history/")['stored_at']
+
+    assert client.get_team_history(TEAM_ID) == first
+    assert history_calls(client) == 2
+    stats = client.cache.get_stats()
+    assert stats['revalidated'] == 1
+    assert stats['bytes_downloaded'] == stats['bytes_saved']
+    # A 304 renews the entry
+    assert client.cache.get(f"{stub.base_url}/entry/{TEAM_ID}/history/")['stored_at'] >= stored_at
+
+
+def test_disk_cache_survives_restart(stub, tmp_path):
+    gw = 3
+    before = FPLClient(stub.base_url, cache=DiskCache(str(tmp_path)), cache_policy=CachePolicy())
+    picks = before.get_team_picks(TEAM_ID, gw)
+    assert len(os.listdir(tmp_path)) == 1
+
+    # Typed records are stored as JSON and come back as records
+    fresh = FPLClient(stub.base_url, cache=DiskCache(str(tmp_path)), cache_policy=CachePolicy())
+    again = fresh.get_team_picks(TEAM_ID, gw)
+    assert [p.element for p in again['picks']] == [p.element for p in picks['picks']]
+    assert fresh.upstream_calls[f"/entry/{TEAM_ID}/event/{gw}/picks/"] == 0
+
+    expired = FPLClient(stub.base_url, cache=DiskCache(str(tmp_path)), cache_policy=EXPIRED)
+    expired.get_team_picks(TEAM_ID, gw)
+    stats = expired.cache.get_stats()
+    assert stats['revalidated'] == 1 and 'bytes_downloaded' not in stats
+
+
+def test_disk_cache_ignores_unreadable_entries(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('http://fpl.test/a/', {'body': {'x': 1}, 'stored_at': 0, 'size': 7})
+    assert cache.get('http://fpl.test/a/')['body'] == {'x': 1}
+    with open(cache._path('http://fpl.test/a/'), 'w') as f:
+        f.write('{"body": ')
+    assert cache.get('http://fpl.test/a/') is None
+    assert cache.get('http://fpl.test/missing/') is None
+
+
+def test_stale_copy_served_when_api_down():
+    server = StubFPLServer(latency=0).start()
+    try:
+        client = FPLClient(server.base_url, cache=MemoryCache(), cache_policy=EXPIRED,
+                           transport=Transport(max_retries=0))
+        history = client.get_team_history(TEAM_ID)
+        server.outage = True
+        assert client.get_team_history(TEAM_ID) == history
+        assert client.cache.get_stats()['stale_served'] == 1
+    finally:
+        server.stop()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    for url in ('a', 'b'):
+        cache.set(url, {'body': url})
+    cache.get('a')
+    cache.set('c', {'body': 'c'})
+    assert cache.get('b') is None
+    assert cache.get('a') and cache.get('c')
@@ -0,0 +1,62 @@
+"""Tests for player name search and reference resolution."""
+
+from models import Player
+from player_search import EXACT, FUZZY, PREFIX, SUBSTRING, PlayerSearchIndex, normalize_name
+
+PLAYERS = [
+    (1, 'Mohamed', 'Salah', 'M.Salah', 250),
+    (2, 'Martin', 'Ødegaard', 'Ødegaard', 150),
+    (3, 'Bukayo', 'Saka', 'Saka', 200),
+    (4, 'Heung-min', 'Son', 'Son', 120),
+    (5, 'Erling', 'Haaland', 'Haaland', 230),
+    (6, 'Bruno Borges', 'Fernandes', 'B.Fernandes', 180),
+    (7, 'Pedro', 'Porro', 'Pedro Porro', 110),
+    (8, 'Pedro', 'Neto', 'Neto', 90),
+    (9, 'Rasmus', 'Højlund', 'Højlund', 60),
+]
+
+
+def index():
+    return PlayerSearchIndex([
+        Player.from_api({'id': pid, 'first_name': first, 'second_name': second, 'web_name': web,
+                         'total_points': points})
+        for pid, first, second, web, points in PLAYERS
+    ])
+
+
+def ids(players):
+    return [p.id if p else None for p in players]
+
+
+def test_normalize_folds_accents_and_separators():
+    assert normalize_name('Ødegaard') == 'odegaard'
+    assert normalize_name('Heung-min  Son') == 'heung min son'
+    assert normalize_name('Højlund') == 'hojlund'
+    assert normalize_name(' ?! ') == ''
+
+
+def test_match_tiers_ranked_best_first():
+    search = index()
+    assert [(tier, p.id) for tier, _, p in search.match('salah')] == [(EXACT, 1)]
+    assert search.match('odegaard')[0][0] == EXACT
+    # Both Pedros by prefix, the higher scorer first
+    assert [(tier, p.id) for tier, _, p in search.match('ped')] == [(PREFIX, 7), (PREFIX, 8)]
+    assert [(tier, p.id) for tier, _, p in search.match('aala')] == [(SUBSTRING, 5)]
+    assert [(tier, p.id) for tier, _, p in search.match('heung son')] == [(PREFIX, 4)]
+
+
+def test_fuzzy_only_when_nothing_else_matches():
+    search = index()
+    tier, score, player = search.match('halaand')[0]
+    assert (tier, player.id) == (FUZZY, 5) and score >= 0.75
+    assert ids(search.search('fernandez')) == [6]
+    assert search.search('fernandez', fuzzy=False) == []
+    assert search.search('zzzz') == []
+    # A prefix match wins: no fuzzy extras
+    assert ids(search.search('sa')) == [1, 3]
+
+
+def test_resolve_ids_and_names_in_order():
+    search = index()
+    assert ids(search.resolve(['salah', ' Odegaard ', '5', 'nobody', '999'])) == [1, 2, 5, None, None]
+    assert ids(search.resolve(['hojland'])) == [9]
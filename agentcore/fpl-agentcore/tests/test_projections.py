@@ -0,0 +1,30 @@
+"""Tests for the expected-points projections."""
+
+import numpy as np
+
+from conftest import CURRENT_GW, NEXT_GW
+from fpl_client import FPLClient
+from projections import Projections
+
+
+def test_horizon_starts_at_next_deadline(stub):
+    snapshot = FPLClient(stub.base_url).get_snapshot()
+    assert snapshot.index.current_event['id'] == CURRENT_GW
+    assert not snapshot.index.current_event['finished']
+    assert snapshot.fixture_calendar.next_event == CURRENT_GW   # GW10 still has fixtures to play
+
+    projections = snapshot.projections
+    assert int(projections.events[0]) == NEXT_GW
+    assert list(projections.events[:5]) == list(range(NEXT_GW, NEXT_GW + 5))
+    assert not projections.gameweek(CURRENT_GW).any()
+
+
+def test_total_counts_upcoming_gameweeks_only(stub):
+    snapshot = FPLClient(stub.base_url).get_snapshot()
+    table, calendar = snapshot.player_table, snapshot.fixture_calendar
+    projections = Projections(table, calendar, NEXT_GW)
+    from_current = Projections(table, calendar, CURRENT_GW)
+
+    available = table.status == 'a'     # Same availability in every gameweek
+    upcoming = sum(from_current.gameweek(gw) for gw in range(NEXT_GW, NEXT_GW + 5))
+    assert np.allclose(projections.total(5)[available], upcoming[available])
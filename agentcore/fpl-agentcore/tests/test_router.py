@@ -0,0 +1,59 @@
+"""Tests for the deterministic intent router."""
+
+import pytest
+
+from router import normalize, route
+
+
+@pytest.mark.parametrize('message, expected', [
+    ("search Haaland", ('search_player', {'name': 'Haaland'})),
+    ("Hey, can you look up Bruno Fernandes please?", ('search_player', {'name': 'Bruno Fernandes'})),
+    ("find player O'Reilly", ('search_player', {'name': "O'Reilly"})),
+    ("show me my team", ('get_my_current_team', {})),
+    ("What does my squad look like?", ('get_my_current_team', {})),
+    ("what's my rank", ('get_my_team_summary', {})),
+    ("which chips do I have left", ('get_chips_status', {})),
+    ("how many free transfers do I have this week", ('get_transfer_status', {})),
+    ("my transfer history", ('get_transfer_history', {})),
+    ("any price changes tonight?", ('check_price_changes', {})),
+    ("most captained", ('get_most_captained_players', {})),
+    ("top 5 defenders", ('get_top_players', {'position': 'DEF', 'limit': 5})),
+    ("show the top strikers by points", ('get_top_players', {'position': 'FWD', 'limit': 10})),
+    ("top players", ('get_top_players', {'position': 'all', 'limit': 10})),
+    ("compare Salah and Saka", ('compare_players', {'player_ids': 'Salah,Saka'})),
+    ("Palmer vs. Saka", ('compare_players', {'player_ids': 'Palmer,Saka'})),
+    ("gw briefing", ('get_gameweek_briefing', {})),
+])
+def test_simple_lookups_routed(message, expected):
+    assert route(message) == expected
+
+
+@pytest.mark.parametrize('message', [
+    # More to it than the lookup: only whole-message matches route
+    "search Haaland and tell me if he's worth it",
+    "show me my team and suggest a transfer",
+    "top 5 defenders under 5m",
+    "top 99 midfielders",
+    # "Names" that read like questions (_NOT_NAME_WORDS)
+    "find me cheap defenders",
+    "find the best differentials",
+    "look up players under 6m",
+    "compare Salah and Saka for captain",
+    "Salah vs Saka captaincy",
+    "search 2024 goals",
+    "who should I captain this week",
+    "",
+])
+def test_everything_else_left_to_agent(message):
+    assert route(message) is None
+
+
+def test_team_tools_need_a_team():
+    assert route("show my team", team_known=False) is None
+    assert route("my chips", team_known=False) is None
+    assert route("search Haaland", team_known=False) == ('search_player', {'name': 'Haaland'})
+
+
+def test_normalize_trims_politeness_and_punctuation():
+    assert normalize("  Hi, please   show my team?! thanks ") == "show my team"
+    assert normalize("Could you show me my squad, thank you.") == "show me my squad"
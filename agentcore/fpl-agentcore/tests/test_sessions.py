@@ -0,0 +1,128 @@
+"""Tests for the per-session agent pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from sessions import AgentPool, current_team_id
+
+
+def make_pool(**kwargs):
+    return AgentPool(object, **kwargs)
+
+
+def test_turns_of_one_session_run_one_at_a_time():
+    pool = make_pool()
+    running, overlaps = set(), []
+
+    def turn(session_id):
+        with pool.session(session_id):
+            if session_id in running:
+                overlaps.append(session_id)
+            running.add(session_id)
+            time.sleep(0.02)
+            running.discard(session_id)
+
+    threads = [threading.Thread(target=turn, args=(sid,)) for sid in ['a'] * 4 + ['b'] * 4]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not overlaps
+    # Sessions a and b ran side by side: about 4 turns long, not 8
+    assert time.perf_counter() - start < 7 * 0.02
+    assert pool.get_stats() == {'sessions': 2, 'active': 0, 'created': 2, 'evictions': 0}
+
+
+def test_session_keeps_agent_and_team():
+    pool = make_pool()
+    with pool.session('a', team_id=1234567) as agent:
+        assert current_team_id() == '1234567'
+    with pool.session('a') as again:
+        assert again is agent
+        assert current_team_id() == '1234567'
+    with pool.session('b') as other:
+        assert other is not agent
+
+
+def test_idle_and_least_recently_used_sessions_evicted():
+    pool = make_pool(max_sessions=2, idle_timeout=0.05)
+    with pool.session('a'):
+        with pool.session('b'), pool.session('c'):
+            # 'a' is busy: the pool runs over rather than evict it
+            assert len(pool) == 3
+    assert 'a' in pool and len(pool) == 3
+
+    with pool.session('d'):
+        pass
+    assert len(pool) == 2 and 'a' not in pool
+
+    time.sleep(0.06)
+    with pool.session('e'):
+        pass
+    assert len(pool) == 1
+    assert not pool.evict('missing') and pool.evict('e')
+
+
+def test_async_turn_waits_without_blocking_the_loop():
+    pool = make_pool()
+
+    async def main():
+        order = []
+
+        async def turn(name):
+            async with pool.session_async('a'):
+                order.append(f"{name} start")
+                await asyncio.sleep(0.02)
+                order.append(f"{name} end")
+
+        async def ticker():
+            ticks = 0
+            while len(order) < 4:
+                ticks += 1
+                await asyncio.sleep(0.001)
+            return ticks
+
+        *_, ticks = await asyncio.gather(turn('first'), turn('second'), ticker())
+        assert order == ['first start', 'first end', 'second start', 'second end']
+        assert ticks > 5
+
+    asyncio.run(main())
+
+
+def test_cancelled_async_wait_leaves_lock_free():
+    pool = make_pool()
+
+    async def main():
+        holder_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def holder():
+            async with pool.session_async('a'):
+                holder_started.set()
+                await release.wait()
+
+        async def waiter():
+            async with pool.session_async('a'):
+                pytest.fail("the cancelled turn ran")
+
+        held = asyncio.create_task(holder())
+        await holder_started.wait()
+        waiting = asyncio.create_task(waiter())
+        await asyncio.sleep(0.02)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        release.set()
+        await held
+
+        # The cancelled wait's thread hands the lock back once it gets it
+        await asyncio.sleep(0.02)
+        assert not pool._sessions['a'].lock.locked()
+
+    asyncio.run(main())
+    assert pool.get_stats()['active'] == 0
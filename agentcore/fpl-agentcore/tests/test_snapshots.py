@@ -0,0 +1,24 @@
+"""Tests for versioned data snapshots."""
+
+from fpl_client import FPLClient
+
+
+def test_bound_fixtures_do_not_republish_snapshot(stub):
+    client = FPLClient(stub.base_url)   # No response cache
+    client.get_fixture_calendar()
+    for _ in range(5):
+        client.get_current_gameweek()
+
+    stats = client.get_stats()
+    assert stats['upstream_calls'] == {'/bootstrap-static/': 1, '/fixtures/': 1}
+    assert stats['snapshots']['current'] == 1
+
+
+def test_expired_fixtures_are_fetched_again(stub):
+    client = FPLClient(stub.base_url)
+    first = client.get_snapshot()
+    first.fixtures
+    client._fixtures_time -= 7 * 24 * 3600   # Past any fixtures TTL
+
+    client.get_snapshot()
+    assert client.get_stats()['upstream_calls']['/fixtures/'] == 2
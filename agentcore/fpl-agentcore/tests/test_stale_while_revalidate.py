@@ -0,0 +1,34 @@
+"""Tests for stale-while-revalidate bootstrap loading."""
+
+from cache_policy import CalendarCachePolicy
+from fpl_client import FPLClient
+from http_cache import CachePolicy
+
+# The calendar policy's longest bootstrap TTL, used outside busy periods
+QUIET_TTL = CalendarCachePolicy.TTLS['bootstrap'][1]
+
+
+def quiet_period_client(base_url):
+    policy = CachePolicy(rules=[(r'^/bootstrap-static/$', QUIET_TTL)])
+    return FPLClient(base_url, cache_policy=policy, stale_while_revalidate=True)
+
+
+def test_quiet_period_expiry_serves_stale(stub):
+    client = quiet_period_client(stub.base_url)
+    assert client.max_staleness <= QUIET_TTL   # The default cap is no longer than the TTL
+    first = client.get_bootstrap_static()
+    client._cache_time -= QUIET_TTL + 60      # Expired a minute ago, older than max_staleness
+
+    assert client.get_bootstrap_static() is first
+    client._refresh_thread.join()
+    assert client.get_stats()['upstream_calls']['/bootstrap-static/'] == 2
+    assert client.get_bootstrap_static() is not first
+
+
+def test_long_expired_data_blocks(stub):
+    client = quiet_period_client(stub.base_url)
+    first = client.get_bootstrap_static()
+    client._cache_time -= QUIET_TTL + client.max_staleness + 60
+
+    assert client.get_bootstrap_static() is not first
+    assert client._refresh_thread is None
@@ -0,0 +1,96 @@
+"""Tests for tool result memoization."""
+
+import pytest
+
+from sessions import current_team_id, use_team
+from tool_cache import get_tool_cache, memoize_tool
+
+
+def test_global_tools_shared_across_teams(stub):
+    from tools.player_analysis import get_top_players
+
+    cache = get_tool_cache()
+    cache.clear()
+    hits = cache.hits['get_top_players']
+    with use_team('1234567'):
+        first = get_top_players('MID', 5)
+    with use_team('1000001'):
+        second = get_top_players('MID', 5)
+
+    assert second == first
+    assert cache.hits['get_top_players'] == hits + 1
+
+
+def test_team_tools_keyed_by_team(stub):
+    from tools.team_tools import get_my_team_summary
+
+    cache = get_tool_cache()
+    cache.clear()
+    misses = cache.misses['get_my_team_summary']
+    with use_team('1234567'):
+        get_my_team_summary()
+    with use_team('1000001'):
+        get_my_team_summary()
+    with use_team('1234567'):
+        get_my_team_summary('1234567')
+
+    assert cache.misses['get_my_team_summary'] == misses + 2
+
+
+def test_tools_are_team_scoped_unless_declared_shared(stub):
+    def session_team():   # Read through a helper: still keyed by team
+        return current_team_id()
+
+    @memoize_tool
+    def team_report() -> str:
+        return f"team {session_team()}"
+
+    with use_team('1234567'):
+        assert team_report() == "team 1234567"
+    with use_team('1000001'):
+        assert team_report() == "team 1000001"
+
+
+def test_team_id_tools_cannot_be_shared():
+    with pytest.raises(TypeError):
+        @memoize_tool(team_scoped=False)
+        def team_tool(team_id: str = None) -> str:
+            return team_id
+
+
+def test_failures_are_returned_but_not_cached(stub):
+    from tool_cache import ToolFailure, record_failures
+
+    calls = []
+
+    @memoize_tool(team_scoped=False)
+    def flaky() -> str:
+        calls.append(1)
+        raise ToolFailure("No data available")
+
+    with record_failures() as failures:
+        assert flaky() == "No data available"
+        assert flaky() == "No data available"
+    assert len(calls) == 2
+    assert failures == ['flaky', 'flaky']
+
+
+def test_failed_turn_answer_not_cached(stub, monkeypatch):
+    from agent import create_fpl_agent, run_turn
+    from answer_cache import get_answer_cache
+    from scripted_model import ScriptedModel, step
+    import tools.captain_tools as captain_tools
+
+    def unavailable(team_id):
+        raise ConnectionError("FPL API unavailable")
+
+    monkeypatch.setattr(captain_tools.client, 'get_team_history', unavailable)
+    get_answer_cache().clear()
+    get_tool_cache().clear()
+    agent = create_fpl_agent(model=ScriptedModel([step('analyze_captaincy_history')], 0, 0), quiet=True)
+    with use_team('1234567'):
+        answer = str(run_turn(agent, "How have my captains done lately?", use_answer_cache=True))
+
+    assert "Error fetching history" in answer
+    assert get_answer_cache().get_stats()['entries'] == 0
+    assert get_tool_cache().get_stats()['entries'] == 0
@@ -0,0 +1,73 @@
+"""Tests for tool result rendering: output settings and the token budget."""
+
+import json
+import logging
+import re
+
+from tool_output import COMPACT, JSON, VERBOSE, ToolResult, estimate_tokens, output_settings, use_output
+
+
+def test_settings_from_environment(monkeypatch):
+    monkeypatch.setenv('FPL_TOOL_OUTPUT', 'Compact')
+    monkeypatch.setenv('FPL_TOOL_TOKEN_BUDGET', '600')
+    assert output_settings() == (COMPACT, 600)
+
+    with use_output(VERBOSE, 100):
+        assert output_settings() == (VERBOSE, 100)
+
+
+def test_bad_budget_ignored_and_logged(monkeypatch, caplog):
+    monkeypatch.setenv('FPL_TOOL_OUTPUT', 'verbose')
+    for budget in ('six hundred', '-5'):
+        monkeypatch.setenv('FPL_TOOL_TOKEN_BUDGET', budget)
+        with caplog.at_level(logging.WARNING, logger='tool_output'):
+            assert output_settings() == (VERBOSE, None)
+            assert output_settings() == (VERBOSE, None)
+        assert [record.getMessage() for record in caplog.records] == [
+            f"Ignoring FPL_TOOL_TOKEN_BUDGET={budget!r}: expected a positive number of tokens"]
+        caplog.clear()
+
+
+def players_result(first=20, second=5):
+    result = ToolResult()
+    result.text("=== Players ===\n\n", "Players")
+    result.fields("Filter", "Position: {position}\n\n", position='MID')
+    big = result.table('big', ('id', 'name', 'pts'), "{name} ({id}): {pts} pts\n", keep=3)
+    for i in range(first):
+        big.add(id=i, name=f"Player{i}", pts=100 - i)
+    small = result.table('small', ('id', 'name'), "{name}\n", keep=1)
+    for i in range(second):
+        small.add(id=100 + i, name=f"Other{i}")
+    return result
+
+
+def test_budget_cuts_rows_from_longest_table_first():
+    result = players_result()
+    full = result.render(COMPACT)
+    budget = estimate_tokens(full) - 40
+
+    text = result.render(COMPACT, budget, footer='[FPL data snapshot v1]')
+    assert estimate_tokens(text) <= budget
+    assert text.endswith('\n\n[FPL data snapshot v1]\n')
+    more = re.search(r"\n\+(\d+) more\n", text)
+    # Only the longer table lost rows, the best (first) ones kept
+    assert more and 'Player0' in text and 'Other4' in text
+    assert f"Player{19 - int(more.group(1)) + 1}" not in text
+
+
+def test_budget_stops_at_keep_rows():
+    result = players_result()
+    for mode in (VERBOSE, COMPACT, JSON):
+        text = result.render(mode, budget=1)
+        assert 'Player2' in text and 'Player3' not in text
+        assert 'Other0' in text and 'Other1' not in text
+
+    rows = json.loads(result.render(JSON, budget=1))
+    assert [item.get('more') for item in rows if isinstance(item, dict) and 'r' in item] == [17, 4]
+    assert '(+17 more not shown)' in result.render(VERBOSE, budget=1)
+
+
+def test_no_budget_renders_every_row():
+    result = players_result()
+    text = result.render(VERBOSE)
+    assert text.count(' pts\n') == 20 and 'more not shown' not in text
@@ -0,0 +1,48 @@
+"""Tests for the multi-transfer planner and the plan_transfers tool."""
+
+import re
+
+from conftest import CURRENT_GW, NEXT_GW
+from fpl_client import FPLClient
+from transfer_planner import optimize_transfers
+
+TEAM_ID = 1234567
+
+
+def test_moves_start_at_next_deadline(stub):
+    client = FPLClient(stub.base_url)
+    snapshot = client.get_snapshot()
+    assert not snapshot.index.current_event['finished']
+    picks = client.get_team_picks(TEAM_ID, CURRENT_GW)
+
+    plan = optimize_transfers(snapshot.projections, snapshot.player_table,
+                              [pick.element for pick in picks['picks']], picks['entry_history']['bank'],
+                              max_transfers=3, first_event=snapshot.index.next_deadline_event)
+    assert plan.moves
+    assert plan.moves[0].event == NEXT_GW
+    assert all(move.event >= NEXT_GW for move in plan.moves)
+
+
+def test_plan_transfers_tool_skips_gameweek_in_progress(stub):
+    from tools.transfer_tools import plan_transfers
+
+    result = plan_transfers(str(TEAM_ID), max_transfers=2)
+    assert f"GW{NEXT_GW}-{NEXT_GW + 4}" in result
+    planned = [int(gw) for gw in re.findall(r"^GW(\d+):", result, re.MULTILINE)]
+    assert planned and planned[0] == NEXT_GW
+    assert CURRENT_GW not in planned
+
+
+def test_plan_transfers_tool_clamps_max_transfers(stub):
+    from tools.transfer_tools import plan_transfers
+
+    result = plan_transfers(str(TEAM_ID), max_transfers=10)
+    assert "Up to 3 transfers" in result
+    assert "(Asked for 10 transfers: plans are searched for 1 to 3)" in result
+    assert len(re.findall(r"^GW\d+:", result, re.MULTILINE)) <= 3
+
+    result = plan_transfers(str(TEAM_ID), max_transfers=0)
+    assert "Up to 1 transfer\n" in result
+    assert "Asked for 0 transfers" in result
+
+    assert "Asked for" not in plan_transfers(str(TEAM_ID), max_transfers=2)
@@ -0,0 +1,114 @@
+"""Tests for the resilient HTTP transport: retries, circuit breaker and rate limiting."""
+
+import time
+
+import pytest
+import requests
+
+from fpl_stub import StubFPLServer
+from transport import CircuitBreaker, CircuitOpenError, TokenBucket, Transport
+
+
+def response(status, retry_after=None):
+    result = requests.Response()
+    result.status_code = status
+    if retry_after is not None:
+        result.headers['Retry-After'] = retry_after
+    return result
+
+
+def scripted(transport, statuses):
+    """Make the transport's session answer with these statuses in turn."""
+    answers = iter(statuses)
+    transport.session.get = lambda url, headers=None, timeout=None: next(answers)
+    return transport
+
+
+def test_retries_transient_statuses_until_success():
+    transport = scripted(Transport(backoff_base=0), [response(503), response(500), response(200)])
+    assert transport.get('http://fpl.test/').status_code == 200
+    assert transport.get_stats() == {'attempts': 3, 'errors': 2, 'retries': 2}
+
+
+def test_gives_up_after_max_retries_with_last_response():
+    transport = scripted(Transport(max_retries=2, backoff_base=0), [response(502)] * 3 + [response(200)])
+    assert transport.get('http://fpl.test/').status_code == 502
+    assert transport.get_stats()['attempts'] == 3
+
+
+def test_client_errors_not_retried():
+    transport = scripted(Transport(), [response(404), response(200)])
+    assert transport.get('http://fpl.test/').status_code == 404
+    assert transport.get_stats() == {'attempts': 1}
+
+
+def test_throttling_honours_retry_after_and_spares_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    transport = scripted(Transport(backoff_max=0.05, breaker=breaker),
+                         [response(429, retry_after='30'), response(200)])
+    start = time.perf_counter()
+    assert transport.get('http://fpl.test/').status_code == 200
+    # Retry-After is capped at backoff_max
+    assert 0.05 <= time.perf_counter() - start < 1
+    assert transport.get_stats()['throttled'] == 1
+    assert breaker.state == 'closed'
+
+
+def test_connection_errors_retried_then_raised():
+    transport = Transport(max_retries=1, backoff_base=0, timeout=(0.5, 0.5))
+    with pytest.raises(requests.ConnectionError):
+        transport.get('http://127.0.0.1:9/')
+    assert transport.get_stats() == {'attempts': 2, 'errors': 2, 'retries': 1}
+
+
+def test_breaker_opens_fails_fast_and_recovers():
+    server = StubFPLServer(latency=0).start()
+    try:
+        breaker = CircuitBreaker(failure_threshold=4, reset_timeout=0.1)
+        transport = Transport(max_retries=1, backoff_base=0, breaker=breaker)
+        url = f"{server.base_url}/bootstrap-static/"
+
+        server.outage = True
+        assert transport.get(url).status_code == 503
+        assert transport.get(url).status_code == 503
+        assert breaker.state == 'open'
+        served = sum(server.request_counts.values())
+        with pytest.raises(CircuitOpenError):
+            transport.get(url)
+        assert sum(server.request_counts.values()) == served
+
+        server.outage = False
+        time.sleep(0.1)
+        assert transport.get(url).status_code == 200
+        assert breaker.state == 'closed'
+    finally:
+        server.stop()
+
+
+def test_half_open_breaker_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+
+    time.sleep(0.05)
+    assert breaker.allow() and breaker.state == 'half_open'
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    time.sleep(0.05)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.allow() and breaker.allow()
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=100, burst=5)
+    assert [bucket.acquire() for _ in range(5)] == [0.0] * 5
+    start = time.perf_counter()
+    waits = [bucket.acquire() for _ in range(5)]
+    assert all(wait > 0 for wait in waits)
+    # Five more tokens at 100/s take about 50ms
+    assert 0.04 <= time.perf_counter() - start < 0.5
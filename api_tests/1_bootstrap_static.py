@@ -30,4 +30,4 @@ print(json.dumps({
     "elements": data['elements'][:2],  # First 2 players
     "element_types": data['element_types'],  # All positions
     "element_stats": data['element_stats'][:5]  # First 5 stat types
-}, indent=2))
+}, indent=2, default=lambda record: record.to_dict()))
@@ -23,4 +23,4 @@ data = client.get_team_picks(team_id, current_gw)
 
 print("Full Response:")
 print("-" * 80)
-print(json.dumps(data, indent=2))
+print(json.dumps(data, indent=2, default=lambda record: record.to_dict()))
@@ -14,7 +14,7 @@ client = FPLClient()
 team_id = int(os.getenv('FPL_TEAM_ID'))
 current_gw = client.get_current_gameweek()
 picks = client.get_team_picks(team_id, current_gw)
-player_id = picks['picks'][0]['element']  # First player in squad
+player_id = picks['picks'][0].element  # First player in squad
 
 print("=" * 80)
 print("PLAYER SUMMARY ENDPOINT")
@@ -25,4 +25,4 @@ print()
 
 print("Sample Fixtures (First 5):")
 print("-" * 80)
-print(json.dumps(data[:5], indent=2))
+print(json.dumps(data[:5], indent=2, default=lambda record: record.to_dict()))
@@ -0,0 +1,95 @@
+"""Measure throughput and tail latency of the resilient transport against a flaky stub API."""
+
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from http_cache import CachePolicy, MemoryCache
+from transport import CircuitBreaker, TokenBucket, Transport
+
+RTT = 0.020
+WORKERS = 16
+REQUESTS_PER_WORKER = 20
+
+
+def timed_call(func, *args):
+    start = time.perf_counter()
+    try:
+        func(*args)
+        ok = True
+    except Exception:
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def load(client, player_ids):
+    """Fetch element summaries from WORKERS threads; returns (ok count, latencies, wall time)."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(lambda pid: timed_call(client.get_player_summary, pid), player_ids))
+    wall = time.perf_counter() - start
+    return sum(ok for ok, _ in results), [latency for _, latency in results], wall
+
+
+def report(label, stub, client, ok, latencies, wall):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    stats = client.transport.get_stats()
+    print(f"  {label:30s} ok {ok:3d}/{len(latencies)} | {ok / wall:6.1f} req/s | "
+          f"p50 {p50 * 1000:6.1f}ms | p99 {p99 * 1000:7.1f}ms | "
+          f"retries {stats.get('retries', 0):3d} | 429s {stub.status_counts.get(429, 0):3d}")
+
+
+def scenario(title, stub_kwargs, transports):
+    print(title)
+    player_ids = list(range(1, WORKERS * REQUESTS_PER_WORKER + 1))
+    for label, make_transport in transports:
+        with StubFPLServer(latency=RTT, **stub_kwargs) as stub:
+            client = FPLClient(stub.base_url, transport=make_transport())
+            ok, latencies, wall = load(client, player_ids)
+            report(label, stub, client, ok, latencies, wall)
+    print()
+
+
+print("=" * 80)
+print("RESILIENT TRANSPORT BENCHMARK")
+print("=" * 80)
+print(f"{WORKERS} concurrent workers x {REQUESTS_PER_WORKER} element-summary requests | "
+      f"Simulated RTT: {RTT * 1000:.0f}ms")
+print()
+
+scenario("1. Flaky upstream (10% of requests fail with 5xx)", {'error_rate': 0.10}, [
+    ("No retries", lambda: Transport(max_retries=0)),
+    ("Retries + backoff with jitter", lambda: Transport(max_retries=3)),
+])
+
+scenario("2. Upstream allows 100 req/s, answers 429 (Retry-After: 1) beyond", {'rate_limit': 100}, [
+    ("Retries, no rate limiter", lambda: Transport(max_retries=3)),
+    ("Retries + token bucket 90/s", lambda: Transport(max_retries=3, rate_limiter=TokenBucket(90, burst=10))),
+])
+
+# 3. Full outage with a warm cache: every entry is stale and must be revalidated
+print("3. Upstream outage (every request 503), stale cache available")
+for label, breaker in [("Retries, no circuit breaker", None),
+                       ("Retries + circuit breaker", CircuitBreaker(failure_threshold=5, reset_timeout=30))]:
+    with StubFPLServer(latency=RTT) as stub:
+        client = FPLClient(stub.base_url, cache=MemoryCache(),
+                           cache_policy=CachePolicy(rules=[(r'.*', 0)]),
+                           transport=Transport(max_retries=3, breaker=breaker))
+        player_ids = list(range(1, 101))
+        load(client, player_ids)
+        stub.outage = True
+        attempts_before = client.transport.get_stats().get('attempts', 0)
+        ok, latencies, wall = load(client, player_ids)
+        report(label, stub, client, ok, latencies, wall)
+        print(f"  {'':30s} upstream attempts during outage: "
+              f"{client.transport.get_stats().get('attempts', 0) - attempts_before:3d} | "
+              f"served stale: {client.cache.get_stats().get('stale_served', 0)}")
@@ -0,0 +1,75 @@
+"""Measure bootstrap-static decode time and retained memory: full json vs orjson + field projection."""
+
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import generate_dataset
+import payloads
+
+REPEATS = 20
+
+content = json.dumps(generate_dataset()['bootstrap']).encode()
+players = json.loads(content)['elements']
+
+
+def json_full():
+    return json.loads(content)
+
+
+def orjson_full():
+    return payloads.loads(content)
+
+
+def json_projected():
+    return payloads.project_bootstrap(json.loads(content))
+
+
+def orjson_projected():
+    return payloads.decode('/bootstrap-static/', content)
+
+
+def decode_time(func):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def retained_bytes(func):
+    """Bytes still allocated while the decoded payload is alive (intermediates freed)."""
+    gc.collect()
+    tracemalloc.start()
+    data = func()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+print("=" * 80)
+print("BOOTSTRAP DECODE & PROJECTION BENCHMARK")
+print("=" * 80)
+print(f"Payload: {len(content) / 1e6:.2f} MB, {len(players)} players x {len(players[0])} fields, "
+      f"projected to {len(payloads.PLAYER_FIELDS)} | orjson installed: {'yes' if payloads.orjson else 'no'}")
+print()
+
+variants = [("json, all fields (before)", json_full), ("json + projection", json_projected)]
+if payloads.orjson is not None:
+    variants += [("orjson, all fields", orjson_full), ("orjson + projection (after)", orjson_projected)]
+
+base_time, base_memory = decode_time(json_full), retained_bytes(json_full)
+for label, func in variants:
+    elapsed, memory = decode_time(func), retained_bytes(func)
+    print(f"{label:30s} decode {elapsed * 1000:6.2f}ms ({base_time / elapsed:4.1f}x) | "
+          f"retained {memory / 1e6:6.2f} MB ({memory / base_memory:4.0%} of before)")
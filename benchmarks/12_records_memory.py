@@ -0,0 +1,101 @@
+"""Measure retained memory and tool-loop field access for a full season: raw API dicts vs slots records."""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+import payloads
+
+TEAM_ID = 1234567
+REPEATS = 200
+
+# Everything a season-long session holds: bootstrap, all fixtures and a
+# manager's picks for every gameweek, as the bytes the API would send
+paths = ['/bootstrap-static/', '/fixtures/'] + [f'/entry/{TEAM_ID}/event/{gw}/picks/' for gw in range(1, 39)]
+with StubFPLServer(latency=0) as stub:
+    responses = [(path, stub.route(path, {})) for path in paths]
+contents = [(endpoint, json.dumps(body).encode()) for endpoint, body in responses]
+
+
+def raw_dicts():
+    return [json.loads(content) for _, content in contents]
+
+
+def records():
+    return [payloads.decode(endpoint, content) for endpoint, content in contents]
+
+
+def retained_bytes(func):
+    """Bytes still allocated while the decoded season is alive."""
+    gc.collect()
+    tracemalloc.start()
+    data = func()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return size
+
+
+def dict_scan(elements):
+    # The tools' old per-call parsing of decimal strings
+    best = 0.0
+    for player in elements:
+        form = float(player['form']) if player['form'] else 0
+        score = form * 2 + float(player['ict_index']) / 10 + float(player['selected_by_percent'])
+        if player['element_type'] == 3 and player['now_cost'] <= 80:
+            best = max(best, score)
+    return best
+
+
+def record_scan(elements):
+    best = 0.0
+    for player in elements:
+        score = player.form * 2 + player.ict_index / 10 + player.selected_by_percent
+        if player.element_type == 3 and player.now_cost <= 80:
+            best = max(best, score)
+    return best
+
+
+def scan_time(func, elements):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func(elements)
+    return (time.perf_counter() - start) / REPEATS, result
+
+
+print("=" * 80)
+print("COMPACT RECORDS MEMORY BENCHMARK")
+print("=" * 80)
+bootstrap = responses[0][1]
+print(f"Season: {len(bootstrap['elements'])} players, {len(bootstrap['teams'])} teams, "
+      f"{len(responses[1][1])} fixtures, picks for 38 gameweeks "
+      f"({sum(len(c) for _, c in contents) / 1e6:.2f} MB of JSON)")
+print()
+
+before = retained_bytes(raw_dicts)
+after = retained_bytes(records)
+print(f"{'raw API dicts (before)':30s} retained {before / 1e6:6.2f} MB")
+print(f"{'slots records (after)':30s} retained {after / 1e6:6.2f} MB ({after / before:4.0%} of before)")
+print()
+
+# Per-type breakdown: the same payloads decoded one endpoint family at a time
+for label, prefix in [("bootstrap-static", '/bootstrap-static/'), ("fixtures", '/fixtures/'),
+                      ("picks x 38", '/entry/')]:
+    subset = [(e, c) for e, c in contents if e.startswith(prefix)]
+    raw = retained_bytes(lambda: [json.loads(c) for _, c in subset])
+    projected = retained_bytes(lambda: [payloads.decode(e, c) for e, c in subset])
+    print(f"  {label:28s} {raw / 1e6:6.2f} MB -> {projected / 1e6:6.2f} MB ({projected / raw:4.0%})")
+print()
+
+dict_time, expected = scan_time(dict_scan, json.loads(contents[0][1])['elements'])
+record_time, actual = scan_time(record_scan, payloads.decode(*contents[0])['elements'])
+print(f"{'player scan (string parsing)':30s} {dict_time * 1e3:6.3f}ms | records {record_time * 1e3:6.3f}ms "
+      f"| {dict_time / record_time:4.1f}x | same result: {'yes' if abs(expected - actual) < 1e-9 else 'NO'}")
@@ -0,0 +1,91 @@
+"""Check that one agent turn sees one dataset while bootstrap refreshes land mid-turn, and that old snapshots are freed."""
+
+import gc
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from http_cache import MemoryCache
+
+TURNS = 40
+THINK = 0.005      # Model time between tool calls in a turn (seconds)
+REFRESH = 0.020    # A price change lands upstream and is refreshed this often
+PLAYER_ID = 1
+
+
+def tool_reads(client):
+    """The reads a few tools make in one turn; all report the same player's price."""
+    return [
+        lambda: client.get_bootstrap_index().player(PLAYER_ID).now_cost,
+        lambda: int(client.get_player_table().cost[client.get_player_table().id == PLAYER_ID][0]),
+        lambda: client.get_player_by_id(PLAYER_ID).now_cost,
+        lambda: client.get_bootstrap_static()['elements'][PLAYER_ID - 1].now_cost,
+        lambda: client.get_snapshot().index.player(PLAYER_ID).now_cost,
+    ]
+
+
+def run_turns(client, pinned):
+    """Run TURNS turns; return (torn turns, most snapshot versions alive at once)."""
+    torn = 0
+    most_alive = 0
+    for _ in range(TURNS):
+        def turn():
+            prices = []
+            for read in tool_reads(client):
+                prices.append(read())
+                time.sleep(THINK)
+            return prices
+
+        if pinned:
+            with client.pin_snapshot():
+                prices = turn()
+                most_alive = max(most_alive, len(client.get_stats()['snapshots']['alive']))
+        else:
+            prices = turn()
+        torn += len(set(prices)) > 1
+    return torn, most_alive
+
+
+def price_changes(stub, client, stop):
+    """Raise every price upstream and refresh, as a deadline-day price update would."""
+    while not stop.is_set():
+        for player in stub.dataset['bootstrap']['elements']:
+            player['now_cost'] += 1
+        client.refresh_bootstrap()
+        client.get_snapshot()
+        time.sleep(REFRESH)
+
+
+with StubFPLServer(latency=0.002) as stub:
+    print("=" * 80)
+    print("VERSIONED SNAPSHOT CHECK")
+    print("=" * 80)
+    print(f"{TURNS} turns x {len(tool_reads(None))} tool reads, {THINK * 1000:.0f}ms apart | "
+          f"bootstrap refreshed with new prices every {REFRESH * 1000:.0f}ms")
+    print()
+
+    results = {}
+    for label, pinned in [("unpinned (before)", False), ("pinned snapshot (after)", True)]:
+        client = FPLClient(stub.base_url, cache=MemoryCache())
+        client.get_snapshot()
+        stop = threading.Event()
+        refresher = threading.Thread(target=price_changes, args=(stub, client, stop))
+        refresher.start()
+        torn, most_alive = run_turns(client, pinned)
+        stop.set()
+        refresher.join()
+        versions = client.get_stats()['snapshots']['current']
+        gc.collect()
+        alive = client.get_stats()['snapshots']['alive']
+        results[label] = torn
+        print(f"{label:26s} torn turns {torn:3d}/{TURNS} | snapshots published {versions:4d} | "
+              f"most alive during a turn: {most_alive or '-'} | alive after: {alive}")
+
+    print()
+    print(f"Every pinned turn consistent: {'yes' if results['pinned snapshot (after)'] == 0 else 'NO'}")
@@ -0,0 +1,88 @@
+"""Benchmark player name queries: per-query lowercase scan vs the prebuilt PlayerSearchIndex."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import generate_dataset
+from player_search import PlayerSearchIndex
+import payloads
+
+REPEATS = 200
+
+players = payloads.project_bootstrap(generate_dataset()['bootstrap'])['elements']
+
+# (label, query, web_name the user meant)
+QUERIES = [
+    ("surname", "Haaland", "Haaland"),
+    ("prefix", "Szob", "Szoboszlai"),
+    ("full name", "Mohamed Salah", "M.Salah"),
+    ("substring", "oszla", "Szoboszlai"),
+    ("no accent", "Odegaard", "Ødegaard"),
+    ("no accent", "Josko Gvardiol", "Gvardiol"),
+    ("typo", "Haalnd", "Haaland"),
+    ("typo", "Mbuemo", "Mbeumo"),
+    ("no match", "Zzyzx", None),
+]
+
+
+def scan_search(name, limit=10):
+    # Pre-index FPLClient.search_players: full scan, plain substring match
+    name_lower = name.lower()
+    matches = []
+    for player in players:
+        full_name = f"{player.first_name} {player.second_name}".lower()
+        if name_lower in full_name:
+            matches.append(player)
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def timed(func, query):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func(query)
+    return (time.perf_counter() - start) / REPEATS, result
+
+
+def found(result, expected):
+    if expected is None:
+        return "-" if not result else "NO"
+    names = [p.web_name for p in result]
+    if names[:1] == [expected]:
+        return "top"
+    return "yes" if expected in names else "no"
+
+
+print("=" * 80)
+print("PLAYER NAME SEARCH BENCHMARK")
+print("=" * 80)
+
+start = time.perf_counter()
+index = PlayerSearchIndex(players)
+print(f"Players: {len(players)} | Index build (once per data snapshot): "
+      f"{(time.perf_counter() - start) * 1000:.2f}ms | words: {len(index.words)}")
+print()
+print(f"{'query':28s} {'scan':>9s} {'index':>9s} {'speedup':>8s}   found (scan / index)")
+
+scan_total = index_total = 0.0
+for label, query, expected in QUERIES:
+    scan_time, scan_result = timed(scan_search, query)
+    index_time, index_result = timed(index.search, query)
+    scan_total += scan_time
+    index_total += index_time
+    print(f"{label + ': ' + query:28s} {scan_time * 1e6:7.1f}us {index_time * 1e6:7.1f}us "
+          f"{scan_time / index_time:7.1f}x   {found(scan_result, expected):>3s} / {found(index_result, expected)}")
+
+print()
+print(f"{'all queries':28s} {scan_total * 1e6:7.1f}us {index_total * 1e6:7.1f}us {scan_total / index_total:7.1f}x")
+
+refs = ["Salah", "Odegaard", "Haalnd", "351"]
+start = time.perf_counter()
+resolved = index.resolve(refs)
+print(f"Batch resolve {refs}: {[p.web_name if p else None for p in resolved]} "
+      f"in {(time.perf_counter() - start) * 1e6:.0f}us")
@@ -0,0 +1,95 @@
+"""Benchmark a conversation's repeated tool calls with and without tool result memoization."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020
+TEAM_ID = '1234567'
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+from fpl_client import get_client
+from tool_cache import get_tool_cache
+from tools.captain_tools import suggest_captain, compare_captain_options, analyze_captaincy_history
+from tools.player_analysis import search_player, compare_players, get_player_fixtures
+from tools.team_tools import get_my_current_team, analyze_team_fixtures, get_transfer_status
+from tools.transfer_tools import analyze_transfer_options
+
+# The calls an LLM makes over one conversation about captaincy and transfers:
+# it re-checks the squad and re-runs lookups as the user asks follow-ups
+CONVERSATION = [
+    (get_my_current_team, (), {}),
+    (suggest_captain, (), {}),
+    (get_my_current_team, (), {'team_id': TEAM_ID}),
+    (compare_captain_options, ("Haaland, Salah",), {}),
+    (analyze_captaincy_history, (), {}),
+    (get_player_fixtures, (1,), {}),
+    (suggest_captain, (), {'team_id': TEAM_ID}),
+    (search_player, ("Salah",), {}),
+    (compare_players, ("Salah, Saka, Palmer",), {}),
+    (analyze_team_fixtures, (), {}),
+    (get_transfer_status, (), {}),
+    (analyze_transfer_options, ("MID", 8.0, 2.0), {}),
+    (get_my_current_team, (), {}),
+    (compare_captain_options, ("Haaland,  Salah",), {}),
+    (analyze_team_fixtures, (), {}),
+    (analyze_transfer_options, ("MID", 8.0, 2.0), {}),
+]
+
+
+def unwrapped(tool):
+    """The tool function without the memoization layer."""
+    return tool._tool_func.__wrapped__
+
+
+def run(conversation, memoized):
+    client = get_client()
+    before = sum(client.upstream_calls.values())
+    start = time.perf_counter()
+    results = [(tool if memoized else unwrapped(tool))(*args, **kwargs) for tool, args, kwargs in conversation]
+    return time.perf_counter() - start, sum(client.upstream_calls.values()) - before, results
+
+
+print("=" * 80)
+print("TOOL RESULT MEMOIZATION BENCHMARK")
+print("=" * 80)
+print(f"{len(CONVERSATION)} tool calls, {len(set((t.tool_name, a, tuple(k.items())) for t, a, k in CONVERSATION))} "
+      f"distinct as written | Simulated RTT: {RTT * 1000:.0f}ms")
+print()
+
+run(CONVERSATION, memoized=False)  # warm the HTTP cache, as earlier turns would
+get_tool_cache().clear()
+for label, memoized in [("without memoization", False), ("with memoization", True)]:
+    elapsed, upstream, results = run(CONVERSATION, memoized)
+    print(f"{label:24s} {elapsed * 1000:8.1f}ms | {upstream:3d} upstream requests")
+    if not memoized:
+        expected = results
+same = results == expected
+print(f"Same tool results: {'yes' if same else 'NO'}")
+print()
+
+print("Per-tool hit rates:")
+for tool, stats in get_tool_cache().get_stats()['tools'].items():
+    print(f"  {tool:28s} hits={stats['hits']:2d} misses={stats['misses']:2d} hit rate={stats['hit_rate']:5.0%}")
+print()
+
+# A price change lands: the new snapshot version must miss, not serve old prices
+for player in stub.dataset['bootstrap']['elements']:
+    player['now_cost'] += 5
+get_client().refresh_bootstrap()
+tool, args, kwargs = analyze_transfer_options, ("MID", 8.0, 2.0), {}
+fresh = unwrapped(tool)(*args, **kwargs)
+memoized = tool(*args, **kwargs)
+print(f"After a price change (snapshot v{get_client().get_snapshot().version}): "
+      f"memoized result matches fresh data: {'yes' if memoized == fresh else 'NO'}")
+print(f"Cache: {get_tool_cache().get_stats()['entries']} entries, {get_tool_cache().get_stats()['bytes']:,} bytes")
+
+stub.stop()
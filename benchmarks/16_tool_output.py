@@ -0,0 +1,87 @@
+"""Benchmark the tokens each tool's result adds to the LLM context: verbose vs compact vs JSON, and within a budget."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+TEAM_ID = '1234567'
+BUDGET = 200
+
+stub = StubFPLServer(latency=0.0).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+from tool_output import COMPACT, JSON, VERBOSE, estimate_tokens, use_output
+from tools import captain_tools, player_analysis, team_tools, transfer_tools
+
+CALLS = [
+    (player_analysis.search_player, ("Salah",)),
+    (player_analysis.get_player_details, (5,)),
+    (player_analysis.get_player_fixtures, (5,)),
+    (player_analysis.compare_players, ("1,2,3",)),
+    (player_analysis.get_top_players, ("MID", 10)),
+    (transfer_tools.analyze_transfer_options, ("MID", 8.0, 2.0)),
+    (transfer_tools.find_differentials, ()),
+    (transfer_tools.suggest_transfer_swap, (5, 7.5)),
+    (transfer_tools.check_price_changes, ()),
+    (team_tools.get_my_team_summary, ()),
+    (team_tools.get_my_current_team, ()),
+    (team_tools.analyze_team_fixtures, ()),
+    (team_tools.get_transfer_history, ()),
+    (team_tools.get_chips_status, ()),
+    (team_tools.get_transfer_status, ()),
+    (captain_tools.suggest_captain, ()),
+    (captain_tools.compare_captain_options, ("1,2",)),
+    (captain_tools.get_most_captained_players, ()),
+    (captain_tools.analyze_captaincy_history, ()),
+]
+MODES = [("verbose", VERBOSE, None), ("compact", COMPACT, None), ("json", JSON, None),
+         (f"compact<={BUDGET}", COMPACT, BUDGET)]
+
+
+def run(tool, args, mode, budget):
+    with use_output(mode, budget):
+        return tool(*args)
+
+
+print("=" * 80)
+print("TOOL OUTPUT TOKENS BENCHMARK")
+print("=" * 80)
+print("Estimated tokens per tool result (tool_output.estimate_tokens)")
+print()
+print(f"{'tool':28s}" + ''.join(f"{label:>14s}" for label, _, _ in MODES))
+
+totals = [0] * len(MODES)
+outputs = {}
+for tool, args in CALLS:
+    counts = []
+    for i, (label, mode, budget) in enumerate(MODES):
+        text = run(tool, args, mode, budget)
+        outputs[tool.tool_name, label] = text
+        counts.append(estimate_tokens(text))
+        totals[i] += counts[-1]
+    print(f"{tool.tool_name:28s}" + ''.join(f"{count:14d}" for count in counts))
+
+print(f"{'all tools':28s}" + ''.join(f"{total:14d}" for total in totals))
+print(f"{'vs verbose':28s}" + ''.join(f"{total / totals[0]:13.0%} " for total in totals))
+print()
+
+# The pair of calls behind "how do my players' fixtures look?"
+pair = ['get_my_current_team', 'analyze_team_fixtures']
+for label, _, _ in MODES:
+    tokens = sum(estimate_tokens(outputs[name, label]) for name in pair)
+    print(f"{' + '.join(pair)} ({label}): {tokens} tokens")
+print()
+
+over = [name for (name, label), text in outputs.items()
+        if label == MODES[-1][0] and estimate_tokens(text) > BUDGET]
+print(f"Still over {BUDGET} tokens (tables that are never cut, like a 15-man squad): {', '.join(over) or 'none'}")
+print()
+print(f"analyze_transfer_options, compact within {BUDGET} tokens:")
+print(outputs['analyze_transfer_options', f"compact<={BUDGET}"])
+
+stub.stop()
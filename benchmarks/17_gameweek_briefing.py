@@ -0,0 +1,78 @@
+"""Benchmark agent turns for common questions: one tool per model round trip vs the composite gameweek briefing."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.400     # Per model call: time to first token plus a short generation
+LLM_PER_TOKEN = 20e-6   # Per input token (prefill)
+TEAM_ID = '1234567'
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+from strands.handlers.callback_handler import null_callback_handler
+
+from agent import create_fpl_agent, run_turn
+from scripted_model import ScriptedModel, step
+from tool_cache import get_tool_cache
+
+
+BRIEFING = [step('get_gameweek_briefing')]
+
+# (question, tool plan one call per model round trip, tool plan with the briefing)
+QUESTIONS = [
+    ("What should I do this gameweek?",
+     [step('get_my_current_team'), step('analyze_team_fixtures'), step('suggest_captain'),
+      step('get_transfer_status'), step('get_chips_status')],
+     BRIEFING),
+    ("Who should I captain this gameweek?",   # example.py, example 3
+     [step('get_my_current_team'), step('suggest_captain')],
+     BRIEFING),
+    ("Show me my current team",                # example.py, example 4: one tool either way
+     [step('get_my_current_team')],
+     [step('get_my_current_team')]),
+]
+
+
+def ask(question, plan):
+    model = ScriptedModel(plan, LLM_LATENCY, LLM_PER_TOKEN)
+    agent = create_fpl_agent(model=model)
+    agent.callback_handler = null_callback_handler
+    get_tool_cache().clear()
+    start = time.perf_counter()
+    run_turn(agent, question)
+    return time.perf_counter() - start, model.calls, model.input_tokens
+
+
+print("=" * 80)
+print("GAMEWEEK BRIEFING BENCHMARK")
+print("=" * 80)
+print(f"Model call: {LLM_LATENCY * 1000:.0f}ms + {LLM_PER_TOKEN * 1e6:.0f}us/input token | "
+      f"FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+for question, before, after in QUESTIONS:   # warm the HTTP cache, as earlier turns would
+    ask(question, before)
+    ask(question, after)
+
+print(f"{'question':38s} {'':10s} {'model calls':>11s} {'input tokens':>13s} {'wall':>9s}")
+for question, before, after in QUESTIONS:
+    results = {}
+    for label, plan in [("separate", before), ("briefing", after)]:
+        elapsed, calls, tokens = ask(question, plan)
+        results[label] = elapsed
+        print(f"{question if label == 'separate' else '':38s} {label:10s} {calls:11d} {tokens:13,d} "
+              f"{elapsed * 1000:7.0f}ms")
+    saved = results['separate'] - results['briefing']
+    print(f"{'':38s} {'saved':10s} {'':11s} {'':13s} {saved * 1000:7.0f}ms")
+    print()
+
+stub.stop()
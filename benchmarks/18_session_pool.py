@@ -0,0 +1,141 @@
+"""Benchmark concurrent AgentCore sessions: one global agent with the team ID in os.environ vs the per-session agent pool."""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.150     # Per model call
+SESSIONS = 12
+TURNS = 2
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+
+from strands.handlers.callback_handler import null_callback_handler
+
+from agent import create_fpl_agent, run_turn
+from scripted_model import ScriptedModel, step
+from sessions import AgentPool
+from tools.team_tools import get_my_team_summary
+
+PLAN = [step('get_my_team_summary')]
+USERS = [(f"session-{i}", str(1000001 + i)) for i in range(SESSIONS)]
+
+
+def new_agent():
+    agent = create_fpl_agent(model=ScriptedModel(PLAN, LLM_LATENCY, 0))
+    agent.callback_handler = null_callback_handler
+    return agent
+
+
+def prompt(session_id, turn):
+    return f"[{session_id}] Summarize my team (turn {turn})"
+
+
+def global_handler(agent, lock=None):
+    """The old handler: one shared agent, team ID passed through the process environment."""
+    def handle(session_id, team_id, message):
+        os.environ['FPL_TEAM_ID'] = team_id
+        if lock is None:
+            return run_turn(agent, message)
+        with lock:
+            return run_turn(agent, message)
+    return handle
+
+
+def pool_handler(pool):
+    """The new handler: this session's agent from the pool, team ID in session context."""
+    def handle(session_id, team_id, message):
+        with pool.session(session_id, team_id=team_id) as agent:
+            return run_turn(agent, message)
+    return handle
+
+
+def simulate(handle):
+    """Run every session's turns, sessions concurrently; count failed and wrong-team turns."""
+    errors = wrong = 0
+    counts_lock = threading.Lock()
+
+    def user(session_id, team_id):
+        nonlocal errors, wrong
+        for turn in range(TURNS):
+            try:
+                answer = str(handle(session_id, team_id, prompt(session_id, turn)))
+            except Exception:
+                with counts_lock:
+                    errors += 1
+                continue
+            if f"Stub XI {team_id}" not in answer:
+                with counts_lock:
+                    wrong += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SESSIONS) as executor:
+        for future in [executor.submit(user, *u) for u in USERS]:
+            future.result()
+    return time.perf_counter() - start, errors, wrong
+
+
+def mixed_sessions(agents):
+    """Count sessions whose agent's history holds another session's prompts."""
+    mixed = 0
+    for session_id, agent in agents:
+        prompts = [block['text'] for m in agent.messages if m['role'] == 'user'
+                   for block in m['content'] if 'text' in block]
+        if any(not p.startswith(f"[{session_id}]") for p in prompts):
+            mixed += 1
+    return mixed
+
+
+print("=" * 80)
+print("SESSION POOL BENCHMARK")
+print("=" * 80)
+print(f"{SESSIONS} concurrent sessions x {TURNS} turns, each with its own team ID | "
+      f"Model call: {LLM_LATENCY * 1000:.0f}ms | FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+for _, team_id in USERS:   # Warm the HTTP cache with every team's data
+    get_my_team_summary(team_id)
+
+print(f"{'handler':34s} {'wall':>9s} {'failed turns':>13s} {'wrong team':>11s} {'mixed histories':>16s}")
+
+shared = new_agent()
+elapsed, errors, wrong = simulate(global_handler(shared))
+print(f"{'global agent (as before)':34s} {elapsed * 1000:7.0f}ms {errors:13d} {wrong:11d} "
+      f"{mixed_sessions([(sid, shared) for sid, _ in USERS]):16d}")
+
+shared = new_agent()
+elapsed, errors, wrong = simulate(global_handler(shared, threading.Lock()))
+print(f"{'global agent, turns serialized':34s} {elapsed * 1000:7.0f}ms {errors:13d} {wrong:11d} "
+      f"{mixed_sessions([(sid, shared) for sid, _ in USERS]):16d}")
+
+pool = AgentPool(new_agent, max_sessions=SESSIONS)
+elapsed, errors, wrong = simulate(pool_handler(pool))
+agents = []
+for session_id, _ in USERS:
+    with pool.session(session_id) as agent:
+        agents.append((session_id, agent))
+print(f"{'agent pool':34s} {elapsed * 1000:7.0f}ms {errors:13d} {wrong:11d} {mixed_sessions(agents):16d}")
+print()
+
+# Bounds: LRU past max_sessions, then idle expiry
+pool = AgentPool(new_agent, max_sessions=4, idle_timeout=0.5)
+for session_id, team_id in USERS:
+    with pool.session(session_id, team_id=team_id):
+        pass
+print(f"Pool with max_sessions=4 after {SESSIONS} sessions: {len(pool)} kept, "
+      f"the 4 most recent: {all(sid in pool for sid, _ in USERS[-4:])}")
+time.sleep(0.6)
+with pool.session("session-new"):
+    pass
+print(f"After 0.6s idle (idle_timeout=0.5s), one new session: {len(pool)} kept | {pool.get_stats()}")
+
+stub.stop()
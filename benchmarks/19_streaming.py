@@ -0,0 +1,122 @@
+"""Benchmark time to first byte and concurrent sessions: synchronous turns vs the async streaming entrypoint."""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.200     # Per model call, to the first token
+ANSWER_WORDS = 30       # Words streamed after the first token of the answer
+WORD_DELAY = 0.015      # Per streamed word
+SESSIONS = 32
+SYNC_WORKERS = 8        # Threads a synchronous handler gets to serve sessions on
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+
+from agent import create_fpl_agent, run_turn, stream_turn
+from scripted_model import ScriptedModel, step
+from sessions import AgentPool
+from tools.team_tools import get_my_team_summary
+
+PLAN = [step('get_my_team_summary')]
+USERS = [(f"session-{i}", str(1000001 + i)) for i in range(SESSIONS)]
+
+
+def new_agent():
+    model = ScriptedModel(PLAN, LLM_LATENCY, 0, answer_words=ANSWER_WORDS, word_delay=WORD_DELAY)
+    return create_fpl_agent(model=model, quiet=True)
+
+
+def sync_turn(pool, session_id, team_id, message):
+    """The synchronous handler: the response arrives whole, so the first byte is the last."""
+    start = time.perf_counter()
+    with pool.session(session_id, team_id=team_id) as agent:
+        response = str(run_turn(agent, message))
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed, response
+
+
+async def streamed_turn(pool, session_id, team_id, message):
+    """The streaming entrypoint's turn, as main.handler runs it (the SDK is not needed)."""
+    start = time.perf_counter()
+    first = None
+    text = []
+    tools = []
+    async with pool.session_async(session_id, team_id=team_id) as agent:
+        async for event in stream_turn(agent, message):
+            if first is None:
+                first = time.perf_counter() - start
+            if event['type'] == 'text':
+                text.append(event['text'])
+            else:
+                tools.append(f"{event['name']}:{event['status']}")
+    return first, time.perf_counter() - start, ''.join(text), tools
+
+
+def summary(label, results, wall):
+    firsts = sorted(r[0] for r in results)
+    totals = sorted(r[1] for r in results)
+    p95 = firsts[int(len(firsts) * 0.95) - 1]
+    print(f"{label:32s} {statistics.median(firsts) * 1000:7.0f}ms {p95 * 1000:7.0f}ms "
+          f"{statistics.median(totals) * 1000:8.0f}ms {wall * 1000:8.0f}ms {len(results) / wall:9.1f}")
+
+
+print("=" * 80)
+print("STREAMING ENTRYPOINT BENCHMARK")
+print("=" * 80)
+print(f"One tool call + a {ANSWER_WORDS + 1}-chunk answer per turn | Model call: {LLM_LATENCY * 1000:.0f}ms "
+      f"to first token, {WORD_DELAY * 1000:.0f}ms per chunk | FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+for _, team_id in USERS:   # Warm the HTTP cache with every team's data
+    get_my_team_summary(team_id)
+
+# One turn's event stream
+pool = AgentPool(new_agent)
+first, total, text, tools = asyncio.run(streamed_turn(pool, *USERS[0], "Summarize my team"))
+print(f"Events: {', '.join(tools)}, then {ANSWER_WORDS + 1} text chunks starting {text[:22]!r}")
+print()
+
+print(f"{'':32s} {'first byte':>19s} {'':>10s}")
+print(f"{'handler':32s} {'p50':>9s} {'p95':>9s} {'turn p50':>10s} {'wall':>10s} {'turns/s':>9s}")
+
+pool = AgentPool(new_agent)
+start = time.perf_counter()
+results = [sync_turn(pool, *USERS[0], "Summarize my team")]
+summary("sync, 1 session", results, time.perf_counter() - start)
+
+pool = AgentPool(new_agent)
+start = time.perf_counter()
+results = [asyncio.run(streamed_turn(pool, *USERS[0], "Summarize my team"))]
+summary("streaming, 1 session", results, time.perf_counter() - start)
+
+pool = AgentPool(new_agent, max_sessions=SESSIONS)
+start = time.perf_counter()
+with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+    results = list(executor.map(lambda user: sync_turn(pool, *user, "Summarize my team"), USERS))
+summary(f"sync, {SESSIONS} sessions / {SYNC_WORKERS} threads", results, time.perf_counter() - start)
+
+
+async def all_sessions(pool):
+    return await asyncio.gather(*(streamed_turn(pool, *user, "Summarize my team") for user in USERS))
+
+pool = AgentPool(new_agent, max_sessions=SESSIONS)
+start = time.perf_counter()
+results = asyncio.run(all_sessions(pool))
+wall = time.perf_counter() - start
+summary(f"streaming, {SESSIONS} sessions / 1 loop", results, wall)
+wrong = sum(1 for (_, team_id), result in zip(USERS, results) if f"Stub XI {team_id}" not in result[2])
+print()
+print(f"Streamed turns answered for another session's team: {wrong}")
+
+stub.stop()
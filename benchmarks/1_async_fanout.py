@@ -0,0 +1,50 @@
+"""Benchmark sequential vs concurrent per-gameweek fetches (a manager's picks and live points for the season so far)."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from async_fpl_client import AsyncFPLClient, run_sync
+
+RTT = 0.100  # Simulated round-trip time per request (seconds)
+TEAM_ID = 1234567
+
+with StubFPLServer(latency=RTT) as stub:
+    client = FPLClient(base_url=stub.base_url)
+    async_client = AsyncFPLClient(client)
+
+    gameweeks = list(range(1, client.get_current_gameweek()))
+    requests = 2 * len(gameweeks)
+
+    print("=" * 80)
+    print("ASYNC FAN-OUT BENCHMARK")
+    print("=" * 80)
+    print(f"Gameweeks: {len(gameweeks)} (picks + live = {requests} requests) | Simulated RTT: {RTT * 1000:.0f}ms")
+    print()
+
+    start = time.perf_counter()
+    for gw in gameweeks:
+        client.get_team_picks(TEAM_ID, gw)
+        client.get_live_gameweek(gw)
+    sequential = time.perf_counter() - start
+    print(f"Sequential picks + live:              {sequential:.3f}s ({sequential / RTT:.1f} x RTT)")
+
+    async def fan_out(cap):
+        picks = await async_client.get_team_picks_many(TEAM_ID, gameweeks, max_concurrency=cap)
+        live = await async_client.get_live_gameweeks(gameweeks, max_concurrency=cap)
+        return picks, live
+
+    for cap in (4, 8, 15):
+        start = time.perf_counter()
+        picks, live = run_sync(fan_out(cap))
+        elapsed = time.perf_counter() - start
+        assert len(picks) == len(live) == len(gameweeks)
+        print(f"Concurrent picks + live (cap={cap:>2}):    {elapsed:.3f}s ({elapsed / RTT:.1f} x RTT)")
+
+    print()
+    print(f"Speedup at full fan-out: {sequential / elapsed:.1f}x")
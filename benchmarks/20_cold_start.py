@@ -0,0 +1,128 @@
+"""Benchmark AgentCore cold start: import-time breakdown, time to ready and time to first response, eager vs fast start."""
+
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'agentcore', 'fpl-agentcore', 'src')
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SRC)
+sys.path.insert(0, HERE)
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.150             # FPL API latency, as seen from a cold container
+RUNS = 5
+DELAY = 1.0             # When the first request arrives in the second case, after ready
+
+# Each scenario runs in a fresh interpreter; it prints JSON timings (seconds
+# since the scenario started)
+PRELUDE = f"""
+import json, sys, time
+t0 = time.perf_counter()
+sys.path[:0] = [{SRC!r}, {HERE!r}]
+marks = {{}}
+def mark(name):
+    marks[name] = time.perf_counter() - t0
+"""
+
+# Import steps, one after another, as the old module-level imports ran them
+BREAKDOWN = PRELUDE + """
+import agent
+mark('agent module')
+import fpl_client
+mark('FPL client (requests, numpy)')
+import strands
+mark('Strands (boto3, pydantic, opentelemetry)')
+agent.fpl_tools()
+mark('tool modules')
+agent.create_fpl_agent(model='stand-in', quiet=True)
+mark('create agent')
+print(json.dumps(marks))
+"""
+
+FIRST_TURN = """
+time.sleep(float(sys.argv[1]))
+mark('request')
+from scripted_model import ScriptedModel, step
+turn_agent = agent.create_fpl_agent(model=ScriptedModel([step('search_player', name='Salah')], 0, 0), quiet=True)
+answer = str(agent.run_turn(turn_agent, 'Search for Mohamed Salah'))
+assert 'Salah' in answer, answer
+mark('first response')
+print(json.dumps(marks))
+"""
+
+# Before: everything imported and an agent created before the server listens
+EAGER = PRELUDE + """
+import strands
+import agent
+agent.fpl_tools()
+agent.create_fpl_agent(model='stand-in', quiet=True)
+from sessions import AgentPool
+mark('ready')
+""" + FIRST_TURN
+
+# After: the server listens once the light modules are in; Strands, the tools
+# and the FPL data load on the prewarm thread
+FAST = PRELUDE + """
+import threading
+import agent
+from sessions import AgentPool
+threading.Thread(target=agent.prewarm, daemon=True).start()
+mark('ready')
+""" + FIRST_TURN
+
+
+def run(code, env, delay=0.0):
+    out = subprocess.run([sys.executable, '-c', code, str(delay)], env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def median(runs, key):
+    return statistics.median(r[key] for r in runs)
+
+
+stub = StubFPLServer(latency=RTT).start()
+env = {k: v for k, v in os.environ.items() if k not in ('FPL_CACHE_DIR', 'FPL_TEAM_ID')}
+env['FPL_API_BASE_URL'] = stub.base_url
+
+print("=" * 80)
+print("COLD START BENCHMARK")
+print("=" * 80)
+print(f"Fresh interpreter per run, median of {RUNS} | FPL API RTT: {RTT * 1000:.0f}ms | "
+      f"first request as soon as the app is ready, or {DELAY:.0f}s later")
+print()
+
+runs = [run(BREAKDOWN, env) for _ in range(RUNS)]
+print("Import-time breakdown (each step after the previous one):")
+previous = 0.0
+for name in runs[0]:
+    at = median(runs, name)
+    print(f"  {name:42s} {(at - previous) * 1000:7.0f}ms")
+    previous = at
+print()
+
+cache_dir = tempfile.mkdtemp(prefix='fpl-cold-start-')
+try:
+    scenarios = [
+        ("eager imports (as before)", EAGER, None),
+        ("fast start, no disk cache", FAST, None),
+        ("fast start, FPL_CACHE_DIR snapshot", FAST, cache_dir),
+    ]
+    run(FAST, {**env, 'FPL_CACHE_DIR': cache_dir})   # A previous run leaves the disk snapshot
+    print(f"{'':38s} {'':9s} {'first response':>16s} {f'turn, {DELAY:.0f}s':>12s}")
+    print(f"{'startup':38s} {'ready':>9s} {'(from start)':>16s} {'after ready':>12s}")
+    for label, code, directory in scenarios:
+        scenario_env = {**env, 'FPL_CACHE_DIR': directory} if directory else env
+        runs = [run(code, scenario_env) for _ in range(RUNS)]
+        later = [run(code, scenario_env, DELAY) for _ in range(RUNS)]
+        turn = statistics.median(r['first response'] - r['request'] for r in later)
+        print(f"{label:38s} {median(runs, 'ready') * 1000:7.0f}ms {median(runs, 'first response') * 1000:14.0f}ms "
+              f"{turn * 1000:10.0f}ms")
+finally:
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    stub.stop()
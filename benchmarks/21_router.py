@@ -0,0 +1,109 @@
+"""Benchmark the fast-path intent router: precision and recall on a labeled query corpus, and turn latency saved."""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.400     # Per model call: time to first token plus a short generation
+LLM_PER_TOKEN = 20e-6   # Per input token (prefill)
+TEAM_ID = '1234567'
+CORPUS = os.path.join(os.path.dirname(__file__), 'router_corpus.json')
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+from agent import create_fpl_agent, run_turn
+from router import route
+from scripted_model import ScriptedModel, step
+from tool_cache import get_tool_cache
+
+with open(CORPUS, encoding='utf-8') as f:
+    corpus = json.load(f)
+
+print("=" * 80)
+print("FAST-PATH ROUTER BENCHMARK")
+print("=" * 80)
+print(f"{len(corpus)} labeled queries ({sum(1 for q in corpus if q['tool'])} simple lookups, "
+      f"{sum(1 for q in corpus if not q['tool'])} for the agent) | Model call: {LLM_LATENCY * 1000:.0f}ms "
+      f"+ {LLM_PER_TOKEN * 1e6:.0f}us/input token | FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+# Accuracy: a routed query must get exactly the labeled tool and arguments
+routed = correct = 0
+wrong, missed = [], []
+start = time.perf_counter()
+for query in corpus:
+    result = route(query['query'])
+    expected = (query['tool'], query['arguments']) if query['tool'] else None
+    if result is not None:
+        routed += 1
+        if result == expected:
+            correct += 1
+        else:
+            wrong.append((query['query'], result, expected))
+    elif expected is not None:
+        missed.append(query['query'])
+route_time = (time.perf_counter() - start) / len(corpus)
+
+lookups = sum(1 for q in corpus if q['tool'])
+print(f"Routed: {routed} | precision {correct / routed:.1%} | recall {correct / lookups:.1%} "
+      f"| route() {route_time * 1e6:.0f}us per query")
+for query, result, expected in wrong:
+    print(f"  WRONG  {query!r}: {result} (expected {expected})")
+for query in missed:
+    print(f"  agent  {query!r} (a lookup the router leaves to the agent)")
+print()
+
+
+def agent_turn(query, tool, arguments):
+    """The turn through the model: it picks the tool, then answers (2 model calls)."""
+    model = ScriptedModel([step(tool, **arguments)], LLM_LATENCY, LLM_PER_TOKEN)
+    agent = create_fpl_agent(model=model, quiet=True)
+    start = time.perf_counter()
+    run_turn(agent, query)
+    elapsed = time.perf_counter() - start
+    results = [block['toolResult']['content'][0]['text'] for message in agent.messages
+               for block in message['content'] if 'toolResult' in block]
+    return elapsed, results[0]
+
+
+def fast_turn(query):
+    agent = create_fpl_agent(model=ScriptedModel([], LLM_LATENCY, LLM_PER_TOKEN), quiet=True)
+    start = time.perf_counter()
+    answer = run_turn(agent, query, use_fast_path=True)
+    return time.perf_counter() - start, str(answer).rstrip('\n')
+
+
+# Latency: one query per tool, tool cache cleared so every turn runs its tool
+samples = {}
+for query in corpus:
+    if query['tool'] and route(query['query']) == (query['tool'], query['arguments']):
+        samples.setdefault(query['tool'], query)
+
+for query in samples.values():   # Warm the HTTP cache, as earlier turns would
+    agent_turn(query['query'], query['tool'], query['arguments'])
+
+print(f"{'tool':28s} {'agent turn':>11s} {'fast path':>10s} {'saved':>9s}  same answer")
+saved = []
+for tool, query in samples.items():
+    get_tool_cache().clear()
+    slow, tool_result = agent_turn(query['query'], tool, query['arguments'])
+    get_tool_cache().clear()
+    fast, answer = fast_turn(query['query'])
+    saved.append(slow - fast)
+    print(f"{tool:28s} {slow * 1000:9.0f}ms {fast * 1000:8.1f}ms {(slow - fast) * 1000:7.0f}ms  "
+          f"{answer == tool_result.rstrip(chr(10))}")
+print()
+print(f"Mean saved per routed turn: {statistics.mean(saved) * 1000:.0f}ms "
+      f"(2 model calls); across this corpus: {statistics.mean(saved) * correct / len(corpus) * 1000:.0f}ms per query")
+
+stub.stop()
@@ -0,0 +1,132 @@
+"""Benchmark the answer cache: hit ratio and turn latency for repeated questions, cached vs uncached, and freshness after a data change."""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.100     # Per model call
+LLM_PER_TOKEN = 5e-6    # Per input token (prefill)
+USERS = [str(1000001 + i) for i in range(20)]
+TURNS = 150
+SEED = 3
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+
+from agent import create_fpl_agent, run_turn
+from answer_cache import get_answer_cache
+from fpl_client import get_client
+from scripted_model import ScriptedModel, step
+from sessions import use_team
+from tool_cache import get_tool_cache
+
+# (ways users phrase the question, the tool calls the model makes for it),
+# most asked first; the last question refers back to the conversation
+QUESTIONS = [
+    (["Who are the best differentials right now?", "who are the best differentials right now",
+      "Who are the best  differentials right now??"],
+     [step('find_differentials', max_ownership=10.0)]),
+    (["Which midfielders are the best value?", "which midfielders are the best value"],
+     [step('get_top_players', position='MID', limit=10)]),
+    (["Who should I captain this week?", "who should i captain this week"],
+     [step('suggest_captain')]),
+    (["What should I do this gameweek?", "What should I do this gameweek"],
+     [step('get_gameweek_briefing')]),
+    (["Any big price changes coming?"], [step('check_price_changes')]),
+    (["How do my team's fixtures look?"], [step('analyze_team_fixtures', num_gameweeks=5)]),
+    (["Is Salah or Saka the better pick?"], [step('compare_players', player_ids='Salah,Saka')]),
+    (["What about him instead?"], [step('search_player', name='Palmer')]),
+]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(QUESTIONS))]   # Zipf-like: a few questions dominate
+
+rng = random.Random(SEED)
+workload = []
+for _ in range(TURNS):
+    phrasings, plan = rng.choices(QUESTIONS, WEIGHTS)[0]
+    workload.append((rng.choice(USERS), rng.choice(phrasings), plan))
+
+
+def turn(team_id, question, plan, use_answer_cache):
+    """One question in a new session: (seconds, answer, model calls)."""
+    model = ScriptedModel(plan, LLM_LATENCY, LLM_PER_TOKEN)
+    agent = create_fpl_agent(model=model, quiet=True)
+    start = time.perf_counter()
+    with use_team(team_id):
+        answer = str(run_turn(agent, question, use_answer_cache=use_answer_cache))
+    return time.perf_counter() - start, answer, model.calls
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def row(label, times):
+    if not times:
+        print(f"{label:30s} {'-':>6s}")
+        return
+    print(f"{label:30s} {len(times):6d} {statistics.median(times) * 1000:8.1f}ms "
+          f"{percentile(times, 0.95) * 1000:8.1f}ms {statistics.mean(times) * 1000:8.1f}ms")
+
+
+print("=" * 80)
+print("ANSWER CACHE BENCHMARK")
+print("=" * 80)
+print(f"{TURNS} questions from {len(USERS)} teams, {len(QUESTIONS)} distinct questions in varied phrasings | "
+      f"Model call: {LLM_LATENCY * 1000:.0f}ms + {LLM_PER_TOKEN * 1e6:.0f}us/input token | "
+      f"FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+for team_id in USERS:   # Warm the HTTP cache, as earlier sessions would
+    turn(team_id, "warm-up", [step('get_gameweek_briefing')], False)
+
+results = {}
+for use_answer_cache in (False, True):
+    get_tool_cache().clear()
+    get_answer_cache().clear()
+    timings, calls, answers = [], 0, []
+    start = time.perf_counter()
+    for team_id, question, plan in workload:
+        hits = get_answer_cache().hits['answers']
+        elapsed, answer, model_calls = turn(team_id, question, plan, use_answer_cache)
+        timings.append((elapsed, get_answer_cache().hits['answers'] > hits))
+        calls += model_calls
+        answers.append(answer)
+    results[use_answer_cache] = (timings, calls, answers, time.perf_counter() - start)
+
+stats = get_answer_cache().get_stats()['tools']['answers']
+print(f"{'':30s} {'turns':>6s} {'p50':>10s} {'p95':>10s} {'mean':>10s}")
+row("no answer cache", [t for t, _ in results[False][0]])
+row("answer cache: all turns", [t for t, _ in results[True][0]])
+row("  cached answers", [t for t, hit in results[True][0] if hit])
+row("  answered by the agent", [t for t, hit in results[True][0] if not hit])
+print()
+print(f"Hit ratio: {stats['hit_rate']:.1%} ({stats['hits']} hits, {get_answer_cache().shared_hits} shared "
+      f"across teams, {stats['misses']} misses; questions referring back are never looked up)")
+print(f"Model calls: {results[False][1]} -> {results[True][1]} | "
+      f"wall time: {results[False][3]:.1f}s -> {results[True][3]:.1f}s")
+different = sum(1 for a, b in zip(results[False][2], results[True][2]) if a != b)
+print(f"Cached-run answers differing from the uncached run: {different}")
+print()
+
+# A price change lands: every cached answer belongs to the old snapshot version
+for player in stub.dataset['bootstrap']['elements']:
+    player['now_cost'] += 5
+get_client().refresh_bootstrap()
+stale = 0
+for phrasings, plan in QUESTIONS:
+    _, fresh, _ = turn(USERS[0], phrasings[0], plan, False)
+    _, answer, _ = turn(USERS[0], phrasings[0], plan, True)
+    stale += answer != fresh
+print(f"After a price change (snapshot v{get_client().get_snapshot().version}): "
+      f"{stale} of {len(QUESTIONS)} questions answered from before the change")
+
+stub.stop()
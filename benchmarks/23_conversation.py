@@ -0,0 +1,98 @@
+"""Benchmark a 50-turn session: prompt size and turn latency with unbounded history, Strands' sliding window and the bounded conversation manager."""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+LLM_LATENCY = 0.050     # Per model call
+LLM_PER_TOKEN = 20e-6   # Per input token (prefill)
+TEAM_ID = '1234567'
+TURNS = 50
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+from strands import Agent
+from strands.agent.conversation_manager import NullConversationManager, SlidingWindowConversationManager
+
+from agent import SYSTEM_PROMPT, create_fpl_agent, fpl_tools, run_turn
+from scripted_model import ScriptedModel, step
+
+# A session's questions, each with the tool calls the model makes for it
+SCRIPT = [
+    ("What should I do this gameweek?", [step('get_gameweek_briefing')]),
+    ("Who are the best midfielders?", [step('get_top_players', position='MID', limit=20)]),
+    ("Tell me about Salah", [step('search_player', name='Salah'), step('get_player_details', player_id=1)]),
+    ("How do my fixtures look?", [step('analyze_team_fixtures', num_gameweeks=5)]),
+    ("Any differentials?", [step('find_differentials', max_ownership=10.0)]),
+    ("Who should I captain?", [step('suggest_captain')]),
+    ("Transfer options for defenders under 5.5m?",
+     [step('analyze_transfer_options', position='DEF', max_price=5.5)]),
+]
+
+
+def replay(label, manager):
+    """
+    Run the session's turns on one agent (create_fpl_agent's, with manager None):
+    per-turn (input tokens per model call, seconds), and the final history length.
+    """
+    model = ScriptedModel([], LLM_LATENCY, LLM_PER_TOKEN)
+    if manager is None:
+        agent = create_fpl_agent(model=model, quiet=True)
+    else:
+        agent = Agent(model=model, tools=fpl_tools(), system_prompt=SYSTEM_PROMPT,
+                      conversation_manager=manager, callback_handler=None)
+    turns = []
+    for i in range(TURNS):
+        question, plan = SCRIPT[i % len(SCRIPT)]
+        model.plan = plan
+        tokens, calls = model.input_tokens, model.calls
+        start = time.perf_counter()
+        answer = str(run_turn(agent, f"{question} (turn {i + 1})"))
+        assert answer.strip(), f"{label}: no answer on turn {i + 1}"
+        elapsed = time.perf_counter() - start
+        turns.append(((model.input_tokens - tokens) // (model.calls - calls), elapsed))
+    return turns, len(agent.messages)
+
+
+print("=" * 80)
+print("CONVERSATION HISTORY BENCHMARK")
+print("=" * 80)
+print(f"{TURNS}-turn session, 1-2 tool calls per turn | Model call: {LLM_LATENCY * 1000:.0f}ms "
+      f"+ {LLM_PER_TOKEN * 1e6:.0f}us/input token | FPL API RTT: {RTT * 1000:.0f}ms")
+print()
+
+replay("warm-up", None)   # Warm the HTTP and tool caches
+
+# Every model call also sends the system prompt and tool specs (the turn 1
+# prompt, about 5000 tokens), on top of the history
+
+managers = [
+    ("unbounded history", NullConversationManager()),
+    ("sliding window (40 messages)", SlidingWindowConversationManager(window_size=40)),
+    ("bounded (4 turns, 8000 tokens)", None),
+]
+marks = [1, 10, 20, 30, 40, 50]
+print(f"{'input tokens per model call':32s}" + ''.join(f"{f'turn {m}':>9s}" for m in marks))
+results = []
+for label, manager in managers:
+    turns, history = replay(label, manager)
+    results.append((label, turns, history))
+    print(f"{label:32s}" + ''.join(f"{turns[m - 1][0]:9d}" for m in marks))
+print()
+print(f"{'turn latency':32s} {'turns 11-20':>11s} {'turns 41-50':>12s} {'growth':>8s} {'session':>9s} {'history':>9s}")
+for label, turns, history in results:
+    first = statistics.mean(t for _, t in turns[10:20])
+    last = statistics.mean(t for _, t in turns[-10:])
+    print(f"{label:32s} {first * 1000:9.0f}ms {last * 1000:10.0f}ms {last / first:7.2f}x "
+          f"{sum(t for _, t in turns):8.1f}s {history:6d} msgs")
+
+stub.stop()
@@ -0,0 +1,121 @@
+"""Benchmark the expected-points projection engine: full-league build time (NumPy vs a per-player loop), per-snapshot caching, and tools ranking by projections."""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+TEAM_ID = '1234567'
+RUNS = 20
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+os.environ['FPL_TEAM_ID'] = TEAM_ID
+
+import numpy as np
+
+import projections as model
+from fpl_client import get_client
+from projections import Projections
+from tool_cache import get_tool_cache
+from tools.captain_tools import suggest_captain
+from tools.transfer_tools import analyze_transfer_options, find_differentials, suggest_transfer_swap
+
+
+def loop_projections(table, calendar, first, horizon=model.HORIZON):
+    """The same model, one player and one fixture at a time, as a per-player Python loop would compute it."""
+    played = {team: sum(1 for f in fixtures if f.finished) for team, fixtures in calendar.by_team.items()}
+    points = []
+    for player in table.players:
+        team_played = played.get(player.team, 0)
+        plays = min(1.0, player.minutes / (90 * team_played)) if team_played else 1.0
+        ict_per_90 = player.ict_index / max(player.minutes, 90) * 90
+        per_appearance = (model.FORM_WEIGHT * player.form + model.PPG_WEIGHT * player.points_per_game
+                          + model.ICT_WEIGHT * model.ICT_POINTS * ict_per_90)
+        chance = player.chance_of_playing_next_round
+        if chance is None:
+            chance = 100 if player.status in ('a', 'd') else 0
+        row = []
+        for i, event in enumerate(range(first, first + horizon)):
+            availability = chance / 100 if i == 0 else model.LATER_AVAILABILITY.get(player.status, 0.0)
+            factor = sum(1 + model.FDR_STEP * (3 - f.difficulty) + (model.HOME_ADVANTAGE if f.is_home
+                                                                    else -model.HOME_ADVANTAGE)
+                         for f in calendar.gameweek(player.team, event))
+            row.append(plays * per_appearance * availability * factor)
+        points.append(row)
+    return points
+
+
+def timed(func, runs=RUNS):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        value = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), value
+
+
+print("=" * 80)
+print("PROJECTION ENGINE BENCHMARK")
+print("=" * 80)
+
+client = get_client()
+snapshot = client.get_snapshot()
+table, calendar = snapshot.player_table, snapshot.fixture_calendar
+first = snapshot.index.next_deadline_event
+print(f"{len(table)} players x {model.HORIZON} gameweeks from GW{first} | median of {RUNS} runs")
+print()
+
+loop_time, looped = timed(lambda: loop_projections(table, calendar, first), runs=3)
+numpy_time, built = timed(lambda: Projections(table, calendar, first, snapshot.version))
+first_time, _ = timed(lambda: snapshot.projections, runs=1)
+cached_time, _ = timed(lambda: snapshot.projections)
+print(f"{'full-league projection':36s} {'time':>10s}")
+print(f"{'per-player Python loop':36s} {loop_time * 1000:8.1f}ms")
+print(f"{'NumPy (Projections)':36s} {numpy_time * 1000:8.2f}ms  ({loop_time / numpy_time:.0f}x)")
+print(f"{'snapshot.projections, first use':36s} {first_time * 1000:8.2f}ms")
+print(f"{'snapshot.projections, cached':36s} {cached_time * 1e6:8.2f}us")
+print(f"Same points as the loop: {np.allclose(built.points, np.array(looped))}")
+print()
+
+# Blanks and doubles in the horizon: whole clubs project 0, or about twice a single fixture
+events = [int(e) for e in built.events if e < calendar.counts.shape[1]]
+for event in events:
+    blanks, doubles = calendar.blank_teams(event, range(1, 21)), calendar.double_teams(event)
+    if blanks or doubles:
+        column = built.gameweek(event)
+        notes = []
+        if blanks:
+            notes.append(f"{len(blanks)} blank clubs project {column[np.isin(table.team, blanks)].sum():.0f} pts")
+        if doubles:
+            singles = column[~np.isin(table.team, blanks + doubles)]
+            ratio = column[np.isin(table.team, doubles)].mean() / singles.mean()
+            notes.append(f"{len(doubles)} double clubs' players project {ratio:.2f}x a single fixture's")
+        print(f"GW{event}: {'; '.join(notes)}")
+print()
+
+# The tools, ranking by form/score vs by projections (tool cache cleared per call)
+calls = [
+    ("suggest_captain", lambda projected: suggest_captain(projected=projected)),
+    ("analyze_transfer_options", lambda projected: analyze_transfer_options('MID', 8.0, projected=projected)),
+    ("find_differentials", lambda projected: find_differentials(projected=projected)),
+    ("suggest_transfer_swap", lambda projected: suggest_transfer_swap(5, 7.0, projected=projected)),
+]
+print(f"{'tool':28s} {'by form/score':>14s} {'by projection':>14s}")
+for name, call in calls:
+    call(True)   # Warm the HTTP cache
+    row = []
+    for projected in (False, True):
+        def run():
+            get_tool_cache().clear()
+            return call(projected)
+        row.append(timed(run)[0])
+    print(f"{name:28s} {row[0] * 1000:12.2f}ms {row[1] * 1000:12.2f}ms")
+
+stub.stop()
@@ -0,0 +1,142 @@
+"""Benchmark the branch-and-bound transfer planner on canned squads: search time and nodes for 1-3 transfers, and exactness against brute force."""
+
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+RTT = 0.020             # FPL API latency
+HORIZON = 5
+WEEKS = 2               # Gameweeks in which moves may be made
+TIME_LIMIT = 2.0
+
+stub = StubFPLServer(latency=RTT).start()
+os.environ['FPL_API_BASE_URL'] = stub.base_url
+
+import numpy as np
+
+from fpl_client import get_client
+from transfer_planner import MAX_PER_CLUB, hit_points, optimize_transfers
+
+SHAPE = {1: 2, 2: 5, 3: 5, 4: 3}
+
+client = get_client()
+snapshot = client.get_snapshot()
+table, projections = snapshot.player_table, snapshot.projections
+xp = projections.total(HORIZON)
+
+
+def build_squad(order, stack_club=None):
+    """A valid 15-man squad (2/5/5/3, at most three per club), taking players in `order` first."""
+    need, clubs, squad = dict(SHAPE), {}, []
+    if stack_club is not None:   # Three of one club first: the club limit binds
+        order = [r for r in order if table.team[r] == stack_club][:3] + list(order)
+    for row in order:
+        position, club = int(table.position[row]), int(table.team[row])
+        if row in squad or not need[position] or clubs.get(club, 0) >= MAX_PER_CLUB:
+            continue
+        squad.append(row)
+        need[position] -= 1
+        clubs[club] = clubs.get(club, 0) + 1
+    return [int(table.id[row]) for row in squad]
+
+
+def stub_squad(team_id):
+    picks = client.get_team_picks(team_id, client.get_current_gameweek())
+    return [pick.element for pick in picks['picks']], picks['entry_history'].get('bank', 0)
+
+
+by_xp = list(np.argsort(-xp))
+best_club = int(np.bincount(table.team, weights=xp).argmax())
+SQUADS = [
+    ("stub manager 1234567", *stub_squad(1234567)),
+    ("stub manager 1000001", *stub_squad(1000001)),
+    ("stub manager 42", *stub_squad(42)),
+    ("template (top projected), £0.0m", build_squad(by_xp), 0),
+    ("budget (cheapest), £10.0m", build_squad(list(np.argsort(table.cost, kind='stable'))), 100),
+    ("weak (lowest projected), £30.0m", build_squad(by_xp[::-1]), 300),
+    ("3 from the top club, £2.0m", build_squad(list(np.argsort(table.cost, kind='stable')),
+                                               stack_club=best_club), 20),
+]
+
+
+def brute_force(squad, bank, free_transfers, max_transfers):
+    """The best net gain of every plan of up to two moves, enumerated with NumPy (for checking)."""
+    row_of = {int(player_id): row for row, player_id in enumerate(table.id)}
+    outs = [row_of[player_id] for player_id in squad]
+    in_squad = np.zeros(len(table), dtype=bool)
+    in_squad[outs] = True
+    value = np.cumsum(projections.points[:, HORIZON - 1::-1], axis=1)[:, ::-1][:, :WEEKS]
+    buyable = ~in_squad & (table.status != 'u')
+    pools = {o: np.flatnonzero(buyable & (table.position == table.position[o])) for o in outs}
+    clubs = np.bincount(table.team[outs], minlength=table.team.max() + 1)
+    best = 0.0
+    for o in outs:
+        pool = pools[o]
+        for w in range(WEEKS):
+            counts = clubs.copy()
+            counts[table.team[o]] -= 1
+            ok = (bank + table.cost[o] - table.cost[pool] >= 0) & (counts[table.team[pool]] + 1 <= MAX_PER_CLUB)
+            gains = value[pool, w] - value[o, w]
+            if ok.any():
+                best = max(best, gains[ok].max() - hit_points([w], free_transfers, WEEKS))
+    if max_transfers < 2:
+        return best
+    for o1, o2 in itertools.combinations(outs, 2):
+        p1, p2 = pools[o1], pools[o2]
+        counts = clubs.copy()
+        counts[table.team[o1]] -= 1
+        counts[table.team[o2]] -= 1
+        c1, c2 = table.team[p1][:, None], table.team[p2][None, :]
+        same = c1 == c2
+        clubs_ok = (counts[c1] + 1 + same <= MAX_PER_CLUB) & (counts[c2] + 1 + same <= MAX_PER_CLUB)
+        distinct = p1[:, None] != p2[None, :]
+        d1 = (table.cost[o1] - table.cost[p1])[:, None]
+        d2 = (table.cost[o2] - table.cost[p2])[None, :]
+        for w1, w2 in itertools.product(range(WEEKS), repeat=2):
+            ok = clubs_ok & distinct
+            for week in range(WEEKS):
+                ok = ok & (bank + d1 * (w1 <= week) + d2 * (w2 <= week) >= 0)
+            gains = (value[p1, w1] - value[o1, w1])[:, None] + (value[p2, w2] - value[o2, w2])[None, :]
+            if ok.any():
+                best = max(best, gains[ok].max() - hit_points([w1, w2], free_transfers, WEEKS))
+    return best
+
+
+print("=" * 80)
+print("TRANSFER PLANNER BENCHMARK")
+print("=" * 80)
+print(f"{len(table)} players | projected points over GW{int(projections.events[0])}-"
+      f"{int(projections.events[0]) + HORIZON - 1}, moves in the next {WEEKS} gameweeks | "
+      f"time limit {TIME_LIMIT:.0f}s")
+print()
+
+print(f"{'squad':34s} {'FT':>2s} {'k':>2s} {'time':>9s} {'nodes':>8s} {'net':>7s} {'hits':>5s} {'moves':>6s}  exact")
+worst, mismatches, checked = 0.0, 0, 0
+for label, squad, bank in SQUADS:
+    for free_transfers in (1, 2):
+        for max_transfers in (1, 2, 3):
+            plan = optimize_transfers(projections, table, squad, bank, free_transfers=free_transfers,
+                                      max_transfers=max_transfers, horizon=HORIZON, weeks=WEEKS,
+                                      time_limit=TIME_LIMIT)
+            worst = max(worst, plan.seconds)
+            exact = ''
+            if max_transfers <= 2:
+                start = time.perf_counter()
+                expected = brute_force(squad, bank, free_transfers, max_transfers)
+                same = abs(expected - plan.net) < 1e-6
+                mismatches += not same
+                checked += 1
+                exact = f"{same} (brute force {time.perf_counter() - start:.1f}s)"
+            print(f"{label:34s} {free_transfers:2d} {max_transfers:2d} {plan.seconds * 1000:7.1f}ms {plan.nodes:8d} "
+                  f"{plan.net:+7.1f} {plan.hits:5d} {len(plan.moves):6d}  "
+                  f"{exact}{'' if plan.complete else ' (time limit)'}")
+print()
+print(f"Slowest search: {worst * 1000:.1f}ms | plans differing from brute force: {mismatches} of {checked}")
+
+stub.stop()
@@ -0,0 +1,54 @@
+"""Count upstream requests per endpoint under concurrent load with the shared, coalescing client."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+
+CALLERS = 32   # Concurrent callers per endpoint
+RTT = 0.200    # Simulated round-trip time per request (seconds)
+TEAM_ID = 1234567
+
+with StubFPLServer(latency=RTT) as stub:
+    os.environ['FPL_API_BASE_URL'] = stub.base_url
+
+    from fpl_client import get_client
+    from tools import player_analysis, transfer_tools, team_tools, captain_tools
+
+    print("=" * 80)
+    print("SHARED CLIENT + SINGLE-FLIGHT BENCHMARK")
+    print("=" * 80)
+    modules = [player_analysis, transfer_tools, team_tools, captain_tools]
+    shared = len({id(m.client) for m in modules}) == 1
+    print(f"Tool modules sharing one FPLClient: {'yes' if shared else 'NO'}")
+    print(f"Concurrent callers per endpoint: {CALLERS} | Simulated RTT: {RTT * 1000:.0f}ms")
+    print()
+
+    client = get_client()
+    scenarios = [
+        ("/bootstrap-static/ (expired cache)", lambda: client.get_bootstrap_static(force_refresh=True)),
+        (f"/entry/{TEAM_ID}/history/", lambda: client.get_team_history(TEAM_ID)),
+        ("/element-summary/1/", lambda: client.get_player_summary(1)),
+    ]
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        for label, call in scenarios:
+            before = sum(stub.request_counts.values())
+            start = time.perf_counter()
+            results = list(pool.map(lambda _: call(), range(CALLERS)))
+            elapsed = time.perf_counter() - start
+            upstream = sum(stub.request_counts.values()) - before
+            same = all(r is results[0] for r in results)
+            print(f"{label:38s} {CALLERS} callers -> {upstream} upstream request(s), "
+                  f"{elapsed:.3f}s, shared result: {'yes' if same else 'no'}")
+
+    print()
+    print("Client counters:")
+    stats = client.get_stats()
+    for endpoint, count in sorted(stats['upstream_calls'].items()):
+        print(f"  {endpoint:32s} upstream={count:<3d} coalesced={stats['coalesced_calls'].get(endpoint, 0)}")
@@ -0,0 +1,77 @@
+"""Microbenchmark linear-scan lookups vs BootstrapIndex across the full player set."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import generate_dataset
+from bootstrap_index import BootstrapIndex
+import payloads
+
+REPEATS = 5
+
+data = generate_dataset()['bootstrap']
+player_ids = [p['id'] for p in data['elements']]
+team_ids = [t['id'] for t in data['teams']]
+
+
+def scan_player(player_id):
+    """Pre-index FPLClient.get_player_by_id."""
+    for player in data['elements']:
+        if player['id'] == player_id:
+            return player
+    return None
+
+
+def scan_team(team_id):
+    """Pre-index FPLClient.get_team_by_id."""
+    for team in data['teams']:
+        if team['id'] == team_id:
+            return team
+    return None
+
+
+def timed(func, keys):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for key in keys:
+            func(key)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+print("=" * 80)
+print("BOOTSTRAP INDEX MICROBENCHMARK")
+print("=" * 80)
+print(f"Players: {len(player_ids)} | Teams: {len(team_ids)} | Best of {REPEATS} runs")
+print()
+
+start = time.perf_counter()
+index = BootstrapIndex(payloads.project_bootstrap(data))
+build = time.perf_counter() - start
+print(f"Index build (once per bootstrap refresh): {build * 1000:.2f}ms")
+print()
+
+rows = [
+    ("player by id (all players)", scan_player, index.player, player_ids),
+    ("team by id (all teams)", scan_team, index.team, team_ids),
+]
+for label, scan, lookup, keys in rows:
+    linear = timed(scan, keys)
+    indexed = timed(lookup, keys)
+    print(f"{label:30s} linear {linear * 1000:8.2f}ms | indexed {indexed * 1000:6.3f}ms "
+          f"| {linear / indexed:,.0f}x faster")
+
+# Per-tool-call overhead the index removes: rebuilding teams_map for every call
+teams_map = timed(lambda _: {t['id']: t['name'] for t in data['teams']}, range(1000))
+print(f"{'teams_map rebuild (x1000)':30s} {teams_map * 1000:8.2f}ms -> 0ms (shared index)")
+
+# get_my_current_team resolves a 15-man squad
+squad = player_ids[::47][:15]
+linear = timed(scan_player, squad)
+indexed = timed(index.player, squad)
+print(f"{'15-player squad resolve':30s} linear {linear * 1e6:8.1f}us | indexed {indexed * 1e6:6.1f}us")
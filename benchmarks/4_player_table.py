@@ -0,0 +1,105 @@
+"""Benchmark per-dict screening loops vs the vectorized PlayerTable."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import generate_dataset
+from models import Player
+from player_table import PlayerTable
+
+REPEATS = 200
+
+elements = generate_dataset()['bootstrap']['elements']
+records = [Player.from_api(p) for p in elements]
+
+
+def form_of(player):
+    return float(player['form']) if player['form'] else 0
+
+
+# Pre-table implementations: parse strings and sort every dict on every call
+def loop_transfer_options():
+    candidates = [p for p in elements if p['element_type'] == 3 and p['now_cost'] / 10 <= 8.0
+                  and form_of(p) >= 2.0 and p['status'] == 'a']
+    candidates.sort(key=lambda x: (form_of(x), x['total_points']), reverse=True)
+    return candidates[:15]
+
+
+def loop_differentials():
+    diffs = [p for p in elements if float(p['selected_by_percent']) <= 10.0
+             and p['total_points'] >= 20 and p['status'] == 'a']
+    diffs.sort(key=lambda x: x['total_points'] / (float(x['selected_by_percent']) + 0.1), reverse=True)
+    return diffs[:15]
+
+
+def loop_most_captained():
+    cands = [p for p in elements if p['element_type'] in [3, 4]
+             and float(p['selected_by_percent']) > 5.0 and p['total_points'] > 20]
+    cands.sort(key=lambda x: (float(x['selected_by_percent']), form_of(x)), reverse=True)
+    return cands[:10]
+
+
+def loop_price_changes():
+    risers = [p for p in elements if p['cost_change_start'] / 10 >= 0.5]
+    risers.sort(key=lambda x: x['cost_change_start'], reverse=True)
+    return risers[:10]
+
+
+table = PlayerTable(records)
+
+
+def table_transfer_options():
+    rows = table.rows((table.position == 3) & (table.price <= 8.0) & (table.form >= 2.0) & table.available)
+    return table.players_at(table.top_k(rows, 15, table.form, table.total_points))
+
+
+def table_differentials():
+    rows = table.rows((table.ownership <= 10.0) & (table.total_points >= 20) & table.available)
+    return table.players_at(table.top_k(rows, 15, table.total_points / (table.ownership + 0.1)))
+
+
+def table_most_captained():
+    rows = table.rows(((table.position == 3) | (table.position == 4)) &
+                      (table.ownership > 5.0) & (table.total_points > 20))
+    return table.players_at(table.top_k(rows, 10, table.ownership, table.form))
+
+
+def table_price_changes():
+    rows = table.rows(table.cost_change_start / 10 >= 0.5)
+    return table.players_at(table.top_k(rows, 10, table.cost_change_start))
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func()
+    return (time.perf_counter() - start) / REPEATS, result
+
+
+print("=" * 80)
+print("COLUMNAR PLAYER TABLE BENCHMARK")
+print("=" * 80)
+
+start = time.perf_counter()
+PlayerTable(records)
+print(f"Players: {len(elements)} | Table build (once per bootstrap version): "
+      f"{(time.perf_counter() - start) * 1000:.2f}ms")
+print()
+
+pairs = [
+    ("analyze_transfer_options", loop_transfer_options, table_transfer_options),
+    ("find_differentials", loop_differentials, table_differentials),
+    ("get_most_captained_players", loop_most_captained, table_most_captained),
+    ("check_price_changes (risers)", loop_price_changes, table_price_changes),
+]
+for label, loop, vectorized in pairs:
+    loop_time, expected = timed(loop)
+    table_time, actual = timed(vectorized)
+    same = [p['id'] for p in expected] == [p.id for p in actual]
+    print(f"{label:30s} loop {loop_time * 1e3:6.3f}ms | table {table_time * 1e3:6.3f}ms "
+          f"| {loop_time / table_time:4.1f}x | {int(60 / table_time):>9,} screens/min | "
+          f"same result: {'yes' if same else 'NO'}")
@@ -0,0 +1,63 @@
+"""Measure upstream requests and bandwidth with the persistent HTTP cache across restarts."""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from http_cache import CachePolicy, DiskCache
+
+RTT = 0.050
+TEAM_ID = 1234567
+
+
+def workload(client):
+    """A typical session: bootstrap, fixtures, squad summaries, history and past gameweeks."""
+    current_gw = client.get_current_gameweek()
+    client.get_fixtures()
+    picks = client.get_team_picks(TEAM_ID, current_gw)
+    for pick in picks['picks']:
+        client.get_player_summary(pick.element)
+    client.get_team_info(TEAM_ID)
+    client.get_team_history(TEAM_ID)
+    for gw in range(1, current_gw):
+        client.get_team_picks(TEAM_ID, gw)
+        client.get_live_gameweek(gw)
+
+
+def run_phase(label, stub, client):
+    requests_before = sum(stub.request_counts.values())
+    bytes_before = stub.bytes_sent
+    start = time.perf_counter()
+    workload(client)
+    elapsed = time.perf_counter() - start
+    upstream = sum(stub.request_counts.values()) - requests_before
+    downloaded = stub.bytes_sent - bytes_before
+    stats = client.cache.get_stats()
+    print(f"{label:34s} {elapsed:6.2f}s | {upstream:3d} upstream requests | "
+          f"{downloaded / 1e6:6.2f} MB downloaded")
+    print(f"{'':34s} hits={stats.get('hits', 0)} misses={stats.get('misses', 0)} "
+          f"revalidated={stats.get('revalidated', 0)} refreshed={stats.get('refreshed', 0)} "
+          f"saved={stats.get('bytes_saved', 0) / 1e6:.2f} MB")
+
+
+with StubFPLServer(latency=RTT) as stub, tempfile.TemporaryDirectory() as cache_dir:
+    print("=" * 80)
+    print("PERSISTENT HTTP CACHE BENCHMARK")
+    print("=" * 80)
+    print(f"Cache dir: {cache_dir} | Simulated RTT: {RTT * 1000:.0f}ms")
+    print()
+
+    run_phase("1. Cold start (empty cache)", stub, FPLClient(stub.base_url, cache=DiskCache(cache_dir)))
+    run_phase("2. Restart, cache still fresh", stub, FPLClient(stub.base_url, cache=DiskCache(cache_dir)))
+
+    # Everything mutable is now stale: conditional GETs answer 304 without a body,
+    # while picks/live data for finished gameweeks never expire.
+    expired = FPLClient(stub.base_url, cache=DiskCache(cache_dir))
+    expired.cache_policy = CachePolicy(rules=[(r'.*', 0)], is_event_finished=expired._is_event_finished)
+    run_phase("3. Restart after TTLs expired", stub, expired)
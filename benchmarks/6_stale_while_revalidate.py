@@ -0,0 +1,98 @@
+"""Check that no bootstrap-static caller waits on the network after warm-up in stale-while-revalidate mode."""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from http_cache import CachePolicy
+
+RTT = 0.300        # Slow bootstrap download (seconds)
+TTL = 0.5          # Bootstrap TTL, shortened so it expires many times during the run
+DURATION = 3.0     # Seconds of load
+CALLERS = 8        # Concurrent request threads
+FAST = 0.010       # A call slower than this waited on the network
+
+
+def short_ttl_client(base_url, **kwargs):
+    return FPLClient(base_url, cache_policy=CachePolicy(rules=[(r'^/bootstrap-static/$', TTL)]), **kwargs)
+
+
+def load(client):
+    """Hammer get_bootstrap_static from several threads; return per-call latencies."""
+    latencies = []
+    lock = threading.Lock()
+    stop_at = time.monotonic() + DURATION
+
+    def caller():
+        while time.monotonic() < stop_at:
+            start = time.perf_counter()
+            client.get_bootstrap_static()
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+            time.sleep(0.005)
+
+    threads = [threading.Thread(target=caller) for _ in range(CALLERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sorted(latencies)
+
+
+def report(label, latencies, upstream):
+    slow = sum(1 for x in latencies if x > FAST)
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(f"{label:28s} calls={len(latencies):5d} | waited on network={slow:4d} | "
+          f"p99={p99 * 1000:7.2f}ms | max={latencies[-1] * 1000:7.2f}ms | upstream={upstream}")
+    return slow
+
+
+with StubFPLServer(latency=RTT) as stub:
+    print("=" * 80)
+    print("STALE-WHILE-REVALIDATE CHECK")
+    print("=" * 80)
+    print(f"Bootstrap RTT: {RTT * 1000:.0f}ms | TTL: {TTL}s | {CALLERS} callers for {DURATION}s")
+    print()
+
+    results = {}
+    for label, swr in [("Blocking refresh (before)", False), ("Stale-while-revalidate", True)]:
+        client = short_ttl_client(stub.base_url, stale_while_revalidate=swr, max_staleness=60)
+        client.get_bootstrap_static()  # warm-up
+        before = stub.request_counts["/bootstrap-static/"]
+        latencies = load(client)
+        results[swr] = report(label, latencies, stub.request_counts["/bootstrap-static/"] - before)
+
+    print()
+    checks = []
+
+    checks.append(("No request waits on the network after warm-up (SWR)", results[True] == 0))
+    checks.append(("Blocking mode makes callers wait at expiry", results[False] > 0))
+
+    # Data expired for longer than max_staleness is never served: the caller blocks instead
+    client = short_ttl_client(stub.base_url, stale_while_revalidate=True, max_staleness=0.05)
+    first = client.get_bootstrap_static()
+    time.sleep(TTL + 0.1)
+    start = time.perf_counter()
+    second = client.get_bootstrap_static()
+    checks.append(("Max staleness bound forces a blocking refresh",
+                   second is not first and time.perf_counter() - start >= RTT))
+
+    # Explicit refresh-now API
+    client = short_ttl_client(stub.base_url, stale_while_revalidate=True)
+    first = client.get_bootstrap_static()
+    before = stub.request_counts["/bootstrap-static/"]
+    refreshed = client.refresh_bootstrap()
+    checks.append(("refresh_bootstrap() fetches immediately",
+                   refreshed is not first and stub.request_counts["/bootstrap-static/"] == before + 1))
+
+    for label, ok in checks:
+        print(f"{'✓' if ok else '✗'} {label}")
+    print()
+    print("All checks passed!" if all(ok for _, ok in checks) else "Some checks failed!")
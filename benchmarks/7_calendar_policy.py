@@ -0,0 +1,84 @@
+"""Simulate a week of polling and count upstream fetches under fixed TTLs vs the calendar policy."""
+
+import os
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import generate_dataset
+from cache_policy import CalendarCachePolicy, EventCalendar, parse_time
+from http_cache import MINUTE, HOUR, CachePolicy
+
+START = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+DAYS = 7
+POLL_EVERY = 5 * MINUTE
+TEAM_ID = 1234567
+
+dataset = generate_dataset(now=START)
+events = dataset['bootstrap']['events']
+kickoffs = [parse_time(f['kickoff_time']) for f in dataset['fixtures']]
+current_gw = next(e['id'] for e in events if e['is_current'])
+finished = {e['id'] for e in events if e['finished']}
+
+# What one agent poll touches: the calendar, the squad and the last few gameweeks
+POLL = [
+    ('bootstrap', '/bootstrap-static/'),
+    ('fixtures', '/fixtures/'),
+    ('live', f'/event/{current_gw}/live/'),
+    ('entry', f'/entry/{TEAM_ID}/'),
+    ('entry', f'/entry/{TEAM_ID}/history/'),
+    ('picks', f'/entry/{TEAM_ID}/event/{current_gw}/picks/'),
+] + [('element_summary', f'/element-summary/{pid}/') for pid in range(1, 16)] \
+  + [('past gameweeks', f'/entry/{TEAM_ID}/event/{gw}/picks/') for gw in range(current_gw - 3, current_gw)] \
+  + [('past gameweeks', f'/event/{gw}/live/') for gw in range(current_gw - 3, current_gw)]
+
+
+def simulate(policy):
+    """Poll every POLL_EVERY seconds for DAYS days; count fetches by endpoint kind and day type."""
+    calendar = EventCalendar(events, kickoffs)
+    stored_at = {}
+    by_kind, by_day = Counter(), Counter()
+    t = START.timestamp()
+    end = t + DAYS * 24 * HOUR
+    while t < end:
+        day_start = t - t % (24 * HOUR)
+        match_day = any(day_start <= k < day_start + 24 * HOUR for k in kickoffs)
+        for kind, endpoint in POLL:
+            if endpoint not in stored_at or t >= policy.expires_at(endpoint, stored_at[endpoint]):
+                stored_at[endpoint] = t
+                by_kind[kind] += 1
+                by_day['match days' if match_day else 'other days'] += 1
+        t += POLL_EVERY
+    return by_kind, by_day, calendar
+
+
+fixed = CachePolicy(is_event_finished=lambda gw: gw in finished)
+calendar_policy = CalendarCachePolicy(events=lambda: events, kickoffs=lambda: kickoffs,
+                                      is_event_finished=lambda gw: gw in finished)
+
+fixed_kind, fixed_day, calendar = simulate(fixed)
+cal_kind, cal_day, _ = simulate(calendar_policy)
+
+print("=" * 80)
+print("CALENDAR CACHE POLICY BENCHMARK")
+print("=" * 80)
+polls = DAYS * 24 * HOUR // POLL_EVERY
+print(f"Simulated {DAYS} days from {START:%Y-%m-%d %H:%M} UTC, one poll every {POLL_EVERY // MINUTE} min "
+      f"({polls:,} polls x {len(POLL)} endpoints = {polls * len(POLL):,} reads)")
+deadline = calendar.next_deadline(START.timestamp())
+print(f"Next deadline: {datetime.fromtimestamp(deadline, timezone.utc):%a %H:%M} UTC, "
+      f"matches from +2h to +7h after it")
+print()
+print(f"{'Upstream fetches':22s} {'fixed TTLs':>12s} {'calendar':>12s} {'reduction':>10s}")
+for kind in dict.fromkeys(kind for kind, _ in POLL):
+    before, after = fixed_kind[kind], cal_kind[kind]
+    print(f"{kind:22s} {before:12,} {after:12,} {before / max(after, 1):9.1f}x")
+print()
+for day in ('other days', 'match days'):
+    before, after = fixed_day[day], cal_day[day]
+    print(f"{day:22s} {before:12,} {after:12,} {before / max(after, 1):9.1f}x")
+total_before, total_after = sum(fixed_kind.values()), sum(cal_kind.values())
+print(f"{'total':22s} {total_before:12,} {total_after:12,} {total_before / total_after:9.1f}x")
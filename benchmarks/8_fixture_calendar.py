@@ -0,0 +1,73 @@
+"""Compare per-player element-summary fixture lookups with the bulk FixtureCalendar."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer
+from fpl_client import FPLClient
+from async_fpl_client import AsyncFPLClient, run_sync
+from http_cache import MemoryCache
+
+RTT = 0.050
+TEAM_ID = 1234567
+NUM_FIXTURES = 5
+
+
+def squad(client):
+    index = client.get_bootstrap_index()
+    picks = client.get_team_picks(TEAM_ID, client.get_current_gameweek())
+    return [index.player(pick.element) for pick in picks['picks'][:11]]
+
+
+def via_summaries(client, starters):
+    """Previous approach: one element-summary request per starter (fetched concurrently)."""
+    async_client = AsyncFPLClient(client)
+
+    async def fetch():
+        ids = [p.id for p in starters]
+        return dict(zip(ids, await asyncio.gather(*(async_client.get_player_summary(i) for i in ids))))
+
+    summaries = run_sync(fetch())
+    return {p.id: [(f['event'], f['is_home'], f['difficulty'])
+                      for f in summaries[p.id]['fixtures'][:NUM_FIXTURES]] for p in starters}
+
+
+def via_calendar(client, starters):
+    calendar = client.get_fixture_calendar()
+    return {p.id: [(f.event, f.is_home, f.difficulty)
+                      for f in calendar.upcoming(p.team, NUM_FIXTURES)] for p in starters}
+
+
+def measure(stub, client, func, starters):
+    before, bytes_before = sum(stub.request_counts.values()), stub.bytes_sent
+    start = time.perf_counter()
+    result = func(client, starters)
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(stub.request_counts.values()) - before, stub.bytes_sent - bytes_before, result
+
+
+with StubFPLServer(latency=RTT) as stub:
+    print("=" * 80)
+    print("FIXTURE CALENDAR BENCHMARK")
+    print("=" * 80)
+    print(f"Starting XI fixture analysis, next {NUM_FIXTURES} fixtures | Simulated RTT: {RTT * 1000:.0f}ms")
+    print()
+
+    results = {}
+    for label, func in [("element-summary per player", via_summaries),
+                        ("FixtureCalendar (bulk /fixtures/)", via_calendar)]:
+        client = FPLClient(stub.base_url, cache=MemoryCache())
+        starters = squad(client)
+        cold_time, cold_requests, cold_bytes, results[label] = measure(stub, client, func, starters)
+        warm_time, warm_requests, _, _ = measure(stub, client, func, starters)
+        print(f"{label:34s} cold {cold_time * 1000:6.1f}ms, {cold_requests:2d} requests, "
+              f"{cold_bytes / 1e3:6.1f} KB | warm {warm_time * 1000:5.2f}ms, {warm_requests} requests")
+
+    same = len(set(map(repr, results.values()))) == 1
+    print()
+    print(f"Same fixtures (event, venue, FDR) for every starter: {'yes' if same else 'NO'}")
@@ -0,0 +1,84 @@
+"""Benchmark whole-season captaincy analysis: serial scans vs the shared LiveGameweekStore."""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'agentcore', 'fpl-agentcore', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fpl_stub import StubFPLServer, generate_dataset
+from fpl_client import FPLClient
+from async_fpl_client import AsyncFPLClient, run_sync
+from http_cache import MemoryCache
+from live_store import LiveGameweekStore
+
+RTT = 0.050
+CURRENT_GW = 38
+MANAGERS = [1234567, 7654321]
+
+
+def serial_scan(client, team_id, gameweeks):
+    """Previous approach: picks and live data one gameweek at a time, linear scan per captain."""
+    captains = {}
+    for gw in gameweeks:
+        picks = client.get_team_picks(team_id, gw)
+        gw_live = client.get_live_gameweek(gw)
+        for pick in picks['picks']:
+            if pick.is_captain:
+                for elem in gw_live['elements']:
+                    if elem['id'] == pick.element:
+                        captains[gw] = elem['stats']['total_points'] * pick.multiplier
+                        break
+    return captains
+
+
+def make_store_scan(async_client, store):
+    def store_scan(client, team_id, gameweeks):
+        all_picks = run_sync(async_client.get_team_picks_many(team_id, gameweeks))
+        all_live = store.get_many(gameweeks)
+        captains = {}
+        for gw in gameweeks:
+            for pick in all_picks[gw]['picks']:
+                if pick.is_captain:
+                    captains[gw] = all_live[gw].points_for(pick.element) * pick.multiplier
+        return captains
+    return store_scan
+
+
+def run(label, stub, client, scan, team_id, gameweeks):
+    before = sum(stub.request_counts.values())
+    start = time.perf_counter()
+    result = scan(client, team_id, gameweeks)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:36s} {elapsed * 1000:8.1f}ms | {sum(stub.request_counts.values()) - before:3d} requests")
+    return result
+
+
+with StubFPLServer(latency=RTT, dataset=generate_dataset(current_gw=CURRENT_GW)) as stub:
+    print("=" * 80)
+    print("LIVE GAMEWEEK STORE BENCHMARK")
+    print("=" * 80)
+    gameweeks = list(range(1, CURRENT_GW))
+    print(f"Captaincy analysis over {len(gameweeks)} finished gameweeks | Simulated RTT: {RTT * 1000:.0f}ms")
+    print()
+
+    results = {}
+    for label in ("Serial, linear scan", "LiveGameweekStore"):
+        client = FPLClient(stub.base_url, cache=MemoryCache())
+        client.get_bootstrap_index()
+        if label == "Serial, linear scan":
+            scan = serial_scan
+        else:
+            async_client = AsyncFPLClient(client)
+            scan = make_store_scan(async_client, LiveGameweekStore(client, async_client))
+        print(label)
+        results[label] = [
+            run(f"manager {MANAGERS[0]}, cold", stub, client, scan, MANAGERS[0], gameweeks),
+            run(f"manager {MANAGERS[1]} (live cached)", stub, client, scan, MANAGERS[1], gameweeks),
+            run(f"manager {MANAGERS[0]} again (all cached)", stub, client, scan, MANAGERS[0], gameweeks),
+        ]
+        print()
+
+    same = results["Serial, linear scan"] == results["LiveGameweekStore"]
+    print(f"Same captain points for every gameweek: {'yes' if same else 'NO'}")
@@ -0,0 +1,468 @@
+"""Local stub of the FPL API for benchmarks.
+
+Generates a deterministic, realistically shaped season (20 clubs, ~700 players,
+38 gameweeks, 380 fixtures) and serves it over HTTP with a configurable
+artificial round-trip latency, so client-side optimizations can be measured
+without touching the real FPL servers.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+TEAM_NAMES = [
+    ("Arsenal", "ARS"), ("Aston Villa", "AVL"), ("Bournemouth", "BOU"),
+    ("Brentford", "BRE"), ("Brighton", "BHA"), ("Burnley", "BUR"),
+    ("Chelsea", "CHE"), ("Crystal Palace", "CRY"), ("Everton", "EVE"),
+    ("Fulham", "FUL"), ("Leeds", "LEE"), ("Liverpool", "LIV"),
+    ("Man City", "MCI"), ("Man Utd", "MUN"), ("Newcastle", "NEW"),
+    ("Nott'm Forest", "NFO"), ("Spurs", "TOT"), ("Sunderland", "SUN"),
+    ("West Ham", "WHU"), ("Wolves", "WOL"),
+]
+
+# A few well-known names so search and routing benchmarks have realistic targets.
+NOTABLE_PLAYERS = [
+    ("Erling", "Haaland", "Haaland", 13, 4, 145),
+    ("Mohamed", "Salah", "M.Salah", 12, 3, 145),
+    ("Martin", "Ødegaard", "Ødegaard", 1, 3, 85),
+    ("Bukayo", "Saka", "Saka", 1, 3, 100),
+    ("Cole", "Palmer", "Palmer", 7, 3, 105),
+    ("Bruno Borges", "Fernandes", "B.Fernandes", 14, 3, 90),
+    ("Alexander", "Isak", "Isak", 12, 4, 105),
+    ("Jordan", "Pickford", "Pickford", 9, 1, 55),
+    ("Virgil", "van Dijk", "Virgil", 12, 2, 60),
+    ("Dominik", "Szoboszlai", "Szoboszlai", 12, 3, 65),
+    ("Jarrod", "Bowen", "Bowen", 19, 3, 75),
+    ("Joško", "Gvardiol", "Gvardiol", 13, 2, 60),
+    ("Son", "Heung-min", "Son", 17, 3, 95),
+    ("James", "Maddison", "Maddison", 17, 3, 75),
+    ("Ollie", "Watkins", "Watkins", 2, 4, 90),
+    ("Bryan", "Mbeumo", "Mbeumo", 14, 3, 80),
+]
+
+FIRST_NAMES = [
+    "James", "Luke", "Jack", "Harry", "Ben", "Tom", "Daniel", "Sam", "Joe",
+    "Lucas", "Mateo", "João", "Rúben", "Andrés", "Ibrahim", "Kai", "Noah",
+    "Álvaro", "Pedro", "Emile", "Yves", "Kaoru", "Nikola", "Łukasz", "Søren",
+]
+LAST_NAMES = [
+    "Smith", "Jones", "Taylor", "Brown", "Wilson", "Evans", "Thomas",
+    "Roberts", "Walker", "Wright", "Müller", "García", "Núñez", "Silva",
+    "Gonçalves", "Doucouré", "Kovačić", "Højlund", "Andersen", "Mitoma",
+    "Sørensen", "Diallo", "Okafor", "Bernard", "Martínez", "Dubois",
+]
+
+# Extra numeric fields the real API sends but the tools never read.
+FILLER_FIELDS = [
+    "chance_of_playing_this_round", "code", "cost_change_event",
+    "cost_change_event_fall", "cost_change_start_fall", "dreamteam_count",
+    "ep_next", "ep_this", "event_points", "in_dreamteam", "removed",
+    "special", "squad_number", "transfers_in", "transfers_in_event",
+    "transfers_out", "transfers_out_event", "value_form", "value_season",
+    "region", "team_code", "own_goals", "penalties_saved", "penalties_missed",
+    "yellow_cards", "red_cards", "saves", "bps", "starts", "expected_goals",
+    "expected_assists", "expected_goal_involvements", "expected_goals_conceded",
+    "influence_rank", "influence_rank_type", "creativity_rank",
+    "creativity_rank_type", "threat_rank", "threat_rank_type", "ict_index_rank",
+    "ict_index_rank_type", "corners_and_indirect_freekicks_order",
+    "direct_freekicks_order", "penalties_order", "expected_goals_per_90",
+    "saves_per_90", "expected_assists_per_90",
+    "expected_goal_involvements_per_90", "expected_goals_conceded_per_90",
+    "goals_conceded_per_90", "now_cost_rank", "now_cost_rank_type",
+    "form_rank", "form_rank_type", "points_per_game_rank",
+    "points_per_game_rank_type", "selected_rank", "selected_rank_type",
+    "starts_per_90", "clean_sheets_per_90", "goals_conceded",
+    "recoveries", "tackles", "clearances_blocks_interceptions",
+    "defensive_contribution", "defensive_contribution_per_90",
+]
+
+SQUAD_SHAPE = {1: 2, 2: 5, 3: 5, 4: 3}
+
+
+def _fmt(value):
+    return f"{value:.1f}"
+
+
+def generate_dataset(seed=7, players_per_team=35, current_gw=10, now=None):
+    """Build a full synthetic season keyed by endpoint concept."""
+    rng = random.Random(seed)
+    now = now or datetime.now(timezone.utc)
+
+    teams = []
+    for i, (name, short) in enumerate(TEAM_NAMES, 1):
+        teams.append({
+            "id": i, "code": i * 3, "name": name, "short_name": short,
+            "strength": rng.randint(2, 5),
+            "strength_overall_home": rng.randint(1000, 1350),
+            "strength_overall_away": rng.randint(1000, 1350),
+            "strength_attack_home": rng.randint(1000, 1350),
+            "strength_attack_away": rng.randint(1000, 1350),
+            "strength_defence_home": rng.randint(1000, 1350),
+            "strength_defence_away": rng.randint(1000, 1350),
+            "played": 0, "win": 0, "draw": 0, "loss": 0, "points": 0,
+            "position": 0, "unavailable": False, "pulse_id": i,
+        })
+
+    # Gameweek calendar: the current week kicked off a couple of days ago.
+    first_deadline = now - timedelta(days=7 * (current_gw - 1) + 2)
+    events = []
+    for gw in range(1, 39):
+        deadline = first_deadline + timedelta(days=7 * (gw - 1))
+        events.append({
+            "id": gw, "name": f"Gameweek {gw}",
+            "deadline_time": deadline.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "finished": gw < current_gw, "data_checked": gw < current_gw,
+            "is_previous": gw == current_gw - 1, "is_current": gw == current_gw,
+            "is_next": gw == current_gw + 1,
+            "average_entry_score": rng.randint(40, 60) if gw < current_gw else 0,
+            "highest_score": rng.randint(90, 140) if gw < current_gw else None,
+        })
+
+    # Double round robin (circle method), then a blank and a double gameweek.
+    ids = [t["id"] for t in teams]
+    rounds = []
+    rotation = ids[:]
+    for _ in range(len(ids) - 1):
+        pairs = [(rotation[i], rotation[-1 - i]) for i in range(len(ids) // 2)]
+        rounds.append(pairs)
+        rotation = [rotation[0]] + [rotation[-1]] + rotation[1:-1]
+    rounds += [[(a, h) for h, a in pairs] for pairs in rounds]
+
+    strength = {t["id"]: t["strength"] for t in teams}
+    fixtures = []
+    fid = 0
+    for gw, pairs in enumerate(rounds, 1):
+        for home, away in pairs:
+            fid += 1
+            event = gw
+            # Postpone one tie from GW current+2 into GW current+4.
+            if gw == current_gw + 2 and fid % 10 == 1:
+                event = current_gw + 4
+            kickoff = first_deadline + timedelta(days=7 * (event - 1), hours=2 + fid % 6)
+            finished = event < current_gw
+            fixtures.append({
+                "id": fid, "code": 1000 + fid, "event": event,
+                "team_h": home, "team_a": away,
+                "team_h_difficulty": min(5, max(2, strength[away])),
+                "team_a_difficulty": min(5, max(2, strength[home] + 1)),
+                "kickoff_time": kickoff.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "finished": finished, "started": finished,
+                "team_h_score": rng.randint(0, 4) if finished else None,
+                "team_a_score": rng.randint(0, 3) if finished else None,
+                "minutes": 90 if finished else 0,
+                "provisional_start_time": False, "stats": [],
+            })
+    fixtures.sort(key=lambda f: (f["event"], f["kickoff_time"], f["id"]))
+
+    elements = []
+    pid = 0
+    notable = {}
+    for first, second, web, team, etype, cost in NOTABLE_PLAYERS:
+        notable.setdefault(team, []).append((first, second, web, etype, cost))
+    for team in teams:
+        roster = list(notable.get(team["id"], []))
+        while len(roster) < players_per_team:
+            etype = [1, 2, 2, 2, 3, 3, 3, 4][len(roster) % 8]
+            first = rng.choice(FIRST_NAMES)
+            second = rng.choice(LAST_NAMES)
+            base = {1: 40, 2: 40, 3: 45, 4: 45}[etype]
+            roster.append((first, second, second, etype, base + rng.choice([0, 0, 5, 5, 10, 15, 20, 30])))
+        for first, second, web, etype, cost in roster:
+            pid += 1
+            minutes = rng.randint(0, 90 * (current_gw - 1))
+            form = rng.uniform(0, 9) if minutes else 0.0
+            total = int(minutes / 90 * rng.uniform(1.5, 6.5))
+            ownership = rng.choice([0.1, 0.4, 0.8, 1.5, 3.0, 6.0, 12.0, 25.0]) * rng.uniform(0.5, 1.5)
+            if cost >= 100:
+                ownership = rng.uniform(30, 70)
+                form = rng.uniform(5, 10)
+                total = rng.randint(60, 110)
+            influence, creativity, threat = (rng.uniform(0, 400) for _ in range(3))
+            status = rng.choices(["a", "d", "i", "u", "s"], [90, 4, 4, 1, 1])[0]
+            player = {
+                "id": pid, "first_name": first, "second_name": second,
+                "web_name": web, "team": team["id"], "element_type": etype,
+                "now_cost": cost, "cost_change_start": rng.choice([-3, -2, -1, 0, 0, 0, 1, 2, 3, 5, 7]),
+                "form": _fmt(form), "points_per_game": _fmt(total / max(1, current_gw - 1)),
+                "total_points": total, "minutes": minutes,
+                "goals_scored": rng.randint(0, 3 if etype < 3 else 12),
+                "assists": rng.randint(0, 8), "clean_sheets": rng.randint(0, 5),
+                "bonus": rng.randint(0, 15), "selected_by_percent": _fmt(ownership),
+                "influence": _fmt(influence), "creativity": _fmt(creativity),
+                "threat": _fmt(threat), "ict_index": _fmt((influence + creativity + threat) / 10),
+                "status": status, "news": "" if status == "a" else "Knock - 75% chance of playing",
+                "news_added": None, "chance_of_playing_next_round": None if status == "a" else 75,
+                "photo": f"{pid}.jpg",
+            }
+            for field in FILLER_FIELDS:
+                player[field] = rng.randint(0, 500)
+            elements.append(player)
+
+    return {
+        "current_gw": current_gw,
+        "bootstrap": {
+            "events": events, "teams": teams, "elements": elements,
+            "element_types": [
+                {"id": 1, "singular_name_short": "GKP", "squad_select": 2},
+                {"id": 2, "singular_name_short": "DEF", "squad_select": 5},
+                {"id": 3, "singular_name_short": "MID", "squad_select": 5},
+                {"id": 4, "singular_name_short": "FWD", "squad_select": 3},
+            ],
+            "element_stats": [{"name": "minutes", "label": "Minutes played"}],
+            "total_players": 10_000_000,
+        },
+        "fixtures": fixtures,
+        "seed": seed,
+    }
+
+
+def _player_summary(dataset, player_id):
+    boot = dataset["bootstrap"]
+    player = boot["elements"][player_id - 1]
+    upcoming = []
+    for f in dataset["fixtures"]:
+        if f["finished"] or player["team"] not in (f["team_h"], f["team_a"]):
+            continue
+        is_home = f["team_h"] == player["team"]
+        upcoming.append({
+            "id": f["id"], "event": f["event"], "team_h": f["team_h"],
+            "team_a": f["team_a"], "is_home": is_home,
+            "difficulty": f["team_h_difficulty"] if is_home else f["team_a_difficulty"],
+            "kickoff_time": f["kickoff_time"], "finished": False,
+        })
+    rng = random.Random(player_id)
+    history = [
+        {"element": player_id, "round": gw, "total_points": rng.randint(0, 12),
+         "minutes": rng.choice([0, 45, 90])}
+        for gw in range(1, dataset["current_gw"])
+    ]
+    return {"fixtures": upcoming, "history": history, "history_past": []}
+
+
+def _squad(dataset, team_id, event):
+    """Deterministic valid 15-man squad (2/5/5/3, max three per club)."""
+    rng = random.Random(team_id)
+    elements = dataset["bootstrap"]["elements"]
+    need = dict(SQUAD_SHAPE)
+    per_club = Counter()
+    chosen = []
+    for player in rng.sample(elements, len(elements)):
+        etype = player["element_type"]
+        if need[etype] and per_club[player["team"]] < 3 and player["now_cost"] < 110:
+            chosen.append(player)
+            need[etype] -= 1
+            per_club[player["team"]] += 1
+        if not any(need.values()):
+            break
+    chosen.sort(key=lambda p: p["element_type"])
+    # Starting XI: GK, 4 DEF, 4 MID, 2 FWD; then bench.
+    order = [0, 2, 3, 4, 5, 7, 8, 9, 10, 12, 13, 1, 6, 11, 14]
+    captain = 7 + (team_id + event) % 4
+    picks = []
+    for position, idx in enumerate(order, 1):
+        picks.append({
+            "element": chosen[idx]["id"], "position": position,
+            "multiplier": 2 if position == captain else (1 if position <= 11 else 0),
+            "is_captain": position == captain, "is_vice_captain": position == captain + 1,
+        })
+    spent = sum(p["now_cost"] for p in chosen)
+    return picks, spent
+
+
+def _history(dataset, team_id):
+    rng = random.Random(team_id * 31)
+    current = []
+    for gw in range(1, dataset["current_gw"] + 1):
+        transfers = rng.choice([0, 0, 1, 1, 2])
+        current.append({
+            "event": gw, "points": rng.randint(30, 90),
+            "event_transfers": transfers if gw > 1 else 0,
+            "event_transfers_cost": 4 if transfers == 2 and gw > 1 else 0,
+            "bank": rng.randint(0, 30), "value": 1000 + gw * 2,
+        })
+    return {"current": current, "past": [], "chips": [{"name": "wildcard", "event": 4}]}
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # The default listen backlog (5) makes bursts of concurrent clients wait
+    # on SYN retransmits (~1s), which would swamp the measurements.
+    request_queue_size = 128
+
+
+class StubFPLServer:
+    """Threaded HTTP server answering FPL API routes from a synthetic dataset."""
+
+    def __init__(self, latency=0.05, dataset=None, port=0, error_rate=0.0, rate_limit=None, seed=0):
+        self.latency = latency
+        self.dataset = dataset or generate_dataset()
+        self.request_counts = Counter()
+        # Failure injection: random 5xx, a requests/second cap answered with
+        # 429, and a full outage (every request 503) toggled at runtime.
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.outage = False
+        self.status_counts = Counter()
+        self._rng = random.Random(seed)
+        self._window = (0, 0)  # (second, requests seen in it)
+        self.bytes_sent = 0
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _injected_failure(self):
+        """Pick an injected failure status for this request, or None (caller holds _lock)."""
+        status = None
+        second = int(time.monotonic())
+        count = self._window[1] + 1 if self._window[0] == second else 1
+        self._window = (second, count)
+        if self.outage:
+            status = 503
+        elif self.rate_limit and count > self.rate_limit:
+            status = 429
+        elif self.error_rate and self._rng.random() < self.error_rate:
+            status = self._rng.choice([500, 502, 503])
+        self.status_counts[status or "ok"] += 1
+        return status
+
+    def route(self, path, query):
+        """Return the JSON-serializable payload for an API path, or None."""
+        ds = self.dataset
+        if path == "/bootstrap-static/":
+            return ds["bootstrap"]
+        if path == "/fixtures/":
+            if "event" in query:
+                event = int(query["event"][0])
+                return [f for f in ds["fixtures"] if f["event"] == event]
+            return ds["fixtures"]
+        m = re.fullmatch(r"/element-summary/(\d+)/", path)
+        if m:
+            pid = int(m.group(1))
+            if 1 <= pid <= len(ds["bootstrap"]["elements"]):
+                return _player_summary(ds, pid)
+            return None
+        m = re.fullmatch(r"/event/(\d+)/live/", path)
+        if m:
+            rng = random.Random(int(m.group(1)))
+            return {"elements": [
+                {"id": p["id"], "stats": {"total_points": rng.choice([0, 1, 2, 2, 2, 3, 6, 9, 13]),
+                                          "minutes": rng.choice([0, 90])}}
+                for p in ds["bootstrap"]["elements"]
+            ]}
+        m = re.fullmatch(r"/entry/(\d+)/event/(\d+)/picks/", path)
+        if m:
+            team_id, event = int(m.group(1)), int(m.group(2))
+            picks, spent = _squad(ds, team_id, event)
+            return {
+                "active_chip": None, "picks": picks,
+                "entry_history": {"event": event, "event_transfers": 1,
+                                  "event_transfers_cost": 0, "bank": max(0, min(50, 1000 - spent))},
+            }
+        m = re.fullmatch(r"/entry/(\d+)/history/", path)
+        if m:
+            return _history(ds, int(m.group(1)))
+        m = re.fullmatch(r"/entry/(\d+)/transfers/", path)
+        if m:
+            elements = ds["bootstrap"]["elements"]
+            rng = random.Random(int(m.group(1)))
+            return [
+                {"event": gw, "element_in": rng.choice(elements)["id"], "element_in_cost": 60,
+                 "element_out": rng.choice(elements)["id"], "element_out_cost": 55}
+                for gw in range(2, ds["current_gw"] + 1) for _ in range(rng.choice([0, 1, 2]))
+            ]
+        m = re.fullmatch(r"/entry/(\d+)/", path)
+        if m:
+            team_id = int(m.group(1))
+            return {
+                "id": team_id, "name": f"Stub XI {team_id}",
+                "player_first_name": "Stub", "player_last_name": "Manager",
+                "summary_overall_points": 512, "summary_overall_rank": 123456,
+                "summary_event_points": 61, "summary_event_rank": 654321,
+                "last_deadline_value": 1004, "last_deadline_bank": 12,
+                "last_deadline_total_transfers": 9,
+            }
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path[len("/api"):] if parsed.path.startswith("/api") else parsed.path
+                with server._lock:
+                    server.request_counts[path] += 1
+                    failure = server._injected_failure()
+                if server.latency:
+                    time.sleep(server.latency)
+                if failure:
+                    self.send_response(failure)
+                    if failure == 429:
+                        self.send_header("Retry-After", "1")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                payload = server.route(path, parse_qs(parsed.query))
+                if payload is None:
+                    self.send_error(404)
+                    return
+                body = json.dumps(payload).encode()
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", server.last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    with StubFPLServer(latency=0.0) as stub:
+        print(f"Stub FPL API listening on {stub.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
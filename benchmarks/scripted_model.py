@@ -0,0 +1,80 @@
+"""Scripted stand-in for the LLM, to drive the real Strands agent loop in benchmarks."""
+
+import asyncio
+import json
+
+from strands.models.model import Model
+
+from tool_output import estimate_tokens
+
+
+def step(tool, /, **args):
+    """One model round trip calling a single tool."""
+    return [(tool, args)]
+
+
+class ScriptedModel(Model):
+    """
+    Stands in for the LLM with a fixed plan per turn: each model call makes
+    the next step's tool calls (or answers, once the plan is done), taking
+    latency plus per_token seconds per input token. The Strands agent loop,
+    tool execution and conversation history are the real ones.
+
+    The answer quotes the first line of each tool result of the turn, so a
+    caller can check which data the turn saw, then streams answer_words
+    more words, one every word_delay seconds.
+    """
+
+    def __init__(self, plan, latency=0.400, per_token=20e-6, answer_words=0, word_delay=0.0):
+        self.plan = plan
+        self.latency = latency
+        self.per_token = per_token
+        self.answer_words = answer_words
+        self.word_delay = word_delay
+        self.calls = 0
+        self.input_tokens = 0
+
+    def update_config(self, **model_config):
+        pass
+
+    def get_config(self):
+        return {}
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError
+        yield
+
+    async def stream(self, messages, tool_specs=None, system_prompt=None, **kwargs):
+        # Tool rounds so far this turn: messages since the user's prompt
+        turn = len(messages)
+        while turn and not (messages[turn - 1]['role'] == 'user'
+                            and any('text' in block for block in messages[turn - 1]['content'])):
+            turn -= 1
+        step = (len(messages) - turn) // 2
+
+        self.calls += 1
+        tokens = (estimate_tokens(json.dumps(messages, ensure_ascii=False, default=str))
+                  + estimate_tokens(system_prompt or '')
+                  + estimate_tokens(json.dumps(tool_specs or [], default=str)))
+        self.input_tokens += tokens
+        await asyncio.sleep(self.latency + tokens * self.per_token)
+
+        yield {"messageStart": {"role": "assistant"}}
+        if step < len(self.plan):
+            for i, (name, args) in enumerate(self.plan[step]):
+                yield {"contentBlockStart": {"start": {"toolUse": {"toolUseId": f"call_{self.calls}_{i}",
+                                                                   "name": name}}}}
+                yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(args)}}}}
+                yield {"contentBlockStop": {}}
+            yield {"messageStop": {"stopReason": "tool_use"}}
+        else:
+            seen = [block['toolResult']['content'][0].get('text', '').split('\n', 1)[0]
+                    for message in messages[turn:] for block in message['content'] if 'toolResult' in block]
+            yield {"contentBlockDelta": {"delta": {"text": ' | '.join(seen) or "Here is my advice."}}}
+            for i in range(self.answer_words):
+                await asyncio.sleep(self.word_delay)
+                yield {"contentBlockDelta": {"delta": {"text": f" word{i}"}}}
+            yield {"contentBlockStop": {}}
+            yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {"metadata": {"usage": {"inputTokens": tokens, "outputTokens": 40, "totalTokens": tokens + 40},
+                            "metrics": {"latencyMs": 0}}}